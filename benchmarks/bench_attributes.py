@@ -0,0 +1,100 @@
+"""Measure state reads of station measure entities with and without memoization.
+
+Builds 100 measure entities on one last-10-minutes coordinator and times a state
+read (``available``, ``native_value`` and ``extra_state_attributes``, as Home
+Assistant does when it writes a state) across all of them, in three cases:
+
+* ``uncached``: the coordinator has no ``data_version``, so every read rebuilds
+  the attributes and looks the value up again.
+* ``first read``: the data version advances before each round, as after a
+  refresh, so every read pays for building the memoized values.
+* ``repeated read``: the data version is unchanged, as for any later read
+  between two refreshes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_attributes
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaStationLast10MinCoordinator,
+)
+from custom_components.meteogalicia.sensor import _station_measure_entities
+
+ENTITIES = 100
+ROUNDS = 2000
+
+
+def _coordinator():
+    """Return a station coordinator with the state a refresh leaves behind."""
+    coordinator = object.__new__(MeteoGaliciaStationLast10MinCoordinator)
+    observed_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    coordinator.data = {
+        "listUltimos10min": [
+            {
+                "estacion": "Benchmark",
+                "listaMedidas": [
+                    {
+                        "codigoParametro": f"CODE_{index:03d}",
+                        "nomeParametro": f"Measure {index}",
+                        "unidade": "ºC",
+                        "valor": 20.5,
+                        "lnCodigoValidacion": 1,
+                    }
+                    for index in range(ENTITIES)
+                ],
+            }
+        ]
+    }
+    coordinator._model = coordinator._model_source = None
+    coordinator.last_update_success = True
+    coordinator.last_api_connected_at = datetime.now(timezone.utc)
+    coordinator.last_api_latency_ms = 123.4
+    coordinator.scan_interval = coordinator.update_interval = timedelta(minutes=10)
+    coordinator.data_timestamp = observed_at.isoformat(timespec="seconds")
+    coordinator._data_timestamp_utc = observed_at
+    coordinator._data_max_age = None
+    coordinator.data_version = 0
+    return coordinator
+
+
+def _read(entities) -> None:
+    for entity in entities:
+        _available = entity.available
+        _value = entity.native_value
+        _attributes = entity.extra_state_attributes
+
+
+def _per_round(coordinator, entities, advance: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        if advance:
+            coordinator.data_version += 1
+        _read(entities)
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def main() -> None:
+    coordinator = _coordinator()
+    entities = _station_measure_entities("10124", coordinator, "last_10_min")
+    first = _per_round(coordinator, entities, advance=True)
+    repeated = _per_round(coordinator, entities, advance=False)
+    coordinator.data_version = None
+    uncached = _per_round(coordinator, entities, advance=False)
+
+    print(f"{len(entities)} entities, state reads per round")
+    for label, seconds in (
+        ("uncached", uncached),
+        ("first read", first),
+        ("repeated read", repeated),
+    ):
+        print(f"{label:>13}: {seconds * 1_000_000:8.1f} us per round")
+
+
+if __name__ == "__main__":
+    main()
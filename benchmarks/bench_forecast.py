@@ -0,0 +1,76 @@
+"""Measure the cost of serving forecasts with and without memoization.
+
+Builds a weather entity on a forecast coordinator with a seven-day forecast and
+times ``async_forecast_daily`` and ``async_forecast_twice_daily``, as called for
+every dashboard card and every ``weather.get_forecasts`` call, in two cases:
+
+* ``uncached``: the coordinator has no ``data_version``, so every call rebuilds
+  the forecast list.
+* ``cached``: the data version is unchanged, as for any call between two
+  refreshes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_forecast
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from custom_components.meteogalicia.model import parse_forecast
+from custom_components.meteogalicia.weather import MeteoGaliciaWeather
+
+DAYS = 7
+CALLS = 20000
+
+
+def _entity(data_version):
+    entity = object.__new__(MeteoGaliciaWeather)
+    entity.coordinator = SimpleNamespace(
+        model=parse_forecast(
+            {
+                "predConcello": {
+                    "listaPredDiaConcello": [
+                        {
+                            "dataPredicion": f"2026-08-{8 + index:02d}T00:00:00",
+                            "ceoDia": 103,
+                            "tMax": 24,
+                            "tMin": 15,
+                            "pchoiva": {"manha": 10, "tarde": 30, "noite": 20},
+                            "ceo": {"manha": 101, "tarde": 103, "noite": 201},
+                            "uvMax": 7,
+                        }
+                        for index in range(DAYS)
+                    ]
+                }
+            }
+        ),
+        data_version=data_version,
+    )
+    return entity
+
+
+async def _per_call(entity, forecast_type: str) -> float:
+    call = getattr(entity, f"async_forecast_{forecast_type}")
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        await call()
+    return (time.perf_counter() - started) / CALLS
+
+
+def main() -> None:
+    print(f"{DAYS}-day forecast, {CALLS} calls")
+    for forecast_type in ("daily", "twice_daily"):
+        for label, data_version in (("uncached", None), ("cached", 0)):
+            seconds = asyncio.run(_per_call(_entity(data_version), forecast_type))
+            print(
+                f"{forecast_type:>11} {label:>8}: "
+                f"{seconds * 1_000_000:6.2f} us per call"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measure the per-refresh cost of discovering new station measure codes.
+
+For stations with 10, 40 and 80 measures, compares one refresh of:
+
+* ``rescan``: a Python loop over every code of the reading records when it was
+  last seen and collects the codes never seen before.
+* ``tracker``: ``StationMeasureTracker.observe``, which compares the codes with
+  set operations and only does Python work for codes that appear or go missing.
+
+Both are timed with readings that carry the same codes, the usual case; a new
+code only adds the cost of building its entity.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_measure_discovery
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+from custom_components.meteogalicia.measures import StationMeasureTracker
+from custom_components.meteogalicia.model import parse_station_last10
+
+REFRESHES = 20000
+NOW = datetime(2026, 8, 8, tzinfo=timezone.utc)
+
+
+def _reading(measures: int):
+    return parse_station_last10(
+        {
+            "listUltimos10min": [
+                {
+                    "estacion": "Benchmark",
+                    "listaMedidas": [
+                        {
+                            "codigoParametro": f"CODE_{index:02d}",
+                            "valor": 20.5,
+                            "lnCodigoValidacion": 1,
+                        }
+                        for index in range(measures)
+                    ],
+                }
+            ]
+        }
+    )
+
+
+def _rescan(last_seen: dict, reading) -> list:
+    new = []
+    for code in reading.measures:
+        if code not in last_seen:
+            new.append(code)
+        last_seen[code] = NOW
+    return new
+
+
+def _per_refresh(observe, readings) -> float:
+    started = time.perf_counter()
+    for reading in readings:
+        observe(reading)
+    return (time.perf_counter() - started) / len(readings)
+
+
+def main() -> None:
+    print(f"{REFRESHES} refreshes with the same codes")
+    for measures in (10, 40, 80, 160):
+        base = _reading(measures)
+        # Distinct objects with the same codes, as after each refresh.
+        readings = [_reading(measures) for _ in range(100)] * (REFRESHES // 100)
+        last_seen = dict.fromkeys(base.measures, NOW)
+        rescan = _per_refresh(partial(_rescan, last_seen), readings)
+        tracker = StationMeasureTracker(timedelta(hours=24))
+        tracker.observe(base, NOW)
+        tracked = _per_refresh(partial(tracker.observe, now=NOW), readings)
+        print(
+            f"{measures:3d} measures: rescan {rescan * 1_000_000:5.2f} us | "
+            f"tracker {tracked * 1_000_000:5.2f} us per refresh"
+        )
+
+
+if __name__ == "__main__":
+    main()
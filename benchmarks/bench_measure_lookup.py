@@ -0,0 +1,102 @@
+"""Measure the cost of one coordinator update for station measure entities.
+
+Each measure entity reads ``native_value`` twice per state write, once directly
+and once through ``available``. For stations with 10, 40 and 80 parameters and
+one entity per parameter it compares:
+
+* ``before``: every read walks the payload and scans ``listaMedidas`` linearly
+  for the entity's code, then validates the measurement.
+* ``after``: every read is a single lookup in the ``valid_values`` index of
+  ``StationReading``, which maps each code to its validated value.
+
+The index is built while the payload is parsed, once per refresh and shared by
+every entity of the station, so that cost is reported separately.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_measure_lookup
+"""
+
+from __future__ import annotations
+
+import time
+
+from custom_components.meteogalicia.model import parse_station_last10
+
+UPDATES = 2000
+
+
+def _payload(measures: int) -> dict:
+    return {
+        "listUltimos10min": [
+            {
+                "estacion": "Benchmark",
+                "listaMedidas": [
+                    {
+                        "codigoParametro": f"CODE_{index:02d}_1.5m",
+                        "nomeParametro": f"Measure {index}",
+                        "unidade": "ºC",
+                        "valor": 20.5 + index,
+                        "lnCodigoValidacion": 1,
+                    }
+                    for index in range(measures)
+                ],
+            }
+        ]
+    }
+
+
+def _before_read(data: dict, code: str):
+    items = data.get("listUltimos10min")
+    station = items[0] if items else None
+    measures = station.get("listaMedidas") if isinstance(station, dict) else []
+    measure = next(
+        (item for item in measures if item.get("codigoParametro") == code), None
+    )
+    if not isinstance(measure, dict):
+        return None
+    value = measure.get("valor")
+    if measure.get("lnCodigoValidacion") not in (1, 5) or value == -9999:
+        return None
+    return value
+
+
+def _before_update(data: dict, codes: list[str]) -> None:
+    for code in codes:
+        _available = _before_read(data, code) is not None
+        _value = _before_read(data, code)
+
+
+def _after_update(values, codes: list[str]) -> None:
+    for code in codes:
+        _available = values.get(code) is not None
+        _value = values.get(code)
+
+
+def _per_update(update, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(UPDATES):
+        update(*args)
+    return (time.perf_counter() - started) / UPDATES
+
+
+def main() -> None:
+    for measures in (10, 40, 80):
+        data = _payload(measures)
+        codes = [
+            item["codigoParametro"]
+            for item in data["listUltimos10min"][0]["listaMedidas"]
+        ]
+        values = parse_station_last10(data).valid_values
+        before = _per_update(_before_update, data, codes)
+        after = _per_update(_after_update, values, codes)
+        parse = _per_update(parse_station_last10, data)
+        print(
+            f"{measures:3d} measures/entities: before {before * 1_000_000:7.1f} us | "
+            f"after {after * 1_000_000:5.1f} us ({before / after:5.1f}x) | "
+            f"parse and index {parse * 1_000_000:6.1f} us per update"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Compare reading station entities from the raw payload and from the typed model.
+
+Builds a last-10-minutes payload for a station with 40 measures and refreshes 100
+measure entities (spread over those 40 codes) from it, two ways:
+
+* ``raw``: every entity walks the nested payload and searches ``listaMedidas``
+  for its code, as the entities did before the typed model.
+* ``model``: the payload is parsed once into ``StationReading`` and every entity
+  does a single lookup in its ``measures`` mapping.
+
+For each path it reports the CPU time per refresh and the peak memory allocated
+while serving one refresh, plus the memory retained by the raw payload and by
+the model, which shares its interned strings with the payload. Run from the
+repository root::
+
+    python -m benchmarks.bench_model
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+
+from custom_components.meteogalicia.model import parse_station_last10
+
+MEASURES = 40
+ENTITIES = 100
+REFRESHES = 2000
+
+
+def _payload_json() -> str:
+    return json.dumps(
+        {
+            "listUltimos10min": [
+                {
+                    "estacion": "Benchmark",
+                    "idEstacion": 10124,
+                    "instanteLecturaUTC": "2026-08-08T16:10:00",
+                    "listaMedidas": [
+                        {
+                            "codigoParametro": f"CODE_{index:02d}_1.5m",
+                            "nomeParametro": f"Measure {index}",
+                            "unidade": "ºC",
+                            "valor": 20.5 + index,
+                            "lnCodigoValidacion": 1,
+                        }
+                        for index in range(MEASURES)
+                    ],
+                }
+            ]
+        }
+    )
+
+
+CODES = [f"CODE_{index % MEASURES:02d}_1.5m" for index in range(ENTITIES)]
+
+
+def _valid(value, validation):
+    return None if validation not in (1, 5) or value == -9999 else value
+
+
+def _raw_refresh(data: dict) -> list:
+    values = []
+    for code in CODES:
+        items = data.get("listUltimos10min")
+        station = items[0] if items else None
+        measures = station.get("listaMedidas") if isinstance(station, dict) else []
+        measure = next(
+            (item for item in measures if item.get("codigoParametro") == code), None
+        )
+        values.append(
+            _valid(measure.get("valor"), measure.get("lnCodigoValidacion"))
+            if measure
+            else None
+        )
+    return values
+
+
+def _model_refresh(data: dict) -> list:
+    reading = parse_station_last10(data)
+    values = []
+    for code in CODES:
+        measure = reading.measures.get(code)
+        values.append(_valid(measure.value, measure.validation) if measure else None)
+    return values
+
+
+def _cpu_per_refresh(refresh, data: dict) -> float:
+    started = time.process_time()
+    for _ in range(REFRESHES):
+        refresh(data)
+    return (time.process_time() - started) / REFRESHES
+
+
+def _peak_per_refresh(refresh, data: dict) -> int:
+    tracemalloc.start()
+    refresh(data)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _retained(build) -> int:
+    tracemalloc.start()
+    kept = build()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main() -> None:
+    raw = _payload_json()
+    data = json.loads(raw)
+    assert _raw_refresh(data) == _model_refresh(data)
+
+    print(f"{MEASURES} measures, {ENTITIES} entities, {REFRESHES} refreshes")
+    payload_bytes = _retained(lambda: json.loads(raw))
+    model_bytes = _retained(lambda: parse_station_last10(data))
+    print(f"payload retained: {payload_bytes:7d} B")
+    print(f"  model retained: {model_bytes:7d} B (on top of the payload)")
+    for label, refresh in (("raw", _raw_refresh), ("model", _model_refresh)):
+        cpu = _cpu_per_refresh(refresh, data)
+        peak = _peak_per_refresh(refresh, data)
+        print(
+            f"{label:>5}: {cpu * 1_000_000:8.1f} us CPU per refresh | "
+            f"peak {peak:7d} B per refresh"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Count the recorder rows one hour of MeteoGalicia refreshes writes.
+
+Boots a test Home Assistant instance with the recorder on a temporary SQLite
+database, one municipality entry and one station entry with ``MEASURES``
+measures, then runs the refreshes of one hour at the default 10-minute scan
+interval. Every refresh returns new observations, as MeteoGalicia does.
+
+It reports the ``states`` and ``state_attributes`` rows written during that hour
+twice:
+
+* ``before``: the volatile diagnostic attributes (``api_latency_ms``,
+  ``connected_at``, ``data_age_s``, ``scan_interval_s`` and
+  ``observation_age_s``) are recorded, as they were before.
+* ``after``: they are excluded from the recorder.
+
+Requires the test requirements; run from the repository root::
+
+    python -m benchmarks.bench_recorder
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from homeassistant import loader
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.db_schema import StateAttributes, States
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.helpers import recorder as recorder_helper
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+    mock_storage,
+)
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.meteogalicia import const, sensor, weather
+from custom_components.meteogalicia import coordinator as coordinator_module
+
+MEASURES = 10
+REFRESHES_PER_HOUR = 6
+VOLATILE_CLASSES = (
+    sensor.MeteoGaliciaForecastTemperatureByDaySensor,
+    sensor.MeteoGaliciaForecastRainByDaySensor,
+    sensor.MeteoGaliciaTemperatureSensor,
+    sensor.MeteoGaliciaDailyDataByStationSensor,
+    sensor.MeteoGaliciaLast10MinDataByStationSensor,
+    sensor.MeteoGaliciaStationMeasureSensor,
+    weather.MeteoGaliciaWeather,
+)
+_refresh = {"count": 0}
+
+
+def _observed_at() -> datetime:
+    """Return a recent observation time that moves on with every refresh."""
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    return now - timedelta(minutes=5) + timedelta(seconds=_refresh["count"])
+
+
+def _measures() -> list[dict]:
+    return [
+        {
+            "codigoParametro": f"TA_{index:02d}_1.5m",
+            "nomeParametro": f"Measure {index}",
+            "unidade": "ºC",
+            "valor": 20.0 + _refresh["count"] / 10,
+            "lnCodigoValidacion": 1,
+        }
+        for index in range(MEASURES)
+    ]
+
+
+async def _forecast(_resource_id, _session):
+    return {
+        "predConcello": {
+            "nome": "Betanzos",
+            "listaPredDiaConcello": [
+                {
+                    "dataPredicion": "2026-08-08T00:00:00",
+                    "ceoDia": 101,
+                    "tMax": 28,
+                    "tMin": 17,
+                    "pchoiva": {"manha": 5, "tarde": 10, "noite": 20},
+                    "uvMax": 6,
+                }
+            ]
+            * 2,
+        }
+    }
+
+
+async def _observation(_resource_id, _session):
+    observed_at = _observed_at()
+    return {
+        "listaObservacionConcellos": [
+            {
+                "nomeConcello": "Betanzos",
+                "dataLocal": observed_at.isoformat(),
+                "dataUTC": observed_at.isoformat(),
+                "temperatura": 20.0 + _refresh["count"] / 10,
+                "sensacionTermica": 20.0,
+                "icoEstadoCeo": 101,
+            }
+        ]
+    }
+
+
+async def _daily(_resource_id, _session):
+    return {
+        "listDatosDiarios": [
+            {
+                "data": _observed_at().date().isoformat() + "T00:00:00",
+                "listaEstacions": [
+                    {"estacion": "Benchmark", "listaMedidas": _measures()}
+                ],
+            }
+        ]
+    }
+
+
+async def _last10(_resource_id, _session):
+    return {
+        "listUltimos10min": [
+            {
+                "estacion": "Benchmark",
+                "idEstacion": 10124,
+                "instanteLecturaUTC": _observed_at().isoformat(),
+                "listaMedidas": _measures(),
+            }
+        ]
+    }
+
+
+def _count_rows(hass) -> tuple[int, int]:
+    with session_scope(hass=hass, read_only=True) as session:
+        return (
+            session.query(States).count(),
+            session.query(StateAttributes).count(),
+        )
+
+
+async def _run(record_volatile: bool) -> tuple[int, int]:
+    """Return the states and state_attributes rows written in one hour."""
+    _refresh["count"] = 0
+    with ExitStack() as stack:
+        for name, fetch in (
+            ("_async_get_forecast_data_from_api", _forecast),
+            ("_async_get_observation_data_from_api", _observation),
+            ("_async_get_observation_dailydata_by_station_from_api", _daily),
+            ("_async_get_observation_last10mindata_by_station_from_api", _last10),
+        ):
+            stack.enter_context(patch.object(coordinator_module, name, fetch))
+        if record_volatile:
+            for cls in VOLATILE_CLASSES:
+                stack.enter_context(
+                    patch.object(
+                        cls,
+                        "_Entity__combined_unrecorded_attributes",
+                        cls._entity_component_unrecorded_attributes,
+                    )
+                )
+        stack.enter_context(mock_storage())
+        database = Path(stack.enter_context(TemporaryDirectory())) / "bench.db"
+        async with async_test_home_assistant() as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            recorder_helper.async_initialize_recorder(hass)
+            assert await async_setup_component(
+                hass,
+                "recorder",
+                {"recorder": {"db_url": f"sqlite:///{database}", "commit_interval": 0}},
+            )
+            for unique_id, data in (
+                ("concello_15009", {const.CONF_ID_CONCELLO: "15009"}),
+                ("estacion_10124", {const.CONF_ID_ESTACION: "10124"}),
+            ):
+                entry = MockConfigEntry(
+                    domain=const.DOMAIN, unique_id=unique_id, data=data
+                )
+                entry.add_to_hass(hass)
+                assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            await async_wait_recording_done(hass)
+            instance = get_instance(hass)
+            start = await instance.async_add_executor_job(_count_rows, hass)
+
+            coordinators = {
+                id(shared.coordinator): shared.coordinator
+                for shared in hass.data[const.DOMAIN][const.DATA_COORDINATORS].values()
+            }
+            for _ in range(REFRESHES_PER_HOUR):
+                _refresh["count"] += 1
+                for coordinator in coordinators.values():
+                    await coordinator.async_refresh()
+                await async_wait_recording_done(hass)
+
+            end = await instance.async_add_executor_job(_count_rows, hass)
+            await hass.async_stop(force=True)
+    return end[0] - start[0], end[1] - start[1]
+
+
+def main() -> None:
+    print(
+        f"1 municipality + 1 station with {MEASURES} measures, "
+        f"{REFRESHES_PER_HOUR} refreshes per hour"
+    )
+    for label, record_volatile in (("before", True), ("after", False)):
+        states, attributes = asyncio.run(_run(record_volatile))
+        print(
+            f"{label:>6}: {states:4d} states rows/h | "
+            f"{attributes:4d} state_attributes rows/h"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Measure startup time to the first entity states for a large installation.
+
+Boots a test Home Assistant instance with 100 station entries whose MeteoGalicia
+fetch takes ``FETCH_DELAY`` seconds, twice:
+
+* ``cold``: nothing stored, so every entry waits for its live first refresh.
+* ``warm``: the payload store holds each station's last good payload, so
+  coordinators are seeded from it and refresh in the background.
+
+For each run it reports the time until the first sensor has a state and until all
+of them do. Requires the test requirements; run from the repository root::
+
+    python -m benchmarks.bench_startup
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from homeassistant import loader
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+    mock_storage,
+)
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.store import STORAGE_KEY, STORAGE_VERSION
+
+ENTRIES = 100
+FETCH_DELAY = 5.0
+OBSERVED_AT = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+PAYLOAD = {
+    "listUltimos10min": [
+        {
+            "estacion": "Benchmark",
+            "instanteLecturaUTC": OBSERVED_AT.isoformat(),
+            "listaMedidas": [
+                {
+                    "codigoParametro": "TA_AVG_1.5m",
+                    "nomeParametro": "Temperatura",
+                    "unidade": "ºC",
+                    "valor": 20.5,
+                    "lnCodigoValidacion": 1,
+                }
+            ],
+        }
+    ]
+}
+
+
+def _station_ids() -> list[str]:
+    return [f"{10000 + index}" for index in range(ENTRIES)]
+
+
+def _stored_payloads() -> dict:
+    saved_at = datetime.now(timezone.utc).isoformat()
+    return {
+        STORAGE_KEY: {
+            "version": STORAGE_VERSION,
+            "minor_version": 1,
+            "key": STORAGE_KEY,
+            "data": {
+                "payloads": {
+                    f"station_last10min_{station}": {
+                        "data": PAYLOAD,
+                        "data_timestamp": f"{OBSERVED_AT.isoformat()}+00:00",
+                        "saved_at": saved_at,
+                    }
+                    for station in _station_ids()
+                }
+            },
+        }
+    }
+
+
+async def _slow_fetch(_resource_id, _http_pool):
+    await asyncio.sleep(FETCH_DELAY)
+    return PAYLOAD
+
+
+async def _boot(stored: dict) -> tuple[float, float]:
+    """Return the seconds to the first and to the last sensor state."""
+    with (
+        mock_storage(stored),
+        patch.object(
+            coordinator_module,
+            "_async_get_observation_last10mindata_by_station_from_api",
+            _slow_fetch,
+        ),
+    ):
+        async with async_test_home_assistant() as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            for station in _station_ids():
+                MockConfigEntry(
+                    domain=const.DOMAIN,
+                    unique_id=f"estacion_{station}_TA_AVG_1.5m",
+                    data={
+                        const.CONF_ID_ESTACION: station,
+                        const.CONF_ID_ESTACION_MEDIDA_LAST10MIN: "TA_AVG_1.5m",
+                    },
+                ).add_to_hass(hass)
+
+            started = time.perf_counter()
+            setup = hass.async_create_task(
+                async_setup_component(hass, const.DOMAIN, {})
+            )
+            first = None
+            while len(hass.states.async_all("sensor")) < ENTRIES:
+                if first is None and hass.states.async_all("sensor"):
+                    first = time.perf_counter() - started
+                await asyncio.sleep(0.001)
+            last = time.perf_counter() - started
+            await setup
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+    return first if first is not None else last, last
+
+
+def main() -> None:
+    print(f"{ENTRIES} station entries, {FETCH_DELAY:.0f} s MeteoGalicia latency")
+    for label, stored in (("cold", {}), ("warm", _stored_payloads())):
+        first, last = asyncio.run(_boot(stored))
+        print(
+            f"{label:>5}: first state {first * 1000:8.1f} ms | "
+            f"all states {last * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Compare the async and threaded MeteoGalicia transports for a large fleet.
+
+Starts a local HTTP server that answers like the forecast endpoint after a fixed
+delay and refreshes 200 coordinators at once through each transport:
+
+* ``async``: ``api.async_get_json`` on one shared aiohttp session (the default).
+* ``threaded``: ``meteogalicia_api.interface.MeteoGalicia`` on a ``requests``
+  session, run in a 64-worker executor like Home Assistant's default pool.
+
+For each path it reports the wall time, the peak number of live threads and the
+CPU time spent by the event-loop thread. Run from the repository root::
+
+    python -m benchmarks.bench_transport
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import requests
+from aiohttp import web
+
+from custom_components.meteogalicia import api
+
+COORDINATORS = 200
+EXECUTOR_WORKERS = 64
+SERVER_DELAY = 0.2
+PAYLOAD = {
+    "predConcello": {
+        "nome": "Betanzos",
+        "listaPredDiaConcello": [
+            {"dataPredicion": f"2026-08-0{day}T00:00:00", "tMax": 25, "tMin": 15}
+            for day in range(1, 5)
+        ],
+    }
+}
+
+
+def _start_server() -> tuple[str, threading.Event]:
+    """Serve the fake forecast endpoint from its own thread and loop."""
+    ready = threading.Event()
+    stop = threading.Event()
+    address: dict[str, str] = {}
+
+    async def forecast(_request):
+        await asyncio.sleep(SERVER_DELAY)
+        return web.json_response(PAYLOAD)
+
+    async def serve():
+        app = web.Application()
+        app.router.add_get("/forecast", forecast)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        address["url"] = f"http://127.0.0.1:{port}/forecast?idConc={{}}"
+        ready.set()
+        while not stop.is_set():
+            await asyncio.sleep(0.05)
+        await runner.cleanup()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    ready.wait()
+    return address["url"], stop
+
+
+class _ThreadSampler:
+    """Record the peak number of live threads while a benchmark runs."""
+
+    def __init__(self) -> None:
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            time.sleep(0.002)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_args):
+        self._stop.set()
+        self._thread.join()
+
+
+async def _run_async(url: str) -> None:
+    async with aiohttp.ClientSession() as session:
+
+        async def fetch(idc: str):
+            return api.forecast_payload(
+                await api.async_get_json(session, url.format(idc), 60)
+            )
+
+        results = await asyncio.gather(
+            *(fetch(f"{index:05d}") for index in range(COORDINATORS))
+        )
+    assert all(results)
+
+
+async def _run_threaded(url: str) -> None:
+    from meteogalicia_api.interface import MeteoGalicia
+
+    loop = asyncio.get_running_loop()
+    sessions = [requests.Session() for _ in range(COORDINATORS)]
+    with ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS) as executor:
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    MeteoGalicia(session=session, timeout=60)._do_get,
+                    url,
+                    f"{index:05d}",
+                )
+                for index, session in enumerate(sessions)
+            )
+        )
+    for session in sessions:
+        session.close()
+    assert all(results)
+
+
+def _measure(label: str, runner, url: str) -> None:
+    with _ThreadSampler() as sampler:
+        baseline = threading.active_count()
+        loop_cpu = time.thread_time()
+        started = time.perf_counter()
+        asyncio.run(runner(url))
+        wall = time.perf_counter() - started
+        loop_cpu = time.thread_time() - loop_cpu
+    print(
+        f"{label:>9}: wall {wall * 1000:8.1f} ms | "
+        f"extra threads {sampler.peak - baseline:4d} | "
+        f"loop thread CPU {loop_cpu * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    url, stop = _start_server()
+    print(
+        f"{COORDINATORS} coordinators, {SERVER_DELAY * 1000:.0f} ms server latency, "
+        f"{EXECUTOR_WORKERS} executor workers"
+    )
+    try:
+        _measure("async", _run_async, url)
+        _measure("threaded", _run_threaded, url)
+    finally:
+        stop.set()
+
+
+if __name__ == "__main__":
+    main()
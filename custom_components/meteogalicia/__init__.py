@@ -2,14 +2,56 @@
 
 from __future__ import annotations
 
+import logging
+import time
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
-from .util import safe_close_coordinators
+from .api import async_acquire_http_pool, async_release_http_pool
+from .const import (
+    CONF_ID_ESTACION,
+    CONF_ID_ESTACION_MEDIDA_DAILY,
+    CONF_ID_ESTACION_MEDIDA_LAST10MIN,
+    CONF_MAX_STALE_AGE,
+    CONF_SLIM_STATION_ATTRIBUTES,
+    DOMAIN,
+    LOG_PREFIX,
+)
+from .coordinator import (
+    async_hold_entry_coordinators,
+    async_release_entry_coordinators,
+    async_update_entry_coordinator_options,
+)
+from .sensor import async_apply_station_options
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor", "weather"]
 
+# Options applied to the running coordinators, without reloading the entry.
+_COORDINATOR_OPTIONS = frozenset({CONF_SCAN_INTERVAL, CONF_MAX_STALE_AGE})
+# Station options that only add, remove or re-render station entities.
+_STATION_ENTITY_OPTIONS = frozenset(
+    {
+        CONF_ID_ESTACION_MEDIDA_DAILY,
+        CONF_ID_ESTACION_MEDIDA_LAST10MIN,
+        CONF_SLIM_STATION_ATTRIBUTES,
+    }
+)
+
+
+def _merge_entry_data(entry: ConfigEntry) -> dict:
+    """Merge config entry data and options, allowing options to clear values."""
+    data = dict(entry.data)
+    for key, value in entry.options.items():
+        if value in ("", None):
+            data.pop(key, None)
+        else:
+            data[key] = value
+    return data
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the MeteoGalicia integration."""
@@ -18,16 +60,86 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MeteoGalicia from a config entry."""
+    started = time.monotonic()
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {"coordinators": []}
+    entry_data = hass.data[DOMAIN][entry.entry_id] = {
+        # Configuration the running platforms were set up with.
+        "config": _merge_entry_data(entry),
+        "coordinators": [],
+        # Keep the shared HTTP pool open for as long as any entry is loaded.
+        "http_pool": async_acquire_http_pool(hass),
+    }
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    try:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except BaseException:
+        # Home Assistant does not unload an entry whose setup failed (or was
+        # cancelled), so return the leases taken so far here.
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        try:
+            await async_release_entry_coordinators(
+                hass, entry.entry_id, entry_data["coordinators"]
+            )
+        finally:
+            await async_release_http_pool(hass, entry_data["http_pool"])
+        raise
+    # Wall-clock time of the platforms' setup, first refreshes included.
+    entry_data["setup_seconds"] = round(time.monotonic() - started, 3)
+    _LOGGER.debug(
+        "%s Entry '%s' set up in %.3f s",
+        LOG_PREFIX,
+        entry.title,
+        entry_data["setup_seconds"],
+    )
     return True
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload a config entry after its options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options, reloading the entry only when it cannot be avoided.
+
+    A new scan interval or stale bound retunes the running coordinators and a
+    new station measure selection adds or removes only the affected entities.
+    Any other change, such as a new resource id, reloads the entry; its
+    coordinators stay registered meanwhile, so ones still needed keep their data.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None or "config" not in entry_data:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    previous, config = entry_data["config"], _merge_entry_data(entry)
+    changed = {
+        key
+        for key in previous.keys() | config.keys()
+        if previous.get(key) != config.get(key)
+    }
+    if not changed:
+        return
+    live = _COORDINATOR_OPTIONS
+    if CONF_ID_ESTACION in config and "station_entities" in entry_data:
+        live = live | _STATION_ENTITY_OPTIONS
+    if changed - live:
+        _LOGGER.debug(
+            "%s Reloading '%s' after changing %s", LOG_PREFIX, entry.title, changed
+        )
+        holder_id = f"{entry.entry_id}_reload"
+        held = async_hold_entry_coordinators(hass, entry.entry_id, holder_id)
+        try:
+            await hass.config_entries.async_reload(entry.entry_id)
+        finally:
+            await async_release_entry_coordinators(hass, holder_id, held)
+        return
+
+    entry_data["config"] = config
+    if changed & _COORDINATOR_OPTIONS:
+        async_update_entry_coordinator_options(
+            hass,
+            entry.entry_id,
+            config.get(CONF_SCAN_INTERVAL),
+            config.get(CONF_MAX_STALE_AGE),
+        )
+    if changed & _STATION_ENTITY_OPTIONS:
+        await async_apply_station_options(hass, entry, config)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -37,5 +149,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
     data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     if data:
-        await safe_close_coordinators(data.get("coordinators", []))
+        await async_release_entry_coordinators(
+            hass, entry.entry_id, data.get("coordinators", [])
+        )
+        if (pool := data.get("http_pool")) is not None:
+            await async_release_http_pool(hass, pool)
     return True
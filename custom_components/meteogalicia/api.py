@@ -0,0 +1,611 @@
+"""Async HTTP transport for the MeteoGalicia web services."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any
+
+import aiohttp
+import requests
+from aiohttp import hdrs
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+from requests.adapters import HTTPAdapter
+
+from . import const
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling MeteoGalicia while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast for an endpoint family once MeteoGalicia keeps failing.
+
+    The breaker is shared by every coordinator of the family. After
+    ``failure_threshold`` consecutive failed requests it opens and rejects calls.
+    After ``reset_timeout`` seconds it lets a single probe through (half-open):
+    success closes it again, failure keeps it open for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, name: str, failure_threshold: int, reset_timeout: float
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.history: deque[dict[str, str]] = deque(maxlen=20)
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now."""
+        if self.state == self.CLOSED:
+            return True
+        if (
+            self.state == self.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            self._transition(self.HALF_OPEN, "probing recovery")
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a request MeteoGalicia answered."""
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED, "request succeeded")
+
+    def record_failure(self, err: BaseException) -> None:
+        """Count a failed request and open the circuit when needed."""
+        self.consecutive_failures += 1
+        probe_failed = self._probe_in_flight
+        self._probe_in_flight = False
+        if probe_failed or (
+            self.state == self.CLOSED
+            and self.consecutive_failures >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._transition(self.OPEN, f"{type(err).__name__}: {err}")
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot without counting a failure."""
+        self._probe_in_flight = False
+
+    def _transition(self, state: str, reason: str) -> None:
+        previous, self.state = self.state, state
+        self.history.append(
+            {
+                "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "from": previous,
+                "to": state,
+                "reason": reason,
+            }
+        )
+        if state == self.OPEN:
+            _LOGGER.warning(
+                "MeteoGalicia %s requests keep failing (%s); pausing them for %s s",
+                self.name,
+                reason,
+                self._reset_timeout,
+            )
+        elif state == self.CLOSED:
+            _LOGGER.info("MeteoGalicia %s requests recovered", self.name)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state and transition history for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "rejected": self.rejected,
+            "history": list(self.history),
+        }
+
+
+class AdaptiveTimeout:
+    """Per-attempt timeout derived from the recent latency of an endpoint family.
+
+    The timeout is the p99 of the last ``samples`` request durations times
+    ``factor``, kept between ``minimum`` and ``maximum`` seconds. Until
+    ``min_samples`` durations are known, ``maximum`` is used. A timed-out attempt
+    is recorded as a sample of its own duration, so a host that becomes slower
+    raises the timeout instead of failing every attempt.
+    """
+
+    def __init__(
+        self,
+        minimum: float,
+        maximum: float,
+        factor: float,
+        samples: int = 50,
+        min_samples: int = 5,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self._min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=samples)
+        self.timeouts = 0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        """Record how long an attempt took."""
+        self._samples.append(seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    @property
+    def p99(self) -> float | None:
+        """Return the 99th percentile of the recorded durations."""
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[math.ceil(0.99 * len(ordered)) - 1]
+
+    def timeout(self) -> float:
+        """Return the timeout the next attempt should use, in seconds."""
+        p99 = self.p99
+        if p99 is None:
+            return self.maximum
+        return min(self.maximum, max(self.minimum, p99 * self.factor))
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the latency figures exposed in diagnostics."""
+        p99 = self.p99
+        return {
+            "samples": len(self._samples),
+            "p99_ms": round(p99 * 1000.0, 2) if p99 is not None else None,
+            "timeout_seconds": round(self.timeout(), 2),
+            "timeouts": self.timeouts,
+        }
+
+
+class RequestLimiter:
+    """Bound the requests every MeteoGalicia user sends to the host.
+
+    At most ``max_in_flight`` requests run at once, and a token bucket holding
+    ``burst`` tokens and refilled at ``rate`` tokens per second spaces out their
+    start. Requests wait in FIFO order; the time spent waiting and the number of
+    waiting requests are kept for diagnostics.
+    """
+
+    def __init__(self, max_in_flight: int, rate: float, burst: int) -> None:
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self.max_in_flight = max_in_flight
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.last_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self._total_wait_ms = 0.0
+
+    async def _async_take_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._refilled_at) * self._rate
+            )
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot and a token, then hold the slot for one request."""
+        started = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await self._semaphore.acquire()
+            try:
+                await self._async_take_token()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.queue_depth -= 1
+        wait_ms = (time.monotonic() - started) * 1000.0
+        self.requests += 1
+        self.last_wait_ms = round(wait_ms, 2)
+        self.max_wait_ms = max(self.max_wait_ms, self.last_wait_ms)
+        self._total_wait_ms += wait_ms
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the queue instrumentation exposed in diagnostics."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "requests_per_second": self._rate,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "requests": self.requests,
+            "last_wait_ms": self.last_wait_ms,
+            "mean_wait_ms": (
+                round(self._total_wait_ms / self.requests, 2) if self.requests else 0.0
+            ),
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+
+# Longest wait for the executor threads when the pool is closed.
+_EXECUTOR_SHUTDOWN_TIMEOUT = 5
+
+
+class BoundedExecutor:
+    """Thread pool owned by the integration for its blocking work.
+
+    Runs the config-flow validation requests and closes the ``requests`` session
+    off Home Assistant's shared executor. Coordinators fetch through aiohttp and
+    never use it. At most ``max_workers`` threads run; the time jobs wait for a
+    thread and the time they run are kept for diagnostics.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=const.DOMAIN
+        )
+        self._lock = threading.Lock()
+        self._threads: weakref.WeakSet[threading.Thread] = weakref.WeakSet()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.running = 0
+        self.jobs = 0
+        self.last_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self._total_wait_ms = 0.0
+        self.last_run_ms = 0.0
+        self.max_run_ms = 0.0
+        self._total_run_ms = 0.0
+
+    def async_submit(self, func: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """Run ``func(*args)`` on the pool and return an awaitable future."""
+        submitted = time.monotonic()
+        # Set once the job leaves the queue, by its thread or by cancellation.
+        dequeued = [False]
+
+        def leave_queue() -> bool:
+            if dequeued[0]:
+                return False
+            dequeued[0] = True
+            self.queue_depth -= 1
+            return True
+
+        def run() -> Any:
+            started = time.monotonic()
+            with self._lock:
+                if not leave_queue():
+                    # Cancelled before a thread took it.
+                    return None
+                self._threads.add(threading.current_thread())
+                wait_ms = (started - submitted) * 1000.0
+                self.last_wait_ms = round(wait_ms, 2)
+                self.max_wait_ms = max(self.max_wait_ms, self.last_wait_ms)
+                self._total_wait_ms += wait_ms
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                run_ms = (time.monotonic() - started) * 1000.0
+                with self._lock:
+                    self.running -= 1
+                    self.jobs += 1
+                    self.last_run_ms = round(run_ms, 2)
+                    self.max_run_ms = max(self.max_run_ms, self.last_run_ms)
+                    self._total_run_ms += run_ms
+
+        def cancelled(future: asyncio.Future) -> None:
+            if future.cancelled():
+                with self._lock:
+                    leave_queue()
+
+        with self._lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        future = asyncio.get_running_loop().run_in_executor(self._executor, run)
+        future.add_done_callback(cancelled)
+        return future
+
+    async def async_shutdown(self) -> None:
+        """Drop queued jobs and wait, without blocking the loop, for the threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _EXECUTOR_SHUTDOWN_TIMEOUT
+        while loop.time() < deadline and any(
+            thread.is_alive() for thread in list(self._threads)
+        ):
+            await asyncio.sleep(0.01)
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the pool instrumentation exposed in diagnostics."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self.running,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "jobs": self.jobs,
+                "last_wait_ms": self.last_wait_ms,
+                "mean_wait_ms": (
+                    round(self._total_wait_ms / self.jobs, 2) if self.jobs else 0.0
+                ),
+                "max_wait_ms": self.max_wait_ms,
+                "last_run_ms": self.last_run_ms,
+                "mean_run_ms": (
+                    round(self._total_run_ms / self.jobs, 2) if self.jobs else 0.0
+                ),
+                "max_run_ms": self.max_run_ms,
+            }
+
+
+class MeteoGaliciaHttpPool:
+    """Reference-counted HTTP connections shared by every MeteoGalicia user.
+
+    Async requests use Home Assistant's shared aiohttp session. Every coordinator
+    request queues in one ``RequestLimiter``, so a restart or aligned polls do not
+    burst the host. The config-flow validators share one ``requests`` session whose
+    per-host pool keeps at most ``pool_size`` keep-alive connections, and run on
+    the pool's own ``BoundedExecutor``.
+    """
+
+    def __init__(self, hass: HomeAssistant, pool_size: int) -> None:
+        self._hass = hass
+        self.references = 0
+        self.requests_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.requests_session.mount("https://", adapter)
+        self.requests_session.mount("http://", adapter)
+        # Blocking work runs here instead of Home Assistant's shared executor.
+        self.executor = BoundedExecutor(const.EXECUTOR_MAX_WORKERS)
+        self.conditional_cache = ConditionalRequestCache()
+        self.limiter = RequestLimiter(
+            const.MAX_CONCURRENT_REQUESTS,
+            const.REQUESTS_PER_SECOND,
+            const.REQUEST_BURST,
+        )
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.attempt_timeouts: dict[str, AdaptiveTimeout] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session used by the async transport."""
+        return async_get_clientsession(self._hass)
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker shared by an endpoint family."""
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = self.breakers[endpoint] = CircuitBreaker(
+                endpoint,
+                const.BREAKER_FAILURE_THRESHOLD,
+                const.BREAKER_RESET_TIMEOUT,
+            )
+        return breaker
+
+    def attempt_timeout(self, endpoint: str) -> AdaptiveTimeout:
+        """Return the adaptive attempt timeout shared by an endpoint family."""
+        attempt_timeout = self.attempt_timeouts.get(endpoint)
+        if attempt_timeout is None:
+            attempt_timeout = self.attempt_timeouts[endpoint] = AdaptiveTimeout(
+                const.ATTEMPT_TIMEOUT_MIN,
+                const.ATTEMPT_TIMEOUT_MAX,
+                const.ATTEMPT_TIMEOUT_P99_FACTOR,
+            )
+        return attempt_timeout
+
+
+@callback
+def async_acquire_http_pool(hass: HomeAssistant) -> MeteoGaliciaHttpPool:
+    """Lease the domain HTTP pool, creating it for the first user."""
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    pool = domain_data.get(const.DATA_HTTP_POOL)
+    if pool is None:
+        pool = MeteoGaliciaHttpPool(hass, const.HTTP_POOL_SIZE)
+        domain_data[const.DATA_HTTP_POOL] = pool
+        _LOGGER.debug("Created the MeteoGalicia HTTP pool")
+    pool.references += 1
+    return pool
+
+
+async def async_release_http_pool(
+    hass: HomeAssistant, pool: MeteoGaliciaHttpPool
+) -> None:
+    """Return a lease and close the pool once its last user has released it."""
+    pool.references -= 1
+    if pool.references > 0:
+        return
+    domain_data = hass.data.get(const.DOMAIN, {})
+    if domain_data.get(const.DATA_HTTP_POOL) is pool:
+        domain_data.pop(const.DATA_HTTP_POOL)
+    _LOGGER.debug("Closing the MeteoGalicia HTTP pool")
+    try:
+        await pool.executor.async_submit(pool.requests_session.close)
+    finally:
+        await pool.executor.async_shutdown()
+
+
+class _CachedResponse:
+    """Validators and decoded payload of the last response for one URL."""
+
+    __slots__ = ("data", "digest", "etag", "last_modified", "size")
+
+    def __init__(
+        self,
+        data: Any,
+        digest: bytes,
+        size: int,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        self.data = data
+        self.digest = digest
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ConditionalRequestCache:
+    """Revalidate MeteoGalicia documents instead of decoding them on every poll.
+
+    For each URL it remembers the ``ETag`` and ``Last-Modified`` validators and a
+    hash of the body. A ``304 Not Modified`` answer or a body with the same hash
+    returns the previously decoded object, so coordinators see the very same data
+    and do not notify their listeners.
+    """
+
+    def __init__(self) -> None:
+        self._responses: dict[str, _CachedResponse] = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.unchanged_bodies = 0
+        self.bytes_avoided = 0
+        self.parses_avoided = 0
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """Return the conditional request headers for a URL."""
+        cached = self._responses.get(url)
+        if cached is None:
+            return {}
+        headers = {}
+        if cached.etag:
+            headers[hdrs.IF_NONE_MATCH] = cached.etag
+        if cached.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+        return headers
+
+    def not_modified_data(self, url: str) -> Any:
+        """Return the cached payload after a 304 answer."""
+        cached = self._responses.get(url)
+        if cached is None:
+            return None
+        self.not_modified += 1
+        self.parses_avoided += 1
+        self.bytes_avoided += cached.size
+        return cached.data
+
+    def decode(self, url: str, body: bytes, headers) -> Any:
+        """Decode a body unless it matches the last one received for the URL."""
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._responses.get(url)
+        if cached is not None and cached.digest == digest:
+            self.unchanged_bodies += 1
+            self.parses_avoided += 1
+            cached.etag = headers.get(hdrs.ETAG)
+            cached.last_modified = headers.get(hdrs.LAST_MODIFIED)
+            return cached.data
+        data = json_loads(body)
+        self._responses[url] = _CachedResponse(
+            data,
+            digest,
+            len(body),
+            headers.get(hdrs.ETAG),
+            headers.get(hdrs.LAST_MODIFIED),
+        )
+        return data
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters exposed in diagnostics."""
+        return {
+            "urls": len(self._responses),
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "unchanged_bodies": self.unchanged_bodies,
+            "bytes_avoided": self.bytes_avoided,
+            "parses_avoided": self.parses_avoided,
+        }
+
+
+async def async_get_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: float,
+    cache: ConditionalRequestCache | None = None,
+) -> Any:
+    """Fetch and decode one MeteoGalicia JSON document on the event loop.
+
+    With a cache the request is conditional, and unchanged documents are returned
+    from the cache without being decoded again.
+    """
+    headers = cache.request_headers(url) if cache is not None else None
+    async with session.get(
+        url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as response:
+        if cache is not None:
+            cache.requests += 1
+            if response.status == 304:
+                return cache.not_modified_data(url)
+        response.raise_for_status()
+        body = await response.read()
+    if not body.strip():
+        return None
+    # MeteoGalicia does not always label its JSON responses correctly, so the
+    # body is decoded regardless of its content type.
+    if cache is None:
+        return json_loads(body)
+    return cache.decode(url, body, response.headers)
+
+
+def _non_empty_list(data: Any, key: str) -> bool:
+    """Return whether a payload contains a non-empty list under key."""
+    return isinstance(data, dict) and isinstance(data.get(key), list) and bool(
+        data[key]
+    )
+
+
+def forecast_payload(data: Any) -> dict | None:
+    """Return a forecast payload, or None when it carries no prediction."""
+    if not isinstance(data, dict) or data.get("predConcello") is None:
+        return None
+    return data
+
+
+def observation_payload(data: Any) -> dict | None:
+    """Return an observation payload, or None when it has no observations."""
+    return data if _non_empty_list(data, "listaObservacionConcellos") else None
+
+
+def station_daily_payload(data: Any) -> dict | None:
+    """Return a station daily payload, or None when it has no records."""
+    return data if _non_empty_list(data, "listDatosDiarios") else None
+
+
+def station_last10_payload(data: Any) -> dict | None:
+    """Return a station last-10-minutes payload, or None when it is empty."""
+    return data if _non_empty_list(data, "listUltimos10min") else None
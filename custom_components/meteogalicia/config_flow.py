@@ -10,6 +10,7 @@ from homeassistant.const import CONF_SCAN_INTERVAL
 import homeassistant.helpers.config_validation as cv
 
 from . import const
+from .api import async_acquire_http_pool, async_release_http_pool
 
 
 class CannotConnect(Exception):
@@ -118,7 +119,7 @@ def _validate_station(
     return f"MeteoGalicia {name}"
 
 
-def _validate_api_input(user_input: dict) -> str:
+def _validate_api_input(user_input: dict, session: requests.Session) -> str:
     """Validate config data synchronously and return a descriptive entry title."""
     from meteogalicia_api.const import (
         URL_FORECAST,
@@ -126,25 +127,29 @@ def _validate_api_input(user_input: dict) -> str:
         URL_OBSERVATION_LAST10MINDATA_BY_STATION,
     )
 
-    with requests.Session() as session:
-        if id_concello := user_input.get(const.CONF_ID_CONCELLO):
-            return _validate_forecast(session, URL_FORECAST, id_concello)
-        return _validate_station(
-            session,
-            user_input,
-            URL_OBSERVATION_DAILYDATA_BY_STATION,
-            URL_OBSERVATION_LAST10MINDATA_BY_STATION,
-        )
+    if id_concello := user_input.get(const.CONF_ID_CONCELLO):
+        return _validate_forecast(session, URL_FORECAST, id_concello)
+    return _validate_station(
+        session,
+        user_input,
+        URL_OBSERVATION_DAILYDATA_BY_STATION,
+        URL_OBSERVATION_LAST10MINDATA_BY_STATION,
+    )
 
 
 async def _async_validate_api_input(hass, user_input: dict) -> str:
     """Validate config data without blocking Home Assistant's event loop."""
+    pool = async_acquire_http_pool(hass)
     try:
-        return await hass.async_add_executor_job(_validate_api_input, user_input)
+        return await pool.executor.async_submit(
+            _validate_api_input, user_input, pool.requests_session
+        )
     except requests.Timeout as err:
         raise RequestTimeout from err
     except requests.RequestException as err:
         raise CannotConnect from err
+    finally:
+        await async_release_http_pool(hass, pool)
 
 
 async def _validated_title(hass, user_input: dict, errors: dict) -> str | None:
@@ -338,6 +343,10 @@ class MeteoGaliciaOptionsFlowHandler(config_entries.OptionsFlow):
             default=data.get(CONF_SCAN_INTERVAL),
         )
         scan_interval_validator = vol.Maybe(cv.positive_int)
+        max_stale_age_schema = vol.Optional(
+            const.CONF_MAX_STALE_AGE,
+            default=data.get(const.CONF_MAX_STALE_AGE),
+        )
 
         if is_forecast:
             schema = vol.Schema(
@@ -347,6 +356,7 @@ class MeteoGaliciaOptionsFlowHandler(config_entries.OptionsFlow):
                         default=data.get(const.CONF_ID_CONCELLO, ""),
                     ): str,
                     scan_interval_schema: scan_interval_validator,
+                    max_stale_age_schema: scan_interval_validator,
                 }
             )
         else:
@@ -365,6 +375,11 @@ class MeteoGaliciaOptionsFlowHandler(config_entries.OptionsFlow):
                         default=data.get(const.CONF_ID_ESTACION_MEDIDA_LAST10MIN, ""),
                     ): str,
                     scan_interval_schema: scan_interval_validator,
+                    max_stale_age_schema: scan_interval_validator,
+                    vol.Optional(
+                        const.CONF_SLIM_STATION_ATTRIBUTES,
+                        default=data.get(const.CONF_SLIM_STATION_ATTRIBUTES, False),
+                    ): bool,
                 }
             )
 
@@ -23,10 +23,47 @@ CONF_ID_CONCELLO = "id_concello"
 CONF_ID_ESTACION = "id_estacion"
 CONF_ID_ESTACION_MEDIDA_DAILY = "id_estacion_medida_diarios"
 CONF_ID_ESTACION_MEDIDA_LAST10MIN = "id_estacion_medida_ultimos_10_min"
+# Segundos durante los que se siguen sirviendo los últimos datos válidos si
+# MeteoGalicia falla (opcional; sin valor, las entidades pasan a no disponibles)
+CONF_MAX_STALE_AGE = "max_stale_age"
+# Sensores de estación heredados en modo reducido: sólo la medida principal
+# como atributo, sin copiar todas las medidas de la estación
+CONF_SLIM_STATION_ATTRIBUTES = "slim_station_attributes"
 
-# Timeout por defecto
+# Timeout por defecto: presupuesto total de cada actualización, reintentos incluidos
 TIMEOUT = 60
+# Timeout de cada intento: p99 de la latencia reciente del servicio por un factor,
+# acotado entre un mínimo y un máximo (en segundos)
+ATTEMPT_TIMEOUT_MIN = 5
+ATTEMPT_TIMEOUT_MAX = 30
+ATTEMPT_TIMEOUT_P99_FACTOR = 3.0
 CONFIG_FLOW_TIMEOUT = 15
+
+# Recursos compartidos por todas las entradas en hass.data[DOMAIN]
+DATA_HTTP_POOL = "http_pool"
+DATA_COORDINATORS = "coordinator_registry"
+DATA_PAYLOAD_STORE = "payload_store"
+# Conexiones keep-alive máximas por host en el pool HTTP compartido
+HTTP_POOL_SIZE = 10
+# Límites globales de peticiones a MeteoGalicia (todas las entradas). Fijos a
+# propósito: protegen al servidor, no dependen de la instalación.
+MAX_CONCURRENT_REQUESTS = 8
+REQUESTS_PER_SECOND = 5.0
+REQUEST_BURST = 10
+# Hilos propios para el trabajo bloqueante (fuera del executor de Home Assistant).
+# Sólo validan el formulario de configuración y cierran la sesión requests, así
+# que no crecen con el número de entradas y no hace falta una opción.
+EXECUTOR_MAX_WORKERS = 2
+# Circuito por familia de endpoint: fallos seguidos para abrirlo y segundos
+# hasta la petición de prueba
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 60
+# Ventana (segundos) en la que una entidad con varios coordinadores agrupa sus
+# notificaciones en una única escritura de estado
+WRITE_COALESCE_WINDOW = 1.0
+# Segundos sin publicar un código de medida tras los que una estación lo marca
+# como ausente (diagnósticos)
+STATION_MEASURE_ABSENT_AFTER = 86400
 STATIONS_URL = (
     "https://servizos.meteogalicia.gal/mgrss/observacion/listaEstacionsMeteo.action"
 )
@@ -3,15 +3,16 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import datetime, timezone, timedelta
 import asyncio
 import logging
+import random
 import time
-from typing import Callable, Any
+from typing import Awaitable, Callable, Any
+import zlib
 
-import requests
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 try:
     from homeassistant.helpers.entity_platform import DEFAULT_SCAN_INTERVAL
@@ -25,11 +26,46 @@ except (
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from . import const
+from .api import (
+    AdaptiveTimeout,
+    CircuitBreaker,
+    CircuitOpenError,
+    MeteoGaliciaHttpPool,
+    RequestLimiter,
+    async_acquire_http_pool,
+    async_get_json,
+    async_release_http_pool,
+    forecast_payload,
+    observation_payload,
+    station_daily_payload,
+    station_last10_payload,
+)
+from .measures import StationMeasureTracker
+from .model import (
+    parse_forecast,
+    parse_observation,
+    parse_station_daily,
+    parse_station_last10,
+)
+from .schedule import IssuanceSchedule, PublicationSchedule
+from .store import MeteoGaliciaPayloadStore, async_get_payload_store
+from .util import safe_close_coordinators
 
 _LOGGER = logging.getLogger(__name__)
 
 _MIN_RECENT_DATA_MAX_AGE = timedelta(minutes=30)
 _DAILY_DATA_MAX_AGE = timedelta(hours=48)
+# Las observaciones se publican en una rejilla de 10 minutos.
+_OBSERVATION_PUBLICATION_PERIOD = timedelta(minutes=10)
+# Reparto de los sondeos alineados con la publicación y del refresco inicial en
+# segundo plano, para que todos los coordinadores no pidan a la vez. Los sondeos
+# alineados no se reparten por todo el intervalo, lo que retrasaría los datos
+# nuevos: lo que queda de ráfaga espera en el limitador del dominio.
+_ALIGNED_POLL_SPREAD = timedelta(seconds=30)
+_STARTUP_REFRESH_SPREAD = timedelta(seconds=60)
+# Reintentos de cada actualización, dentro del presupuesto const.TIMEOUT.
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 1.0
 
 
 def _utcnow() -> datetime:
@@ -50,6 +86,11 @@ def _parse_api_timestamp(value: Any) -> datetime | None:
     return parsed.astimezone(timezone.utc)
 
 
+def _phase_fraction(name: str) -> float:
+    """Return a stable fraction in [0, 1) used to spread a coordinator's polls."""
+    return zlib.crc32(name.encode()) / 2**32
+
+
 def _first_mapping(data: dict, key: str) -> dict | None:
     """Return the first mapping from a payload list."""
     if not isinstance(data, dict):
@@ -75,48 +116,236 @@ def _station_last10_timestamp(data: dict) -> Any:
     return observation.get("instanteLecturaUTC") if observation else None
 
 
+class _SharedCoordinator:
+    """Registry record for one coordinator shared by several config entries."""
+
+    __slots__ = (
+        "coordinator",
+        "diagnostics_owner",
+        "max_stale_ages",
+        "scan_intervals",
+        "task",
+    )
+
+    def __init__(self) -> None:
+        self.coordinator = None
+        self.task: asyncio.Task | None = None
+        # Entry that creates the coordinator's diagnostic entities.
+        self.diagnostics_owner: str | None = None
+        # Scan interval requested by each entry holding a reference.
+        self.scan_intervals: dict[str, timedelta] = {}
+        # Stale-while-revalidate bound requested by each entry (None: disabled).
+        self.max_stale_ages: dict[str, timedelta | None] = {}
+
+    def apply_scan_interval(self) -> None:
+        """Poll at the shortest interval requested by any entry."""
+        if self.coordinator is not None and self.scan_intervals:
+            self.coordinator.set_scan_interval(min(self.scan_intervals.values()))
+
+    def apply_max_stale_age(self) -> None:
+        """Serve stale data only as long as every entry accepts it."""
+        if self.coordinator is None or not self.max_stale_ages:
+            return
+        ages = self.max_stale_ages.values()
+        self.coordinator.set_max_stale_age(None if None in ages else min(ages))
+
+
 async def async_get_entry_coordinator(
     hass: HomeAssistant,
     entry_id: str,
     coordinator_class,
     id_value: str,
     scan_interval,
+    max_stale_age=None,
 ):
-    """Return one initialized coordinator per config entry, class and id.
-
-    Sensor and weather platforms are loaded concurrently by Home Assistant.  Keeping
-    the initialization task in the entry data makes both platforms await the same
-    first refresh instead of creating duplicate API polling loops.
+    """Return the initialized coordinator for one endpoint and id.
+
+    Sensor and weather platforms are loaded concurrently by Home Assistant, and
+    several entries may point at the same concello or station. The domain registry
+    keys each coordinator by endpoint and id, so every platform and entry awaits the
+    same first refresh and each resource is polled once per interval. Each entry
+    holds one reference until ``async_release_entry_coordinators`` is called.
+
+    A coordinator with a payload saved by a previous run starts from it and
+    refreshes in the background; otherwise the first live refresh is awaited.
+    That refresh is not delayed by the coordinator's phase, since the entry needs
+    the payload to create its entities: after a cold start the domain limiter
+    orders the burst, and time spent queued there neither fails the refresh nor
+    counts against the circuit breaker.
+
+    ``max_stale_age`` (seconds) opts the entry into serving the last good payload
+    while MeteoGalicia fails.
     """
-    entry_data = hass.data.setdefault(const.DOMAIN, {}).setdefault(entry_id, {})
-    tasks = entry_data.setdefault("coordinator_tasks", {})
-    key = (coordinator_class.__name__, id_value)
-    task = tasks.get(key)
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    registry = domain_data.setdefault(const.DATA_COORDINATORS, {})
+    key = (coordinator_class.endpoint, id_value)
+    shared = registry.get(key)
 
-    if task is None:
+    if shared is None:
+        shared = registry[key] = _SharedCoordinator()
 
         async def _async_create_and_refresh():
+            payload_store = async_get_payload_store(hass)
+            await payload_store.async_load()
             coordinator = coordinator_class(hass, id_value, scan_interval)
-            coordinators = entry_data.setdefault("coordinators", [])
-            coordinators.append(coordinator)
             try:
-                await coordinator.async_refresh()
+                if coordinator.async_seed_from_store(payload_store):
+                    # Entities start from the stored payload while MeteoGalicia
+                    # answers, instead of delaying startup behind the live fetch.
+                    coordinator.async_start_background_refresh()
+                else:
+                    await coordinator.async_refresh()
             except Exception:
-                coordinators.remove(coordinator)
+                await safe_close_coordinators([coordinator])
                 raise
+            shared.coordinator = coordinator
             return coordinator
 
-        task = hass.async_create_task(_async_create_and_refresh())
-        tasks[key] = task
+        shared.task = hass.async_create_task(_async_create_and_refresh())
 
+    shared.scan_intervals[entry_id] = _get_scan_interval(scan_interval)
+    shared.max_stale_ages[entry_id] = (
+        timedelta(seconds=max_stale_age) if max_stale_age else None
+    )
+    if shared.diagnostics_owner is None:
+        shared.diagnostics_owner = entry_id
     try:
-        return await task
+        coordinator = await shared.task
     except Exception:
         # Allow Home Assistant to retry platform setup after an unexpected failure.
-        if tasks.get(key) is task:
-            tasks.pop(key, None)
+        if registry.get(key) is shared:
+            registry.pop(key, None)
         raise
 
+    shared.apply_scan_interval()
+    shared.apply_max_stale_age()
+    coordinators = domain_data.setdefault(entry_id, {}).setdefault("coordinators", [])
+    if coordinator not in coordinators:
+        coordinators.append(coordinator)
+    return coordinator
+
+
+async def async_get_entry_coordinators(
+    hass: HomeAssistant,
+    entry_id: str,
+    coordinator_classes,
+    id_value: str,
+    scan_interval,
+    max_stale_age=None,
+) -> list:
+    """Return the initialized coordinators of several endpoints for one id.
+
+    Their first refreshes run concurrently, so a platform waits for its slowest
+    endpoint rather than for the sum of all of them.
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                async_get_entry_coordinator(
+                    hass,
+                    entry_id,
+                    coordinator_class,
+                    id_value,
+                    scan_interval,
+                    max_stale_age,
+                )
+                for coordinator_class in coordinator_classes
+            )
+        )
+    )
+
+
+@callback
+def async_owns_coordinator_diagnostics(
+    hass: HomeAssistant, entry_id: str, coordinator
+) -> bool:
+    """Return True if ``entry_id`` creates the coordinator's diagnostic entities.
+
+    A shared coordinator's diagnostics belong to one entry at a time, recorded in
+    the domain registry when the entry acquires it, so entries set up at the same
+    time never both create them.
+    """
+    registry = hass.data.get(const.DOMAIN, {}).get(const.DATA_COORDINATORS, {})
+    shared = registry.get((coordinator.endpoint, coordinator.id))
+    if shared is None or shared.coordinator is not coordinator:
+        # Created directly for this entry, outside the shared registry.
+        return True
+    return shared.diagnostics_owner == entry_id
+
+
+@callback
+def async_update_entry_coordinator_options(
+    hass: HomeAssistant, entry_id: str, scan_interval, max_stale_age=None
+) -> None:
+    """Apply an entry's new scan interval and stale bound to running coordinators.
+
+    Shared coordinators keep their data and session; only their polling is
+    rescheduled, and their listeners are told so the exposed interval updates.
+    """
+    registry = hass.data.get(const.DOMAIN, {}).get(const.DATA_COORDINATORS, {})
+    for shared in registry.values():
+        if entry_id not in shared.scan_intervals or shared.coordinator is None:
+            continue
+        shared.scan_intervals[entry_id] = _get_scan_interval(scan_interval)
+        shared.max_stale_ages[entry_id] = (
+            timedelta(seconds=max_stale_age) if max_stale_age else None
+        )
+        shared.coordinator.async_retune_scan_interval(
+            min(shared.scan_intervals.values())
+        )
+        shared.apply_max_stale_age()
+        shared.coordinator.async_update_listeners()
+
+
+@callback
+def async_hold_entry_coordinators(
+    hass: HomeAssistant, entry_id: str, holder_id: str
+) -> list:
+    """Give ``holder_id`` a reference to every coordinator used by an entry.
+
+    Held coordinators stay registered, with their data, while the entry itself
+    releases them, e.g. during a reload. Drop the hold with
+    ``async_release_entry_coordinators(hass, holder_id, held)``.
+    """
+    registry = hass.data.get(const.DOMAIN, {}).get(const.DATA_COORDINATORS, {})
+    held = []
+    for shared in registry.values():
+        if entry_id not in shared.scan_intervals or shared.coordinator is None:
+            continue
+        shared.scan_intervals[holder_id] = shared.scan_intervals[entry_id]
+        shared.max_stale_ages[holder_id] = shared.max_stale_ages.get(entry_id)
+        held.append(shared.coordinator)
+    return held
+
+
+async def async_release_entry_coordinators(
+    hass: HomeAssistant, entry_id: str, coordinators: list
+) -> None:
+    """Drop an entry's references and close coordinators no other entry uses."""
+    registry = hass.data.get(const.DOMAIN, {}).get(const.DATA_COORDINATORS, {})
+    unused = []
+    for coordinator in coordinators:
+        key = (getattr(coordinator, "endpoint", None), getattr(coordinator, "id", None))
+        shared = registry.get(key)
+        if shared is None or shared.coordinator is not coordinator:
+            # Created directly for this entry, outside the shared registry.
+            unused.append(coordinator)
+            continue
+        shared.scan_intervals.pop(entry_id, None)
+        shared.max_stale_ages.pop(entry_id, None)
+        if shared.diagnostics_owner == entry_id:
+            # The next entry to acquire the coordinator, usually this same one
+            # coming back from a reload, takes the diagnostics over.
+            shared.diagnostics_owner = None
+        if shared.scan_intervals:
+            shared.apply_scan_interval()
+            shared.apply_max_stale_age()
+            continue
+        registry.pop(key)
+        unused.append(coordinator)
+    coordinators.clear()
+    await safe_close_coordinators(unused)
+
 
 def _get_scan_interval(
     config_scan_interval: timedelta | int | float | None,
@@ -126,92 +355,204 @@ def _get_scan_interval(
     return config_scan_interval or DEFAULT_SCAN_INTERVAL
 
 
-async def _async_api_call_with_latency(coordinator, api_call, *args):
-    """Llama a la API en un executor, con reintentos y latencia registrada en ms."""
-    attempts = 3
-    delay = 1
+async def _async_api_call_with_latency(
+    coordinator,
+    api_call,
+    *args,
+    breaker: CircuitBreaker | None = None,
+    attempt_timeout: AdaptiveTimeout | None = None,
+    limiter: RequestLimiter | None = None,
+    budget: float = const.TIMEOUT,
+):
+    """Llama a la API con reintentos y latencia registrada en ms.
+
+    ``api_call`` es una corrutina que se ejecuta en el bucle de eventos; al
+    cancelarla, aiohttp cierra su conexión. Con ``limiter`` cada intento espera
+    antes su turno en el limitador del dominio. Con ``breaker`` cada intento se registra en el circuito compartido y,
+    si está abierto, se falla de inmediato sin más reintentos. La espera en el
+    limitador no cuenta como intento: el circuito sólo se consulta y actualiza
+    alrededor de la petición a MeteoGalicia, y ``attempt_timeout`` sólo mide la
+    petición; un intento cancelado mientras espera turno no deja muestra.
+
+    Todos los intentos comparten un presupuesto de ``budget`` segundos, sin contar
+    la espera en el limitador. Cada uno tiene su propio timeout, el de
+    ``attempt_timeout`` si se indica, sin pasar del tiempo restante; entre intentos
+    se espera un backoff exponencial con jitter y sólo se reintenta si después
+    queda tiempo para un intento útil.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + budget
+    delay = _RETRY_BASE_DELAY
     last_err: Exception | None = None
-    for attempt in range(1, attempts + 1):
-        started = time.perf_counter()
-        try:
-            data = await coordinator.hass.async_add_executor_job(api_call, *args)
-            coordinator.last_api_latency_ms = round(
-                (time.perf_counter() - started) * 1000.0, 2
-            )
-            if data is not None:
-                # Precisión en segundos para lectura y comparaciones.
-                coordinator.last_api_connected_at = datetime.now(
-                    timezone.utc
-                ).isoformat(timespec="seconds")
-                return data
-            last_err = None
-        except Exception as err:  # pylint: disable=broad-except
-            last_err = err
-        if attempt < attempts:
-            await asyncio.sleep(delay)
-            delay *= 2
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        queued_at = loop.time()
+        async with limiter.async_slot() if limiter is not None else nullcontext():
+            # El presupuesto y el timeout del intento empiezan con el turno.
+            deadline += loop.time() - queued_at
+            if breaker is not None and not breaker.allow_request():
+                raise CircuitOpenError(
+                    f"circuito de MeteoGalicia abierto para {breaker.name}"
+                )
+            timeout = deadline - loop.time()
+            if attempt_timeout is not None:
+                timeout = min(timeout, attempt_timeout.timeout())
+            started = time.perf_counter()
+            try:
+                async with asyncio.timeout(timeout):
+                    data = await api_call(*args)
+            except TimeoutError as err:
+                if attempt_timeout is not None:
+                    attempt_timeout.record(
+                        time.perf_counter() - started, timed_out=True
+                    )
+                last_err = err
+                if not str(err):
+                    last_err = TimeoutError(
+                        f"sin respuesta de MeteoGalicia en {timeout:.1f} s"
+                    )
+                if breaker is not None:
+                    breaker.record_failure(last_err)
+            except Exception as err:  # pylint: disable=broad-except
+                last_err = err
+                if breaker is not None:
+                    breaker.record_failure(err)
+            except asyncio.CancelledError:
+                # Cancelado desde fuera: la petición no terminó, pero eso no
+                # dice nada del servidor. Solo se libera la sonda.
+                if breaker is not None:
+                    breaker.release_probe()
+                raise
+            else:
+                elapsed = time.perf_counter() - started
+                if breaker is not None:
+                    breaker.record_success()
+                if attempt_timeout is not None:
+                    attempt_timeout.record(elapsed)
+                coordinator.last_api_latency_ms = round(elapsed * 1000.0, 2)
+                if data is not None:
+                    # Precisión en segundos para lectura y comparaciones.
+                    coordinator.last_api_connected_at = datetime.now(
+                        timezone.utc
+                    ).isoformat(timespec="seconds")
+                    return data
+                last_err = None
+        if attempt == _RETRY_ATTEMPTS:
+            break
+        pause = delay * random.uniform(0.5, 1.0)
+        if deadline - loop.time() - pause < const.ATTEMPT_TIMEOUT_MIN:
+            break
+        await asyncio.sleep(pause)
+        delay *= 2
     if last_err:
         raise last_err
     return None
 
 
-def _get_forecast_data_from_api(idc: str, session: requests.Session):
-    """Llama a MeteoGalicia para obtener datos de predicción."""
-    from meteogalicia_api.interface import MeteoGalicia
+async def _async_get_json_from_pool(http_pool: MeteoGaliciaHttpPool, url: str):
+    """Descarga un documento con petición condicional sobre el pool compartido.
 
-    meteogalicia_api = MeteoGalicia(session=session, timeout=const.TIMEOUT)
-    return meteogalicia_api.get_forecast_data(idc)
+    El turno en el limitador del dominio lo toma antes quien llama, fuera del
+    timeout de cada intento.
+    """
+    return await async_get_json(
+        http_pool.session, url, const.TIMEOUT, http_pool.conditional_cache
+    )
 
 
-def _get_observation_data_from_api(idc: str, session: requests.Session):
-    """Llama a MeteoGalicia para obtener datos de observación."""
-    from meteogalicia_api.interface import MeteoGalicia
+async def _async_get_forecast_data_from_api(
+    idc: str, http_pool: MeteoGaliciaHttpPool
+):
+    """Obtiene datos de predicción con la sesión aiohttp de Home Assistant."""
+    from meteogalicia_api.const import URL_FORECAST
 
-    meteogalicia_api = MeteoGalicia(session=session, timeout=const.TIMEOUT)
-    return meteogalicia_api.get_observation_data(idc)
+    return forecast_payload(
+        await _async_get_json_from_pool(http_pool, URL_FORECAST.format(idc))
+    )
 
 
-def _get_observation_dailydata_by_station_from_api(ids: str, session: requests.Session):
-    """Llama a MeteoGalicia para obtener datos diarios de estación."""
-    from meteogalicia_api.interface import MeteoGalicia
+async def _async_get_observation_data_from_api(
+    idc: str, http_pool: MeteoGaliciaHttpPool
+):
+    """Obtiene datos de observación con la sesión aiohttp de Home Assistant."""
+    from meteogalicia_api.const import URL_OBSERVATION
+
+    return observation_payload(
+        await _async_get_json_from_pool(http_pool, URL_OBSERVATION.format(idc))
+    )
+
+
+async def _async_get_observation_dailydata_by_station_from_api(
+    ids: str, http_pool: MeteoGaliciaHttpPool
+):
+    """Obtiene datos diarios de estación con la sesión aiohttp de Home Assistant."""
+    from meteogalicia_api.const import URL_OBSERVATION_DAILYDATA_BY_STATION
 
-    meteogalicia_api = MeteoGalicia(session=session, timeout=const.TIMEOUT)
-    return meteogalicia_api.get_observation_dailydata_by_station(ids)
+    return station_daily_payload(
+        await _async_get_json_from_pool(
+            http_pool, URL_OBSERVATION_DAILYDATA_BY_STATION.format(ids)
+        )
+    )
 
 
-def _get_observation_last10mindata_by_station_from_api(
-    ids: str, session: requests.Session
+async def _async_get_observation_last10mindata_by_station_from_api(
+    ids: str, http_pool: MeteoGaliciaHttpPool
 ):
-    """Llama a MeteoGalicia para obtener los últimos 10 minutos de una estación."""
-    from meteogalicia_api.interface import MeteoGalicia
+    """Obtiene los últimos 10 minutos de estación con la sesión aiohttp."""
+    from meteogalicia_api.const import URL_OBSERVATION_LAST10MINDATA_BY_STATION
 
-    meteogalicia_api = MeteoGalicia(session=session, timeout=const.TIMEOUT)
-    return meteogalicia_api.get_observation_last10mindata_by_station(ids)
+    return station_last10_payload(
+        await _async_get_json_from_pool(
+            http_pool, URL_OBSERVATION_LAST10MINDATA_BY_STATION.format(ids)
+        )
+    )
 
 
 class BaseMeteoGaliciaCoordinator(DataUpdateCoordinator):
     """Plantilla común de coordinador para los endpoints de MeteoGalicia."""
 
+    # Familia de endpoint; junto con el id identifica el recurso compartido.
+    endpoint: str
+    # Parte significativa de la respuesta; el resto es envoltorio.
+    payload_key: str
+    # Convierte la respuesta en el modelo que leen las entidades.
+    model_parser: Callable[[dict], Any]
+    # Códigos de medida publicados (sólo coordinadores de estación).
+    measure_tracker: StationMeasureTracker | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
         id_value: str,
         scan_interval,
         name_suffix: str,
-        api_fn: Callable[[str, requests.Session], Any],
+        api_fn: Callable[[str, MeteoGaliciaHttpPool], Awaitable[Any]],
         warn_msg: str,
         restore_msg: str,
         error_context: str,
         data_timestamp_fn: Callable[[dict], Any] | None = None,
         data_max_age: timedelta | None = None,
+        publication_period: timedelta | None = None,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
+            # Shared by every entry using the resource, so not tied to one of them.
+            config_entry=None,
             name=f"{const.DOMAIN}_{name_suffix}_{id_value}",
             update_interval=_get_scan_interval(scan_interval),
+            # Las respuestas sin cambios devuelven el mismo objeto cacheado, así
+            # que no se notifica a las entidades si los datos no han cambiado.
+            always_update=False,
         )
         self.id = id_value
+        # Intervalo configurado; update_interval puede adaptarse a la publicación.
+        self.scan_interval = self.update_interval
+        # Desfase determinista: reparte los sondeos de la flota dentro del intervalo.
+        self._phase = _phase_fraction(self.name)
+        self._phase_applied = False
+        self._poll_schedule: PublicationSchedule | IssuanceSchedule | None = (
+            PublicationSchedule(publication_period) if publication_period else None
+        )
         self._api_fn = api_fn
         self._warn_msg = warn_msg
         self._restore_msg = restore_msg
@@ -224,10 +565,28 @@ class BaseMeteoGaliciaCoordinator(DataUpdateCoordinator):
         self._data_timestamp_fn = data_timestamp_fn
         self._data_max_age = data_max_age
         self._last_stale_state = None
-        # Each coordinator owns its session. DataUpdateCoordinator already prevents
-        # overlapping refreshes for the same coordinator, while independent entries
-        # and endpoints can now update concurrently.
-        self._session = requests.Session()
+        self.changed_updates = 0
+        self.suppressed_updates = 0
+        # Crece cada vez que se notifica a las entidades; les permite reutilizar
+        # sus atributos y estado mientras no cambie.
+        self.data_version = 0
+        self._payload_store: MeteoGaliciaPayloadStore | None = None
+        self._background_refresh: asyncio.Task | None = None
+        # Modelo de self.data; se regenera sólo cuando cambia el objeto de datos.
+        self._model: Any = None
+        self._model_source: Any = None
+        # Stale-while-revalidate: si hay límite, los fallos sirven los últimos
+        # datos válidos mientras no superen esa antigüedad.
+        self.max_stale_age: timedelta | None = None
+        self._last_good_at: datetime | None = None
+        self.serving_stale = False
+        self.stale_updates = 0
+        self.last_revalidation_error: str | None = None
+        # Every coordinator leases the domain HTTP pool instead of opening its own
+        # connections; its API function receives the whole pool. DataUpdateCoordinator
+        # already prevents overlapping refreshes for the same coordinator, while
+        # independent entries and endpoints can update concurrently.
+        self._http_pool = async_acquire_http_pool(hass)
 
     @property
     def data_age_seconds(self) -> float | None:
@@ -239,6 +598,16 @@ class BaseMeteoGaliciaCoordinator(DataUpdateCoordinator):
             1,
         )
 
+    @property
+    def tracks_data_timestamp(self) -> bool:
+        """Return whether this endpoint reports when its data was measured."""
+        return self._data_timestamp_fn is not None
+
+    @property
+    def data_timestamp_utc(self) -> datetime | None:
+        """Return the real observation time returned by MeteoGalicia."""
+        return self._data_timestamp_utc
+
     @property
     def data_is_stale(self) -> bool | None:
         """Return whether the actual observation is older than expected."""
@@ -247,7 +616,7 @@ class BaseMeteoGaliciaCoordinator(DataUpdateCoordinator):
             return None
         max_age = self._data_max_age or max(
             _MIN_RECENT_DATA_MAX_AGE,
-            self.update_interval * 2,
+            self.scan_interval * 2,
         )
         return age > max_age.total_seconds()
 
@@ -279,12 +648,160 @@ class BaseMeteoGaliciaCoordinator(DataUpdateCoordinator):
         )
         self._check_staleness_transition()
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Advance the data version, record the measures, then notify the entities."""
+        self.data_version += 1
+        if self.measure_tracker is not None:
+            self.measure_tracker.observe(self.model, _utcnow())
+        super().async_update_listeners()
+
+    @callback
+    def async_add_measure_listener(
+        self, listener: Callable[[list], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the measures of codes the station starts reporting.
+
+        Codes reported again after going missing are offered too. The current
+        reading is recorded first, so only codes reported later reach the listener.
+        """
+        self.measure_tracker.observe(self.model, _utcnow())
+        return self.measure_tracker.add_listener(listener)
+
+    @property
+    def absent_measure_codes(self) -> dict[str, str] | None:
+        """Return the measure codes missing for a long time and since when."""
+        if self.measure_tracker is None:
+            return None
+        return {
+            code: since.isoformat(timespec="seconds")
+            for code, since in sorted(
+                self.measure_tracker.absent_since(_utcnow()).items()
+            )
+        }
+
+    @property
+    def model(self) -> Any:
+        """Return the typed model of the current data, parsed once per payload."""
+        data = self.data
+        if data is not self._model_source:
+            self._model = self.model_parser(data) if data is not None else None
+            self._model_source = data
+        return self._model
+
+    @property
+    def poll_schedule(self) -> PublicationSchedule | IssuanceSchedule | None:
+        """Return the adaptive polling schedule, if this endpoint has one."""
+        return self._poll_schedule
+
+    def set_scan_interval(self, scan_interval: timedelta) -> None:
+        """Change the configured interval used as the base polling rate.
+
+        The pending delay is recomputed from the new base, so the publication
+        schedule and this coordinator's phase stay in effect.
+        """
+        if scan_interval == self.scan_interval:
+            return
+        self.scan_interval = scan_interval
+        self._schedule_next_poll(self.data, record=False)
+
+    @callback
+    def async_retune_scan_interval(self, scan_interval: timedelta) -> None:
+        """Change the base interval of a running coordinator and reschedule it."""
+        if scan_interval == self.scan_interval:
+            return
+        self.set_scan_interval(scan_interval)
+        if self._listeners:
+            self._schedule_refresh()
+
+    def set_max_stale_age(self, max_stale_age: timedelta | None) -> None:
+        """Enable (or disable, with None) serving stale data on failures."""
+        self.max_stale_age = max_stale_age
+
+    def _serve_stale(self, err: Exception) -> bool:
+        """Return True if a failed refresh keeps the last good payload."""
+        if (
+            self.max_stale_age is None
+            or self.data is None
+            or self._last_good_at is None
+        ):
+            return False
+        if _utcnow() - self._last_good_at > self.max_stale_age:
+            if self.serving_stale:
+                _LOGGER.warning(
+                    "[%s] Los últimos datos válidos superan %s; se dejan de servir",
+                    self.id,
+                    self.max_stale_age,
+                )
+            self.serving_stale = False
+            return False
+        if not self.serving_stale:
+            _LOGGER.warning(
+                "[%s] Fallo al actualizar (%s); se mantienen los últimos datos válidos",
+                self.id,
+                err,
+            )
+        self.serving_stale = True
+        self.stale_updates += 1
+        self.last_revalidation_error = str(err)
+        return True
+
+    def _schedule_next_poll(self, data, record: bool = True) -> None:
+        """Align the next poll with the next expected publication.
+
+        Without a schedule, the first poll is shifted by this coordinator's phase
+        within the interval, and later polls keep that offset. With ``record``
+        false no poll is counted: the delay is only recomputed from now, as when
+        the scan interval changes between polls.
+        """
+        if self._poll_schedule is None:
+            interval = self.scan_interval
+            if not self._phase_applied:
+                interval += self.scan_interval * self._phase
+                self._phase_applied = record
+        else:
+            now = _utcnow()
+            if record:
+                interval = self._poll_schedule.next_interval(
+                    now, self._data_timestamp_utc, self.scan_interval
+                )
+            else:
+                interval = self._poll_schedule.interval(now, self.scan_interval)
+            interval += _ALIGNED_POLL_SPREAD * self._phase
+        self.update_interval = interval
+
+    def _unchanged(self, data) -> bool:
+        """Return whether data carries the same meaningful contents as self.data."""
+        previous = self.data
+        if previous is None:
+            return False
+        if data is previous:
+            return True
+        return data.get(self.payload_key) == previous.get(self.payload_key)
+
+    def _circuit_breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker shared by this endpoint family."""
+        return self._http_pool.breaker(self.endpoint)
+
+    def _attempt_timeout(self) -> AdaptiveTimeout:
+        """Return the adaptive attempt timeout shared by this endpoint family."""
+        return self._http_pool.attempt_timeout(self.endpoint)
+
+    def _request_limiter(self) -> RequestLimiter:
+        """Return the limiter every MeteoGalicia request of the domain waits in."""
+        return self._http_pool.limiter
+
     async def _async_update_data(self):
         try:
-            async with asyncio.timeout(const.TIMEOUT):
-                data = await _async_api_call_with_latency(
-                    self, self._api_fn, self.id, self._session
-                )
+            data = await _async_api_call_with_latency(
+                self,
+                self._api_fn,
+                self.id,
+                self._http_pool,
+                breaker=self._circuit_breaker(),
+                attempt_timeout=self._attempt_timeout(),
+                limiter=self._request_limiter(),
+            )
             if data is None:
                 if not self._had_data_error:
                     _LOGGER.warning(self._warn_msg, self.id)
@@ -295,85 +812,196 @@ class BaseMeteoGaliciaCoordinator(DataUpdateCoordinator):
             if self._had_data_error:
                 _LOGGER.info(self._restore_msg, self.id)
                 self._had_data_error = False
+            self._last_good_at = _utcnow()
+            if self.serving_stale:
+                _LOGGER.info("[%s] Datos revalidados con MeteoGalicia", self.id)
+                self.serving_stale = False
+            if self._unchanged(data):
+                # Devolver el objeto anterior evita notificar a las entidades
+                # (always_update=False) y que escriban un estado idéntico.
+                data = self.data
+                self.suppressed_updates += 1
+            else:
+                self.changed_updates += 1
             self._update_data_timestamp(data)
+            self._schedule_next_poll(data)
+            if self._payload_store is not None and data is not self.data:
+                self._payload_store.async_save_payload(
+                    self.endpoint,
+                    self.id,
+                    data,
+                    self.data_timestamp,
+                    self._poll_schedule.as_state() if self._poll_schedule else None,
+                )
             return data
-        except UpdateFailed:
-            self._check_staleness_transition()
-            raise
         except Exception as err:  # pylint: disable=broad-except
+            self.update_interval = self.scan_interval
+            was_stale = self._last_stale_state
             self._check_staleness_transition()
+            if self._serve_stale(err):
+                if self._last_stale_state is not was_stale:
+                    # Mismos datos: se notifica sólo para refrescar data_stale.
+                    self.async_update_listeners()
+                return self.data
+            if isinstance(err, UpdateFailed):
+                raise
             raise UpdateFailed(
                 f"Error obteniendo {self._error_context} para {self.id}: {err}"
             ) from err
 
+    @callback
+    def async_seed_from_store(self, payload_store: MeteoGaliciaPayloadStore) -> bool:
+        """Start from the payload saved by a previous run, if there is one.
+
+        Successful updates are saved back to ``payload_store`` from now on. The
+        stored observation time is restored too, so old data is reported as stale.
+        """
+        self._payload_store = payload_store
+        record = payload_store.async_get(self.endpoint, self.id)
+        if record is None or record.get("data") is None:
+            return False
+        self.data = record["data"]
+        self._update_data_timestamp(self.data)
+        try:
+            self._last_good_at = datetime.fromisoformat(record["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            self._last_good_at = None
+        if self._poll_schedule is not None and record.get("schedule"):
+            self._poll_schedule.restore(record["schedule"])
+        _LOGGER.debug("[%s] Datos iniciales cargados del almacenamiento", self.id)
+        return True
+
+    @callback
+    def async_start_background_refresh(self) -> None:
+        """Fetch live data without making the caller wait for MeteoGalicia.
+
+        Each coordinator starts at its own phase within the startup spread, so a
+        restart does not fire every refresh at the same moment.
+        """
+        self._background_refresh = self.hass.async_create_background_task(
+            self._async_delayed_refresh(
+                (_STARTUP_REFRESH_SPREAD * self._phase).total_seconds()
+            ),
+            f"{self.name} first refresh",
+        )
+
+    async def _async_delayed_refresh(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.async_refresh()
+
     async def async_close(self) -> None:
-        """Close this coordinator's HTTP resources."""
-        await self.hass.async_add_executor_job(self._session.close)
+        """Return this coordinator's lease on the shared HTTP pool."""
+        if self._background_refresh is not None:
+            self._background_refresh.cancel()
+            self._background_refresh = None
+        if self._http_pool is None:
+            return
+        pool, self._http_pool = self._http_pool, None
+        await async_release_http_pool(self.hass, pool)
 
 
 class MeteoGaliciaForecastCoordinator(BaseMeteoGaliciaCoordinator):
     """Coordinador de datos de predicción."""
 
+    endpoint = "forecast"
+    payload_key = "predConcello"
+    model_parser = staticmethod(parse_forecast)
+
     def __init__(self, hass: HomeAssistant, id_concello: str, scan_interval) -> None:
         super().__init__(
             hass=hass,
             id_value=id_concello,
             scan_interval=scan_interval,
             name_suffix="forecast",
-            api_fn=_get_forecast_data_from_api,
+            api_fn=_async_get_forecast_data_from_api,
             warn_msg="[%s] Posible problema de conexión. No se pueden descargar datos de predicción de MeteoGalicia",
             restore_msg="[%s] Datos de predicción recuperados tras el error previo",
             error_context="datos de predicción",
         )
+        # La predicción se emite pocas veces al día: sondeo propio, independiente
+        # del intervalo de las observaciones.
+        self._poll_schedule = IssuanceSchedule()
+
+    def _schedule_next_poll(self, data, record: bool = True) -> None:
+        """Poll densely only around the usual forecast issue times."""
+        now = _utcnow()
+        if record:
+            changed = self.data is not None and data is not self.data
+            interval = self._poll_schedule.next_interval(
+                now, changed, self.scan_interval
+            )
+        else:
+            interval = self._poll_schedule.interval(now, self.scan_interval)
+        self.update_interval = interval + _ALIGNED_POLL_SPREAD * self._phase
 
 
 class MeteoGaliciaObservationCoordinator(BaseMeteoGaliciaCoordinator):
     """Coordinador de datos de observación."""
 
+    endpoint = "observation"
+    payload_key = "listaObservacionConcellos"
+    model_parser = staticmethod(parse_observation)
+
     def __init__(self, hass: HomeAssistant, id_concello: str, scan_interval) -> None:
         super().__init__(
             hass=hass,
             id_value=id_concello,
             scan_interval=scan_interval,
             name_suffix="observation",
-            api_fn=_get_observation_data_from_api,
+            api_fn=_async_get_observation_data_from_api,
             warn_msg="[%s] Posible problema de conexión. No se pueden descargar datos de observación de MeteoGalicia",
             restore_msg="[%s] Datos de observación recuperados tras el error previo",
             error_context="datos de observación",
             data_timestamp_fn=_observation_timestamp,
+            publication_period=_OBSERVATION_PUBLICATION_PERIOD,
         )
 
 
 class MeteoGaliciaStationDailyCoordinator(BaseMeteoGaliciaCoordinator):
     """Coordinador de datos diarios de estación."""
 
+    endpoint = "station_daily"
+    payload_key = "listDatosDiarios"
+    model_parser = staticmethod(parse_station_daily)
+
     def __init__(self, hass: HomeAssistant, id_estacion: str, scan_interval) -> None:
         super().__init__(
             hass=hass,
             id_value=id_estacion,
             scan_interval=scan_interval,
             name_suffix="station_daily",
-            api_fn=_get_observation_dailydata_by_station_from_api,
+            api_fn=_async_get_observation_dailydata_by_station_from_api,
             warn_msg="[%s] Posible problema de conexión. No se pueden descargar datos diarios de MeteoGalicia",
             restore_msg="[%s] Datos diarios recuperados tras el error previo",
             error_context="datos diarios de estación",
             data_timestamp_fn=_station_daily_timestamp,
             data_max_age=_DAILY_DATA_MAX_AGE,
         )
+        self.measure_tracker = StationMeasureTracker(
+            timedelta(seconds=const.STATION_MEASURE_ABSENT_AFTER)
+        )
 
 
 class MeteoGaliciaStationLast10MinCoordinator(BaseMeteoGaliciaCoordinator):
     """Coordinador de datos de los últimos 10 minutos de estación."""
 
+    endpoint = "station_last10min"
+    payload_key = "listUltimos10min"
+    model_parser = staticmethod(parse_station_last10)
+
     def __init__(self, hass: HomeAssistant, id_estacion: str, scan_interval) -> None:
         super().__init__(
             hass=hass,
             id_value=id_estacion,
             scan_interval=scan_interval,
             name_suffix="station_last10min",
-            api_fn=_get_observation_last10mindata_by_station_from_api,
+            api_fn=_async_get_observation_last10mindata_by_station_from_api,
             warn_msg="[%s] Posible problema de conexión. No se pueden descargar datos de los últimos 10 minutos de MeteoGalicia",
             restore_msg="[%s] Datos de los últimos 10 minutos recuperados tras el error previo",
             error_context="datos de últimos 10 minutos de estación",
             data_timestamp_fn=_station_last10_timestamp,
+            publication_period=_OBSERVATION_PUBLICATION_PERIOD,
+        )
+        self.measure_tracker = StationMeasureTracker(
+            timedelta(seconds=const.STATION_MEASURE_ABSENT_AFTER)
         )
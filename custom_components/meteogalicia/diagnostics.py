@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers import entity_registry as er
 
 from . import const
@@ -20,7 +21,13 @@ def _serializable(value):
 
 def _coordinator_diagnostics(coordinator) -> dict:
     """Return useful coordinator health without exposing API payloads."""
-    interval = getattr(coordinator, "update_interval", None)
+    interval = getattr(coordinator, "scan_interval", None) or getattr(
+        coordinator, "update_interval", None
+    )
+    next_poll = getattr(coordinator, "update_interval", None)
+    schedule = getattr(coordinator, "poll_schedule", None)
+    max_stale_age = getattr(coordinator, "max_stale_age", None)
+    tracker = getattr(coordinator, "measure_tracker", None)
     return {
         "class": coordinator.__class__.__name__,
         "name": getattr(coordinator, "name", None),
@@ -30,14 +37,43 @@ def _coordinator_diagnostics(coordinator) -> dict:
             coordinator, "last_api_connected_at", None
         ),
         "last_api_latency_ms": getattr(coordinator, "last_api_latency_ms", None),
+        "changed_updates": getattr(coordinator, "changed_updates", None),
+        "suppressed_updates": getattr(coordinator, "suppressed_updates", None),
         "data_timestamp": getattr(coordinator, "data_timestamp", None),
         "data_age_seconds": getattr(coordinator, "data_age_seconds", None),
         "data_stale": getattr(coordinator, "data_is_stale", None),
         "scan_interval_seconds": (
             interval.total_seconds() if interval is not None else None
         ),
+        "next_poll_interval_seconds": (
+            next_poll.total_seconds() if next_poll is not None else None
+        ),
+        "poll_schedule": schedule.as_dict() if schedule is not None else None,
+        "max_stale_age_seconds": (
+            max_stale_age.total_seconds() if max_stale_age is not None else None
+        ),
+        "serving_stale": getattr(coordinator, "serving_stale", None),
+        "stale_updates": getattr(coordinator, "stale_updates", None),
+        "last_revalidation_error": getattr(
+            coordinator, "last_revalidation_error", None
+        ),
         "last_error": _serializable(getattr(coordinator, "last_exception", None)),
         "data_available": getattr(coordinator, "data", None) is not None,
+        "measure_codes": (
+            sorted(tracker.known_codes) if tracker is not None else None
+        ),
+        "absent_measure_codes": getattr(coordinator, "absent_measure_codes", None),
+    }
+
+
+def _entity_objects(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return the live entity objects of an entry, by entity id."""
+    return {
+        entity_id: entity
+        for platform in entity_platform.async_get_platforms(hass, const.DOMAIN)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == entry.entry_id
+        for entity_id, entity in platform.entities.items()
     }
 
 
@@ -55,9 +91,12 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict:
     """Return diagnostics for a config entry."""
-    entry_data = hass.data.get(const.DOMAIN, {}).get(entry.entry_id, {})
+    domain_data = hass.data.get(const.DOMAIN, {})
+    entry_data = domain_data.get(entry.entry_id, {})
+    http_pool = domain_data.get(const.DATA_HTTP_POOL)
     registry = er.async_get(hass)
     entities = er.async_entries_for_config_entry(registry, entry.entry_id)
+    entity_objects = _entity_objects(hass, entry)
     return {
         "entry": {
             "entry_id": entry.entry_id,
@@ -65,17 +104,46 @@ async def async_get_config_entry_diagnostics(
             "title": entry.title,
             "data": dict(entry.data),
             "options": dict(entry.options),
+            "setup_seconds": entry_data.get("setup_seconds"),
         },
         "coordinators": [
             _coordinator_diagnostics(coordinator)
             for coordinator in entry_data.get("coordinators", [])
         ],
+        # Domain-wide: every entry shares the HTTP pool, its cache and its limiter.
+        "http_cache": (
+            http_pool.conditional_cache.as_dict() if http_pool is not None else None
+        ),
+        "request_limiter": (
+            http_pool.limiter.as_dict() if http_pool is not None else None
+        ),
+        "executor": http_pool.executor.as_dict() if http_pool is not None else None,
+        "circuit_breakers": (
+            {
+                endpoint: breaker.as_dict()
+                for endpoint, breaker in http_pool.breakers.items()
+            }
+            if http_pool is not None
+            else {}
+        ),
+        "attempt_timeouts": (
+            {
+                endpoint: attempt_timeout.as_dict()
+                for endpoint, attempt_timeout in http_pool.attempt_timeouts.items()
+            }
+            if http_pool is not None
+            else {}
+        ),
         "entities": [
             {
                 "entity_id": entity.entity_id,
                 "unique_id": entity.unique_id,
                 "platform": entity.platform,
                 "disabled_by": _serializable(entity.disabled_by),
+                # Only entities fed by several coordinators merge their writes.
+                "coalesced_writes": getattr(
+                    entity_objects.get(entity.entity_id), "coalesced_writes", None
+                ),
             }
             for entity in entities
         ],
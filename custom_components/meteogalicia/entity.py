@@ -0,0 +1,59 @@
+"""Shared entity base classes for the MeteoGalicia integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import const
+
+
+class MeteoGaliciaMultiCoordinatorEntity(CoordinatorEntity):
+    """Entity fed by several coordinators that writes its state once per burst.
+
+    The first coordinator drives availability, like in ``CoordinatorEntity``.
+    A notification from any of them opens a short window; notifications that
+    arrive before it closes are merged into the single state write at its end
+    and counted in ``coalesced_writes``.
+    """
+
+    coalesce_window: float = const.WRITE_COALESCE_WINDOW
+
+    def __init__(self, coordinator, *other_coordinators) -> None:
+        super().__init__(coordinator)
+        self._other_coordinators = other_coordinators
+        self._pending_write: CALLBACK_TYPE | None = None
+        self.coalesced_writes = 0
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to every coordinator the entity depends on."""
+        await super().async_added_to_hass()
+        for coordinator in self._other_coordinators:
+            self.async_on_remove(
+                coordinator.async_add_listener(self._handle_coordinator_update)
+            )
+        self.async_on_remove(self._async_cancel_pending_write)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Schedule a state write, or merge into the one already scheduled."""
+        if self._pending_write is not None:
+            self.coalesced_writes += 1
+            return
+        self._pending_write = async_call_later(
+            self.hass, self.coalesce_window, self._async_write_coalesced
+        )
+
+    @callback
+    def _async_write_coalesced(self, _now: datetime) -> None:
+        self._pending_write = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_pending_write(self) -> None:
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
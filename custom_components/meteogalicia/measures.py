@@ -0,0 +1,78 @@
+"""Track the measure codes a MeteoGalicia station reports over time."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from .model import StationMeasure, StationReading
+
+
+class StationMeasureTracker:
+    """Remember a station's measure codes and notice when they change.
+
+    Each new reading is compared with the known codes through set operations on
+    its ``measures`` index, so only codes that appear or go missing cost Python
+    work. Listeners receive the measures of codes never reported before and of
+    codes reported again after going missing, whose entities may have been
+    removed meanwhile. Codes missing for at least ``absent_after`` are reported
+    as absent.
+    """
+
+    def __init__(self, absent_after: timedelta) -> None:
+        self.absent_after = absent_after
+        self._known: set[str] = set()
+        self._missing_since: dict[str, datetime] = {}
+        self._reading: StationReading | None = None
+        self._listeners: list[Callable[[list[StationMeasure]], None]] = []
+
+    @property
+    def known_codes(self) -> frozenset[str]:
+        """Return every code reported since the tracker was created."""
+        return frozenset(self._known)
+
+    def add_listener(
+        self, listener: Callable[[list[StationMeasure]], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with new or returning measures; return its remover."""
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def observe(
+        self, reading: StationReading | None, now: datetime
+    ) -> list[StationMeasure]:
+        """Record a reading and return the measures of new or returning codes."""
+        if reading is None or reading is self._reading:
+            return []
+        self._reading = reading
+        codes = reading.measures.keys()
+        if not self._missing_since and codes == self._known:
+            return []
+        returned = [code for code in self._missing_since if code in codes]
+        for code in returned:
+            del self._missing_since[code]
+        for code in self._known - codes:
+            self._missing_since.setdefault(code, now)
+        new_codes = codes - self._known
+        if not new_codes and not returned:
+            return []
+        self._known |= new_codes
+        measures = [
+            reading.measures[code] for code in sorted(new_codes.union(returned))
+        ]
+        for listener in list(self._listeners):
+            listener(measures)
+        return measures
+
+    def absent_since(self, now: datetime) -> dict[str, datetime]:
+        """Return the codes missing for at least ``absent_after``, and since when."""
+        return {
+            code: since
+            for code, since in self._missing_since.items()
+            if now - since >= self.absent_after
+        }
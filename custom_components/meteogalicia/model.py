@@ -0,0 +1,227 @@
+"""Compact, immutable models parsed once from MeteoGalicia payloads.
+
+Coordinators parse each new payload into one of these models and entities read
+only the model, instead of walking the nested API dictionaries on every state
+write. Only the fields used by the entities are kept, values are stored as
+returned by MeteoGalicia (sentinels such as ``-9999`` included), and strings
+repeated across payloads, like units and parameter names, are interned.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+
+def _intern(value: Any) -> str | None:
+    """Return an interned string, or None for missing values."""
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+
+def _first_mapping(container: Any, key: str) -> dict | None:
+    """Return the first mapping of a payload list, if there is one."""
+    if not isinstance(container, dict):
+        return None
+    items = container.get(key)
+    if not isinstance(items, list) or not items or not isinstance(items[0], dict):
+        return None
+    return items[0]
+
+
+# Validation codes of original (1) and interpolated (5) station measurements.
+VALID_MEASURE_CODES = (1, 5)
+
+
+@dataclass(frozen=True, slots=True)
+class DayPeriods:
+    """Values for the morning, afternoon and night of a forecast day."""
+
+    morning: Any
+    afternoon: Any
+    night: Any
+
+    def values(self) -> tuple[Any, Any, Any]:
+        """Return the morning, afternoon and night probabilities."""
+        return (self.morning, self.afternoon, self.night)
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastDay:
+    """One day of a municipal forecast."""
+
+    date: str | None
+    sky_code: Any
+    max_temperature: Any
+    min_temperature: Any
+    uv_max: Any
+    rain: DayPeriods | None
+    sky: DayPeriods | None
+
+
+@dataclass(frozen=True, slots=True)
+class Forecast:
+    """Municipal forecast (``predConcello``)."""
+
+    name: str | None
+    days: tuple[ForecastDay, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Observation:
+    """Latest municipal observation (``listaObservacionConcellos``)."""
+
+    local_date: str | None
+    utc_date: str | None
+    temperature: Any
+    apparent_temperature: Any
+    sky_code: Any
+    reference: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class StationMeasure:
+    """One station measurement (an item of ``listaMedidas``)."""
+
+    code: str
+    name: str
+    unit: str | None
+    value: Any
+    validation: Any
+
+
+@dataclass(frozen=True, slots=True)
+class StationReading:
+    """Station record of the daily or last-10-minutes endpoint.
+
+    ``measures`` keeps the first measurement of each ``codigoParametro``, in API
+    order, and ``valid_values`` maps the same codes to their validated value
+    (None when the measurement is not valid).
+    """
+
+    station: str | None
+    concello: str | None
+    station_id: Any
+    date: str | None
+    reading_time: str | None
+    measures: Mapping[str, StationMeasure]
+    valid_values: Mapping[str, Any]
+
+
+def valid_measure_value(measure: StationMeasure | None) -> Any:
+    """Return the value of an original or interpolated measurement, else None."""
+    if measure is None:
+        return None
+    if measure.validation not in VALID_MEASURE_CODES or measure.value == -9999:
+        return None
+    return measure.value
+
+
+def _periods(value: Any) -> DayPeriods | None:
+    if not isinstance(value, dict):
+        return None
+    return DayPeriods(value.get("manha"), value.get("tarde"), value.get("noite"))
+
+
+def parse_forecast(data: Any) -> Forecast | None:
+    """Build the forecast model from a ``predConcello`` payload."""
+    pred_concello = data.get("predConcello") if isinstance(data, dict) else None
+    if not isinstance(pred_concello, dict):
+        return None
+    days = pred_concello.get("listaPredDiaConcello")
+    return Forecast(
+        name=_intern(pred_concello.get("nome")),
+        days=tuple(
+            ForecastDay(
+                date=day.get("dataPredicion"),
+                sky_code=day.get("ceoDia"),
+                max_temperature=day.get("tMax"),
+                min_temperature=day.get("tMin"),
+                uv_max=day.get("uvMax"),
+                rain=_periods(day.get("pchoiva")),
+                sky=_periods(day.get("ceo")),
+            )
+            for day in (days if isinstance(days, list) else [])
+            if isinstance(day, dict)
+        ),
+    )
+
+
+def parse_observation(data: Any) -> Observation | None:
+    """Build the observation model from a ``listaObservacionConcellos`` payload."""
+    observation = _first_mapping(data, "listaObservacionConcellos")
+    if observation is None:
+        return None
+    return Observation(
+        local_date=observation.get("dataLocal"),
+        utc_date=observation.get("dataUTC"),
+        temperature=observation.get("temperatura"),
+        apparent_temperature=observation.get("sensacionTermica"),
+        sky_code=observation.get("icoEstadoCeo"),
+        reference=_intern(observation.get("nomeConcello")),
+    )
+
+
+def _measures(items: Any) -> list[StationMeasure]:
+    measures = []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or not item.get("codigoParametro"):
+            continue
+        code = _intern(item["codigoParametro"])
+        measures.append(
+            StationMeasure(
+                code=code,
+                name=_intern(item.get("nomeParametro") or code),
+                unit=_intern(item.get("unidade")),
+                value=item.get("valor"),
+                validation=item.get("lnCodigoValidacion"),
+            )
+        )
+    return measures
+
+
+def _station_reading(station: dict, **fields: Any) -> StationReading:
+    by_code: dict[str, StationMeasure] = {}
+    for measure in _measures(station.get("listaMedidas")):
+        by_code.setdefault(measure.code, measure)
+    return StationReading(
+        station=_intern(station.get("estacion")),
+        measures=MappingProxyType(by_code),
+        valid_values=MappingProxyType(
+            {code: valid_measure_value(measure) for code, measure in by_code.items()}
+        ),
+        **fields,
+    )
+
+
+def parse_station_daily(data: Any) -> StationReading | None:
+    """Build the station model from a ``listDatosDiarios`` payload."""
+    day = _first_mapping(data, "listDatosDiarios")
+    station = _first_mapping(day, "listaEstacions")
+    if station is None:
+        return None
+    return _station_reading(
+        station,
+        concello=_intern(station.get("concello")),
+        station_id=None,
+        date=day.get("data"),
+        reading_time=None,
+    )
+
+
+def parse_station_last10(data: Any) -> StationReading | None:
+    """Build the station model from a ``listUltimos10min`` payload."""
+    station = _first_mapping(data, "listUltimos10min")
+    if station is None:
+        return None
+    return _station_reading(
+        station,
+        concello=None,
+        station_id=station.get("idEstacion"),
+        date=None,
+        reading_time=station.get("instanteLecturaUTC"),
+    )
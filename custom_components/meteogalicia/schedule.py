@@ -0,0 +1,284 @@
+"""Polling schedules aligned with MeteoGalicia's publication times."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import datetime, timedelta
+
+# Never poll sooner than this, even when a publication is imminent.
+_MIN_DELAY = timedelta(seconds=15)
+# Safety margin added after the expected publication time.
+_PUBLICATION_MARGIN = timedelta(seconds=30)
+# How much earlier to try after a publication was found on the first attempt.
+_LAG_PROBE_STEP = timedelta(seconds=15)
+
+
+class PublicationSchedule:
+    """Predict when the next record is published and poll just after it.
+
+    Records are published on a fixed grid (``period``) some time after their own
+    timestamp. The schedule polls at ``timestamp + period + lag`` plus a margin
+    and keeps following up every ``follow_up`` while the known record comes back.
+
+    The lag is learnt from the history of timestamps. When a record is found
+    after a follow-up, the delay between its timestamp and that poll is at most
+    one follow-up above the real lag and becomes the new estimate. When it is
+    found on the first attempt, the estimate may be too generous, so the next
+    poll is tried ``_LAG_PROBE_STEP`` earlier.
+
+    The configured scan interval still bounds the polling rate: the target
+    publication is the first one at least ``scan_interval - period`` away.
+    """
+
+    def __init__(
+        self,
+        period: timedelta,
+        follow_up: timedelta = timedelta(seconds=60),
+        max_follow_ups: int = 5,
+    ) -> None:
+        self.period = period
+        self.follow_up = follow_up
+        self.max_follow_ups = max_follow_ups
+        self.publication_lag: timedelta | None = None
+        self._last_timestamp: datetime | None = None
+        self._follow_ups = 0
+        self.polls = 0
+        self.new_records = 0
+        self.repeated_records = 0
+        self._pickup_delay_total = 0.0
+
+    def next_interval(
+        self,
+        now: datetime,
+        data_timestamp: datetime | None,
+        scan_interval: timedelta,
+    ) -> timedelta:
+        """Record a successful poll and return the delay until the next one."""
+        self.polls += 1
+        if data_timestamp is None:
+            self._follow_ups = 0
+            return scan_interval
+
+        if self._last_timestamp is None or data_timestamp > self._last_timestamp:
+            pickup_delay = max(timedelta(0), now - data_timestamp)
+            self._pickup_delay_total += pickup_delay.total_seconds()
+            if self._last_timestamp is not None:
+                self._learn_lag(pickup_delay)
+            self._last_timestamp = data_timestamp
+            self.new_records += 1
+            self._follow_ups = 0
+        else:
+            self.repeated_records += 1
+            if self._follow_ups < self.max_follow_ups:
+                self._follow_ups += 1
+                return self.follow_up
+            # Much later than usual: forget the estimate and wait for the grid.
+            self._follow_ups = 0
+            self.publication_lag = None
+        return self.interval(now, scan_interval)
+
+    def interval(self, now: datetime, scan_interval: timedelta) -> timedelta:
+        """Return the delay from ``now`` to the next poll without recording one.
+
+        Used when the scan interval changes between two polls.
+        """
+        if self._last_timestamp is None:
+            return scan_interval
+        if self._follow_ups:
+            return self.follow_up
+        publication = (
+            self._last_timestamp
+            + self.period
+            + (self.publication_lag or timedelta(0))
+            + _PUBLICATION_MARGIN
+        )
+        earliest = now + max(timedelta(0), scan_interval - self.period)
+        if publication <= earliest:
+            periods = math.floor((earliest - publication) / self.period) + 1
+            publication += self.period * periods
+        return max(_MIN_DELAY, publication - now)
+
+    def _learn_lag(self, pickup_delay: timedelta) -> None:
+        """Update the lag estimate after a new record was found."""
+        if self.publication_lag is None or self._follow_ups:
+            # Found by a follow-up (or no estimate yet): the delay bounds the lag.
+            self.publication_lag = pickup_delay
+            return
+        self.publication_lag = max(
+            timedelta(0), self.publication_lag - _LAG_PROBE_STEP
+        )
+
+    def as_state(self) -> dict:
+        """Return the learnt lag, to be restored after a restart."""
+        lag = self.publication_lag
+        return {"publication_lag": lag.total_seconds() if lag is not None else None}
+
+    def restore(self, state: dict) -> None:
+        """Restore the lag saved by ``as_state``."""
+        lag = state.get("publication_lag") if isinstance(state, dict) else None
+        if isinstance(lag, (int, float)) and lag >= 0:
+            self.publication_lag = timedelta(seconds=lag)
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the scheduling metrics exposed in diagnostics."""
+        lag = self.publication_lag
+        return {
+            "polls": self.polls,
+            "new_records": self.new_records,
+            "repeated_records": self.repeated_records,
+            "publication_lag_seconds": lag.total_seconds() if lag is not None else None,
+            "mean_pickup_delay_seconds": (
+                round(self._pickup_delay_total / self.new_records, 1)
+                if self.new_records
+                else None
+            ),
+        }
+
+
+# Forecast polling, independent of the observation scan interval.
+_FORECAST_DENSE_INTERVAL = timedelta(minutes=10)
+_FORECAST_SPARSE_INTERVAL = timedelta(hours=8)
+_FORECAST_LEARNING_PERIOD = timedelta(hours=24)
+_ISSUANCE_WINDOW_MARGIN = timedelta(minutes=20)
+# Enough issuances to cover several days of a twice-daily forecast.
+_ISSUANCE_SAMPLES = 8
+_DAY = timedelta(days=1)
+
+
+def _time_of_day(value: datetime) -> timedelta:
+    return value - value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class IssuanceSchedule:
+    """Poll the forecast densely around its usual issue times only.
+
+    Each time the forecast contents change, the time-of-day range in which the
+    new issue appeared (from the previous poll to the one that saw it) is kept.
+    During the first ``_FORECAST_LEARNING_PERIOD`` the forecast is polled at the
+    dense interval. Afterwards it is polled densely inside the learnt windows
+    (widened by ``_ISSUANCE_WINDOW_MARGIN``) until the new issue is seen, and once
+    every ``_FORECAST_SPARSE_INTERVAL`` at most outside them.
+
+    The dense interval is the configured scan interval, but never shorter than
+    ``_FORECAST_DENSE_INTERVAL``, so a short observation interval does not make
+    the forecast poll more often.
+    """
+
+    def __init__(self) -> None:
+        self._issuances: deque[tuple[timedelta, timedelta]] = deque(
+            maxlen=_ISSUANCE_SAMPLES
+        )
+        self._learning_since: datetime | None = None
+        self._last_poll: datetime | None = None
+        # Whether the last poll saw a new issue, which closes its window.
+        self._issue_seen = False
+        self.polls = 0
+        self.changes = 0
+
+    def next_interval(
+        self, now: datetime, changed: bool, scan_interval: timedelta
+    ) -> timedelta:
+        """Record a successful poll and return the delay until the next one."""
+        self.polls += 1
+        if self._learning_since is None:
+            self._learning_since = now
+        if changed and self._last_poll is not None:
+            # The issue appeared at some point since the previous poll.
+            self.changes += 1
+            self._issuances.append(
+                (_time_of_day(self._last_poll), _time_of_day(now))
+            )
+        self._last_poll = now
+        self._issue_seen = changed
+        return self.interval(now, scan_interval)
+
+    def interval(self, now: datetime, scan_interval: timedelta) -> timedelta:
+        """Return the delay from ``now`` to the next poll without recording one.
+
+        Used when the scan interval changes between two polls.
+        """
+        dense = max(scan_interval, _FORECAST_DENSE_INTERVAL)
+        if (
+            self._learning_since is None
+            or not self._issuances
+            or now - self._learning_since < _FORECAST_LEARNING_PERIOD
+        ):
+            return dense
+
+        windows = self._windows_around(now)
+        current = next(
+            (window for window in windows if window[0] <= now < window[1]), None
+        )
+        if current is not None and not self._issue_seen:
+            return dense
+        skip_until = current[1] if current is not None else now
+        next_start = next(
+            (start for start, _end in windows if start > skip_until), None
+        )
+        if next_start is None:
+            return _FORECAST_SPARSE_INTERVAL
+        return min(max(next_start - now, _MIN_DELAY), _FORECAST_SPARSE_INTERVAL)
+
+    def _windows_around(self, now: datetime) -> list[tuple[datetime, datetime]]:
+        """Return the merged issue windows from yesterday to tomorrow."""
+        midnight = now - _time_of_day(now)
+        windows = []
+        for day in (midnight - _DAY, midnight, midnight + _DAY):
+            for first, last in self._issuances:
+                end = last if last >= first else last + _DAY
+                windows.append(
+                    (
+                        day + first - _ISSUANCE_WINDOW_MARGIN,
+                        day + end + _ISSUANCE_WINDOW_MARGIN,
+                    )
+                )
+        windows.sort()
+        merged = [windows[0]]
+        for start, end in windows[1:]:
+            if start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def as_state(self) -> dict:
+        """Return the learnt issue windows, to be restored after a restart."""
+        return {
+            "learning_since": (
+                self._learning_since.isoformat() if self._learning_since else None
+            ),
+            "issuances": [
+                [first.total_seconds(), last.total_seconds()]
+                for first, last in self._issuances
+            ],
+        }
+
+    def restore(self, state: dict) -> None:
+        """Restore issue windows saved by ``as_state``."""
+        try:
+            learning_since = state.get("learning_since")
+            self._learning_since = (
+                datetime.fromisoformat(learning_since) if learning_since else None
+            )
+            self._issuances.extend(
+                (timedelta(seconds=first), timedelta(seconds=last))
+                for first, last in state.get("issuances", [])
+            )
+        except (AttributeError, TypeError, ValueError):
+            self._learning_since = None
+            self._issuances.clear()
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the scheduling metrics exposed in diagnostics."""
+        return {
+            "polls": self.polls,
+            "changes": self.changes,
+            "learnt_issuances": len(self._issuances),
+            "learning": self._learning_since is None
+            or (
+                self._last_poll is not None
+                and self._last_poll - self._learning_since
+                < _FORECAST_LEARNING_PERIOD
+            ),
+        }
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 """Módulo de sensores para la integración MeteoGalicia."""
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
 import logging
 import re
+from typing import Any
 
 import voluptuous as vol
 
@@ -11,13 +16,18 @@ from homeassistant.const import (
     DEGREE,
     PERCENTAGE,
     STATE_UNKNOWN,
+    EntityCategory,
     UnitOfIrradiance,
     UnitOfPrecipitationDepth,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import PlatformNotReady
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -33,11 +43,22 @@ from homeassistant.components.sensor import (
 
 from . import const
 from .coordinator import (
+    BaseMeteoGaliciaCoordinator,
     MeteoGaliciaForecastCoordinator,
     MeteoGaliciaObservationCoordinator,
     MeteoGaliciaStationDailyCoordinator,
     MeteoGaliciaStationLast10MinCoordinator,
-    async_get_entry_coordinator,
+    async_get_entry_coordinators,
+    async_owns_coordinator_diagnostics,
+    async_release_entry_coordinators,
+)
+from .model import (
+    DayPeriods,
+    Forecast,
+    ForecastDay,
+    Observation,
+    StationMeasure,
+    StationReading,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,10 +84,43 @@ def _build_device_info(domain_key: str, name: str) -> DeviceInfo:
 
 
 class MeteoGaliciaExtraAttrsMixin:
-    """Mixin para exponer atributos extra compartidos."""
+    """Mixin para exponer atributos extra compartidos.
+
+    Los atributos y el estado se memorizan por ``data_version`` del coordinador:
+    entre dos notificaciones las lecturas repetidas reutilizan el mismo valor.
+    Los atributos de diagnóstico cambian en cada actualización, así que no se
+    guardan en el recorder; están disponibles como entidades de diagnóstico.
+    """
+
+    _unrecorded_attributes = frozenset(
+        {
+            const.ATTR_API_LATENCY_MS,
+            const.ATTR_CONNECTED_AT,
+            const.ATTR_DATA_AGE_S,
+            const.ATTR_SCAN_INTERVAL_S,
+        }
+    )
+    _memo_version: int | None = None
+
+    def _memoized(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Devuelve ``compute()`` memorizado para la versión actual de los datos."""
+        version = getattr(self.coordinator, "data_version", None)
+        if version is None:
+            return compute()
+        if self._memo_version != version:
+            self._memo_version = version
+            self._memo = {}
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
 
     @property
     def extra_state_attributes(self):
+        return self._memoized("attributes", self._build_extra_state_attributes)
+
+    def _build_extra_state_attributes(self) -> dict:
         base_attr = getattr(self, "_attr", {}) or {}
         attributes = {
             **base_attr,
@@ -107,8 +161,11 @@ def _get_coordinator_api_latency_ms(coordinator) -> float | str:
 
 
 def _get_coordinator_scan_interval(coordinator) -> float | str:
-    """Devuelve el scan_interval aplicado en segundos."""
-    update_interval = getattr(coordinator, "update_interval", None)
+    """Devuelve el scan_interval configurado en segundos."""
+    # update_interval puede adaptarse a la publicación; se muestra el configurado.
+    update_interval = getattr(coordinator, "scan_interval", None) or getattr(
+        coordinator, "update_interval", None
+    )
     if update_interval is None:
         return STATE_UNKNOWN
     try:
@@ -216,6 +273,7 @@ async def async_setup_entry(hass, entry, add_entities):
     """Configura sensores de MeteoGalicia desde una entrada de configuración."""
     data = _merge_entry_data(entry)
     scan_interval = data.get(CONF_SCAN_INTERVAL)
+    max_stale_age = data.get(const.CONF_MAX_STALE_AGE)
     coordinators = (
         hass.data.setdefault(const.DOMAIN, {})
         .setdefault(entry.entry_id, {})
@@ -231,18 +289,117 @@ async def async_setup_entry(hass, entry, add_entities):
             scan_interval,
             coordinators,
             entry.entry_id,
+            max_stale_age,
         )
     elif data.get(const.CONF_ID_ESTACION, ""):
         id_estacion = data[const.CONF_ID_ESTACION]
+        entry_data = hass.data[const.DOMAIN][entry.entry_id]
+        # Necesarios para aplicar después cambios de medidas sin recargar.
+        entry_data["sensor_platform"] = entity_platform.async_get_current_platform()
+
+        station_entities = entry_data["station_entities"] = {}
+
+        @callback
+        def add_station_entities(entities):
+            station_entities.update((entity.unique_id, entity) for entity in entities)
+            add_entities(entities)
+
+        entry_data["add_station_entities"] = add_station_entities
+        entry_data["measure_watchers"] = {}
+
+        @callback
+        def stop_watching_measures():
+            for remove_listener in entry_data["measure_watchers"].values():
+                remove_listener()
+
+        entry.async_on_unload(stop_watching_measures)
         await setup_id_estacion_platform(
-            id_estacion, data, add_entities, hass, scan_interval, coordinators
+            id_estacion,
+            data,
+            add_station_entities,
+            hass,
+            scan_interval,
+            coordinators,
+            entry.entry_id,
+            max_stale_age,
         )
+        _async_watch_station_measures(hass, entry.entry_id)
         
         
+async def _async_platform_coordinators(
+    hass,
+    coordinator_classes,
+    id_value,
+    scan_interval,
+    coordinators=None,
+    entry_id=None,
+    max_stale_age=None,
+):
+    """Devuelve los coordinadores de la plataforma tras su primera actualización.
+
+    Las primeras consultas se lanzan a la vez, de modo que la plataforma espera por
+    el servicio más lento y no por la suma de todos.
+    """
+    if entry_id is not None:
+        return await async_get_entry_coordinators(
+            hass,
+            entry_id,
+            coordinator_classes,
+            id_value,
+            scan_interval,
+            max_stale_age,
+        )
+    created = [
+        coordinator_class(hass, id_value, scan_interval)
+        for coordinator_class in coordinator_classes
+    ]
+    if coordinators is not None:
+        coordinators.extend(created)
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in created))
+    return created
+
+
 async def setup_id_estacion_platform(
-    id_estacion, config, add_entities, hass, scan_interval, coordinators=None
+    id_estacion,
+    config,
+    add_entities,
+    hass,
+    scan_interval,
+    coordinators=None,
+    entry_id=None,
+    max_stale_age=None,
 ):
     """Configura la plataforma de estación y añade los sensores correspondientes."""
+    entities = await _async_station_entities(
+        id_estacion,
+        config,
+        hass,
+        scan_interval,
+        coordinators,
+        entry_id,
+        max_stale_age,
+    )
+    if entities is None:
+        return False
+    if entities:
+        add_entities(entities)
+        for coordinator in dict.fromkeys(entity.coordinator for entity in entities):
+            coordinator.async_set_updated_data(coordinator.data)
+
+
+async def _async_station_entities(
+    id_estacion,
+    config,
+    hass,
+    scan_interval,
+    coordinators=None,
+    entry_id=None,
+    max_stale_age=None,
+):
+    """Devuelve las entidades de una estación según su configuración.
+
+    Devuelve None si el id de estación no es válido.
+    """
     daily_coordinator = None
     last10min_coordinator = None
     if config.get(const.CONF_ID_ESTACION_MEDIDA_DAILY, ""):
@@ -254,30 +411,47 @@ async def setup_id_estacion_platform(
         id_measure_last10min = config[const.CONF_ID_ESTACION_MEDIDA_LAST10MIN]  
     else:
         id_measure_last10min = None
-    
+
+    slim = bool(config.get(const.CONF_SLIM_STATION_ATTRIBUTES, False))
+
     if not _validate_id(id_estacion, 5, "id_estacion"):
         _LOGGER.debug(
             "%s Configurado (YAML) 'id_estacion' '%s' no es válido",
             const.LOG_PREFIX,
             id_estacion,
         )
-        return False
+        return None
     else:
         entities = []
-
-        if (
-            (id_measure_daily is None and id_measure_last10min is None)
-            or id_measure_daily is not None
+        all_measures = id_measure_daily is None and id_measure_last10min is None
+        coordinator_classes = []
+        if all_measures or id_measure_daily is not None:
+            coordinator_classes.append(MeteoGaliciaStationDailyCoordinator)
+        if all_measures or id_measure_last10min is not None:
+            coordinator_classes.append(MeteoGaliciaStationLast10MinCoordinator)
+        # Los servicios necesarios se consultan a la vez.
+        for coordinator in await _async_platform_coordinators(
+            hass,
+            coordinator_classes,
+            id_estacion,
+            scan_interval,
+            coordinators,
+            entry_id,
+            max_stale_age,
         ):
-            daily_coordinator = MeteoGaliciaStationDailyCoordinator(
-                hass, id_estacion, scan_interval
-            )
-            if coordinators is not None:
-                coordinators.append(daily_coordinator)
-            await daily_coordinator.async_refresh()
+            if isinstance(coordinator, MeteoGaliciaStationDailyCoordinator):
+                daily_coordinator = coordinator
+            else:
+                last10min_coordinator = coordinator
+
+        if daily_coordinator is not None:
             entities.append(
                 MeteoGaliciaDailyDataByStationSensor(
-                    id_estacion, id_estacion, id_measure_daily, daily_coordinator
+                    id_estacion,
+                    id_estacion,
+                    id_measure_daily,
+                    daily_coordinator,
+                    slim,
                 )
             )
             if id_measure_daily is None:
@@ -294,19 +468,14 @@ async def setup_id_estacion_platform(
                 id_measure_daily,
             )
 
-        if (
-            (id_measure_daily is None and id_measure_last10min is None)
-            or id_measure_last10min is not None
-        ):
-            last10min_coordinator = MeteoGaliciaStationLast10MinCoordinator(
-                hass, id_estacion, scan_interval
-            )
-            if coordinators is not None:
-                coordinators.append(last10min_coordinator)
-            await last10min_coordinator.async_refresh()
+        if last10min_coordinator is not None:
             entities.append(
                 MeteoGaliciaLast10MinDataByStationSensor(
-                    id_estacion, id_estacion, id_measure_last10min, last10min_coordinator
+                    id_estacion,
+                    id_estacion,
+                    id_measure_last10min,
+                    last10min_coordinator,
+                    slim,
                 )
             )
             if id_measure_last10min is None:
@@ -324,11 +493,163 @@ async def setup_id_estacion_platform(
             )
 
         if entities:
-            add_entities(entities)
-            if daily_coordinator is not None:
-                daily_coordinator.async_set_updated_data(daily_coordinator.data)
-            if last10min_coordinator is not None:
-                last10min_coordinator.async_set_updated_data(last10min_coordinator.data)
+            for coordinator in (daily_coordinator, last10min_coordinator):
+                if coordinator is None or entry_id is None:
+                    continue
+                reading = coordinator.model
+                entities.extend(
+                    _coordinator_diagnostic_entities(
+                        hass,
+                        entry_id,
+                        coordinator,
+                        f"station_{id_estacion}",
+                        (reading.station if reading else None) or id_estacion,
+                    )
+                )
+        return entities
+
+
+async def async_apply_station_options(hass, entry, config) -> None:
+    """Aplica en caliente un cambio de medidas o del modo reducido de una estación.
+
+    Sólo se eliminan o añaden las entidades afectadas; el resto conserva su
+    estado, y los coordinadores que dejan de usarse se liberan. Mientras se
+    mantengan las entidades por medida, se conservan también las de códigos que
+    la estación ha publicado aunque falten en los datos actuales.
+    """
+    entry_data = hass.data[const.DOMAIN][entry.entry_id]
+    current = entry_data["station_entities"]
+    coordinators = entry_data["coordinators"]
+    wanted = {
+        entity.unique_id: entity
+        for entity in await _async_station_entities(
+            config[const.CONF_ID_ESTACION],
+            config,
+            hass,
+            config.get(CONF_SCAN_INTERVAL),
+            coordinators,
+            entry.entry_id,
+            config.get(const.CONF_MAX_STALE_AGE),
+        )
+        or ()
+    }
+
+    all_measures = not (
+        config.get(const.CONF_ID_ESTACION_MEDIDA_DAILY)
+        or config.get(const.CONF_ID_ESTACION_MEDIDA_LAST10MIN)
+    )
+    registry = er.async_get(hass)
+    for unique_id in [
+        unique_id
+        for unique_id, entity in current.items()
+        if unique_id not in wanted
+        and not (all_measures and _is_known_measure_entity(entity))
+    ]:
+        entity = current.pop(unique_id)
+        # Las entidades deshabilitadas nunca llegan a añadirse a Home Assistant.
+        if entity.hass is not None:
+            await entity.async_remove(force_remove=True)
+        entity_id = registry.async_get_entity_id("sensor", const.DOMAIN, unique_id)
+        if entity_id is not None:
+            registry.async_remove(entity_id)
+
+    for unique_id, entity in current.items():
+        if not isinstance(entity, BaseStationSensor):
+            continue
+        slim = wanted[unique_id].slim
+        if entity.slim != slim:
+            entity.async_set_slim(slim)
+
+    added = [entity for unique_id, entity in wanted.items() if unique_id not in current]
+    if added:
+        await entry_data["sensor_platform"].async_add_entities(added)
+        current.update((entity.unique_id, entity) for entity in added)
+        for entity in added:
+            if entity.hass is not None:
+                entity._handle_coordinator_update()
+
+    used = {id(entity.coordinator) for entity in current.values()}
+    unused = [item for item in coordinators if id(item) not in used]
+    if unused:
+        coordinators[:] = [item for item in coordinators if id(item) in used]
+        watchers = entry_data["measure_watchers"]
+        for coordinator in unused:
+            if (remove_listener := watchers.pop(coordinator, None)) is not None:
+                remove_listener()
+        await async_release_entry_coordinators(hass, entry.entry_id, unused)
+    _async_watch_station_measures(hass, entry.entry_id)
+
+
+def _is_known_measure_entity(entity) -> bool:
+    """Indica si es una entidad de medida cuyo código ya publicó la estación."""
+    tracker = getattr(entity.coordinator, "measure_tracker", None)
+    return (
+        isinstance(entity, MeteoGaliciaStationMeasureSensor)
+        and tracker is not None
+        and entity.measure_code in tracker.known_codes
+    )
+
+
+@callback
+def _async_watch_station_measures(hass, entry_id) -> None:
+    """Añade entidades de medida cuando la estación publica códigos nuevos.
+
+    Cada coordinador de la entrada avisa sólo de los códigos que no había
+    publicado antes o que vuelve a publicar tras faltar, así que el coste por
+    actualización depende de esos códigos y no del total de medidas. Los que ya
+    tienen entidad se ignoran; el resto, p. ej. los quitados mientras faltaban,
+    se añaden de nuevo.
+    """
+    entry_data = hass.data[const.DOMAIN][entry_id]
+    watchers = entry_data["measure_watchers"]
+    for coordinator in entry_data["coordinators"]:
+        if coordinator in watchers or coordinator.measure_tracker is None:
+            continue
+
+        @callback
+        def add_new_measures(measures, coordinator=coordinator):
+            config = entry_data["config"]
+            # Con una medida principal configurada no hay entidades por medida.
+            if config.get(const.CONF_ID_ESTACION_MEDIDA_DAILY) or config.get(
+                const.CONF_ID_ESTACION_MEDIDA_LAST10MIN
+            ):
+                return
+            reading = coordinator.model
+            source = (
+                "daily"
+                if isinstance(coordinator, MeteoGaliciaStationDailyCoordinator)
+                else "last_10_min"
+            )
+            registry = er.async_get(hass)
+            entities = [
+                entity
+                for entity in (
+                    MeteoGaliciaStationMeasureSensor(
+                        coordinator.id,
+                        (reading.station if reading else None) or coordinator.id,
+                        source,
+                        measure,
+                        coordinator,
+                    )
+                    for measure in measures
+                )
+                if entity.unique_id not in entry_data["station_entities"]
+                and not _registered_to_other_entry(
+                    registry, entity.unique_id, entry_id
+                )
+            ]
+            if entities:
+                _LOGGER.info(
+                    "%s Nuevas medidas en la estación '%s': %s",
+                    const.LOG_PREFIX,
+                    coordinator.id,
+                    ", ".join(entity.unique_id for entity in entities),
+                )
+                entry_data["add_station_entities"](entities)
+
+        watchers[coordinator] = coordinator.async_add_measure_listener(
+            add_new_measures
+        )
 
 
 async def setup_id_concello_platform(
@@ -338,6 +659,7 @@ async def setup_id_concello_platform(
     scan_interval,
     coordinators=None,
     entry_id=None,
+    max_stale_age=None,
 ):
         """Configura la plataforma de concello y añade los sensores correspondientes."""
         # id_concello must to have 5 chars and be a number
@@ -347,48 +669,28 @@ async def setup_id_concello_platform(
             )
             return False
         else:
-            if entry_id is not None:
-                forecast_coordinator = await async_get_entry_coordinator(
-                    hass,
-                    entry_id,
-                    MeteoGaliciaForecastCoordinator,
-                    id_concello,
-                    scan_interval,
-                )
-            else:
-                forecast_coordinator = MeteoGaliciaForecastCoordinator(
-                    hass, id_concello, scan_interval
-                )
-                if coordinators is not None:
-                    coordinators.append(forecast_coordinator)
-                await forecast_coordinator.async_refresh()
-            if (
-                not forecast_coordinator.last_update_success
-                or not forecast_coordinator.data
-                or not forecast_coordinator.data.get("predConcello")
-            ):
+            # La predicción y la observación se consultan a la vez.
+            (
+                forecast_coordinator,
+                observation_coordinator,
+            ) = await _async_platform_coordinators(
+                hass,
+                (MeteoGaliciaForecastCoordinator, MeteoGaliciaObservationCoordinator),
+                id_concello,
+                scan_interval,
+                coordinators,
+                entry_id,
+                max_stale_age,
+            )
+            forecast = forecast_coordinator.model
+            if not forecast_coordinator.last_update_success or forecast is None:
                 raise PlatformNotReady
 
-            name = forecast_coordinator.data["predConcello"].get("nome")
+            name = forecast.name
             if not name:
                 raise PlatformNotReady
 
-            if entry_id is not None:
-                observation_coordinator = await async_get_entry_coordinator(
-                    hass,
-                    entry_id,
-                    MeteoGaliciaObservationCoordinator,
-                    id_concello,
-                    scan_interval,
-                )
-            else:
-                observation_coordinator = MeteoGaliciaObservationCoordinator(
-                    hass, id_concello, scan_interval
-                )
-                if coordinators is not None:
-                    coordinators.append(observation_coordinator)
-                await observation_coordinator.async_refresh()
-            
+
             forecast_temperature_by_day_sensor_config= [
                 ("Today", 0, "tMax"),
                 ("Today", 0, "tMin"),
@@ -441,6 +743,13 @@ async def setup_id_concello_platform(
             _LOGGER.info(
                 "%s Añadido sensor de temperatura para '%s' con id '%s'", const.LOG_PREFIX, name, id_concello
             )
+            if entry_id is not None:
+                for coordinator in (forecast_coordinator, observation_coordinator):
+                    entities.extend(
+                        _coordinator_diagnostic_entities(
+                            hass, entry_id, coordinator, f"concello_{id_concello}", name
+                        )
+                    )
             add_entities(entities)
             forecast_coordinator.async_set_updated_data(forecast_coordinator.data)
             observation_coordinator.async_set_updated_data(observation_coordinator.data)
@@ -478,29 +787,29 @@ class MeteoGaliciaForecastTemperatureByDaySensor(
         else:
             self.forecast_field_name = f"{self.forecast_field} no definido"
 
-    def _update_from_data(self, data) -> None:
-        if not self.coordinator.last_update_success:
-            self._state = None
-            self._attr = {}
-            return
-        if not data or data.get("predConcello") is None:
+    def _update_from_model(self, forecast: Forecast | None) -> None:
+        day = _forecast_day(self.coordinator, forecast, self.forecast_day)
+        if day is None:
             self._state = None
             self._attr = {}
             return
 
-        item = data.get("predConcello")["listaPredDiaConcello"][self.forecast_day]
-        state = item.get(self.forecast_field, "null")
+        state = (
+            day.max_temperature
+            if self.forecast_field == "tMax"
+            else day.min_temperature
+        )
         if state == -9999:
             state = None
 
         self._state = state
         self._attr = {
             **_base_attrs(self.id),
-            const.ATTR_FORECAST_DATE: item.get("dataPredicion"),
+            const.ATTR_FORECAST_DATE: day.date,
         }
 
     def _handle_coordinator_update(self) -> None:
-        self._update_from_data(self.coordinator.data)
+        self._update_from_model(self.coordinator.model)
         super()._handle_coordinator_update()
 
     @property
@@ -557,34 +866,25 @@ class MeteoGaliciaForecastRainByDaySensor(
         self._state = None
         self._attr = {}
 
-    def _update_from_data(self, data) -> None:
-        if not self.coordinator.last_update_success:
-            self._state = None
-            self._attr = {}
-            return
-        if not data or data.get("predConcello") is None:
+    def _update_from_model(self, forecast: Forecast | None) -> None:
+        day = _forecast_day(self.coordinator, forecast, self.forecast_day)
+        if day is None:
             self._state = None
             self._attr = {}
             return
 
-        item = data.get("predConcello")["listaPredDiaConcello"][self.forecast_day]
-        pchoiva = item.get("pchoiva")
-        if not isinstance(pchoiva, dict):
-            pchoiva = {}
-
-        state = get_state_forecast_rain_by_day_sensor(self.max_value, item)
-
-        self._state = state
+        rain = day.rain or DayPeriods(None, None, None)
+        self._state = get_state_forecast_rain_by_day_sensor(self.max_value, day)
         self._attr = {
             **_base_attrs(self.id),
-            const.ATTR_FORECAST_DATE: item.get("dataPredicion"),
-            const.ATTR_RAIN_PROB_NOON: pchoiva.get("manha"),
-            const.ATTR_RAIN_PROB_AFTERNOON: pchoiva.get("tarde"),
-            const.ATTR_RAIN_PROB_NIGHT: pchoiva.get("noite"),
+            const.ATTR_FORECAST_DATE: day.date,
+            const.ATTR_RAIN_PROB_NOON: rain.morning,
+            const.ATTR_RAIN_PROB_AFTERNOON: rain.afternoon,
+            const.ATTR_RAIN_PROB_NIGHT: rain.night,
         }
 
     def _handle_coordinator_update(self) -> None:
-        self._update_from_data(self.coordinator.data)
+        self._update_from_model(self.coordinator.model)
         super()._handle_coordinator_update()
 
     @property
@@ -634,33 +934,23 @@ class MeteoGaliciaTemperatureSensor(
         self._state = None
         self._attr = {}
 
-    def _update_from_data(self, data) -> None:
-        if not self.coordinator.last_update_success:
-            self._state = None
-            self._attr = {}
-            return
-        if not data or data.get("listaObservacionConcellos") is None:
+    def _update_from_model(self, observation: Observation | None) -> None:
+        if not self.coordinator.last_update_success or observation is None:
             self._state = None
             self._attr = {}
             return
 
-        item = _get_first_list_item(data, "listaObservacionConcellos")
-        if item is None:
-            self._state = None
-            self._attr = {}
-            return
-
-        self._state = item.get("temperatura", "null")
+        self._state = observation.temperature
         self._attr = {
             **_base_attrs(self.id),
-            "local_date": item.get("dataLocal"),
-            "utc_date": item.get("dataUTC"),
-            "temperature_feeling": item.get("sensacionTermica"),
-            "reference": item.get("nomeConcello"),
+            "local_date": observation.local_date,
+            "utc_date": observation.utc_date,
+            "temperature_feeling": observation.apparent_temperature,
+            "reference": observation.reference,
         }
 
     def _handle_coordinator_update(self) -> None:
-        self._update_from_data(self.coordinator.data)
+        self._update_from_model(self.coordinator.model)
         super()._handle_coordinator_update()
 
     @property
@@ -711,30 +1001,39 @@ class MeteoGaliciaTemperatureSensor(
 
 
 
-def get_state_forecast_rain_by_day_sensor(max_value: bool, item: dict) -> int | None:
+def _forecast_day(coordinator, forecast: Forecast | None, index: int):
+    """Devuelve el día de previsión pedido, o None si no está disponible."""
+    if not coordinator.last_update_success or forecast is None:
+        return None
+    if index >= len(forecast.days):
+        return None
+    return forecast.days[index]
+
+
+def get_state_forecast_rain_by_day_sensor(
+    max_value: bool, day: ForecastDay
+) -> int | None:
     """Obtiene el valor de estado correcto para la lluvia prevista."""
-    pchoiva = item.get("pchoiva")
-    if not isinstance(pchoiva, dict):
+    rain = day.rain
+    if rain is None:
         return None
 
     if max_value:
         # Si max_value es True, se elige el valor máximo disponible.
-        values = [pchoiva.get("manha"), pchoiva.get("tarde"), pchoiva.get("noite")]
-        values = [value for value in values if value is not None]
+        values = [value for value in rain.values() if value is not None]
         if not values:
             return None
         state = max(values)
     else:
         # Si max_value es False, se usa el tramo horario actual.
-        field = "manha"  # tramo mañana: 6-14 h
+        state = rain.morning  # tramo mañana: 6-14 h
         hour = int(dt.now().strftime("%H"))
         if hour >= 21:
-            field = "noite"  # tramo noche: 21-6 h
+            state = rain.night  # tramo noche: 21-6 h
         elif hour >= 14:
-            field = "tarde"  # tramo tarde: 14-21 h
+            state = rain.afternoon  # tramo tarde: 14-21 h
         elif hour < 6:
-            field = "noite"  # tramo noche: 21-6 h
-        state = pchoiva.get(field)
+            state = rain.night  # tramo noche: 21-6 h
 
     if state is not None and state < 0:
         # A veces el servicio devuelve -9999 si el dato no está disponible.
@@ -749,45 +1048,61 @@ class BaseStationSensor(MeteoGaliciaExtraAttrsMixin, CoordinatorEntity, SensorEn
 
     _attr_attribution = ATTRIBUTION
 
-    def __init__(self, name, ids, id_measure, coordinator, name_suffix_label: str):
+    def __init__(
+        self, name, ids, id_measure, coordinator, name_suffix_label: str, slim=False
+    ):
         super().__init__(coordinator)
         self._name = name
         self.id = ids
         self.id_measure = id_measure
+        # Modo reducido: sólo la medida principal como atributo; el resto ya lo
+        # publican las entidades de medida.
+        self.slim = slim
         self._state = None
         self._attr = {}
         self.name_suffix = "" if id_measure is None else f"_{id_measure}"
         self.measure_unit = None
         self._name_suffix_label = name_suffix_label
 
-    def _extract_source(self, data):
-        """Debe devolver (station, lista_medidas, extra_attr_dict, warning_message or None)."""
+    def _extra_attrs(self, reading: StationReading) -> dict:
+        """Debe devolver los atributos propios de la fuente de datos."""
         raise NotImplementedError
 
-    def _update_from_data(self, data) -> None:
+    def _update_from_model(self, reading: StationReading | None) -> None:
         if not self.coordinator.last_update_success:
             self._state = None
             self.measure_unit = None
             self._attr = {}
             return
 
-        station, lista_medidas, extra_attrs, warning_msg = self._extract_source(data)
-        if station is None:
+        if reading is None:
             self._state = None
             self.measure_unit = None
             self._attr = {}
-            if warning_msg:
-                _LOGGER.warning(warning_msg, self.id)
+            _LOGGER.warning(
+                "No se pueden descargar los datos solicitados de MeteoGalicia: el id de estaci?n %s no existe o hay un posible problema de conexi?n.",
+                self.id,
+            )
             return
 
-        self._attr = {**_base_attrs(self.id), **extra_attrs}
-        self._name = station.get("estacion", self._name)
-        _apply_station_measures(self, lista_medidas)
+        self._attr = {**_base_attrs(self.id), **self._extra_attrs(reading)}
+        if reading.station is not None:
+            self._name = reading.station
+        _apply_station_measures(self, reading)
 
     def _handle_coordinator_update(self) -> None:
-        self._update_from_data(self.coordinator.data)
+        self._update_from_model(self.coordinator.model)
         super()._handle_coordinator_update()
 
+    @callback
+    def async_set_slim(self, slim: bool) -> None:
+        """Cambia el modo reducido de atributos y publica el nuevo estado."""
+        self.slim = slim
+        # Los atributos memorizados se calcularon con el modo anterior.
+        self._memo_version = None
+        if self.hass is not None:
+            self._handle_coordinator_update()
+
     @property
     def name(self) -> str:
         """Devuelve el nombre."""
@@ -824,75 +1139,39 @@ class BaseStationSensor(MeteoGaliciaExtraAttrsMixin, CoordinatorEntity, SensorEn
 class MeteoGaliciaDailyDataByStationSensor(BaseStationSensor):  # pylint: disable=missing-docstring
     """Sensor de datos diarios por estaci?n."""
 
-    def __init__(self, name, ids, id_measure, coordinator):
-        super().__init__(name, ids, id_measure, coordinator, "Station Daily Data")
+    def __init__(self, name, ids, id_measure, coordinator, slim=False):
+        super().__init__(
+            name, ids, id_measure, coordinator, "Station Daily Data", slim
+        )
 
-    def _extract_source(self, data):
-        item = _get_first_list_item(data, "listDatosDiarios")
-        if item is None:
-            return None, None, None, (
-                "No se pueden descargar los datos solicitados de MeteoGalicia: el id de estaci?n %s no existe o hay un posible problema de conexi?n."
-            )
-        station = _get_first_list_item(item, "listaEstacions")
-        if station is None:
-            return None, None, None, None
-        lista_medidas = station.get("listaMedidas")
-        extra = {
-            "data": item.get("data"),
-            "concello": station.get("concello"),
-            "estacion": station.get("estacion"),
+    def _extra_attrs(self, reading: StationReading) -> dict:
+        return {
+            "data": reading.date,
+            "concello": reading.concello,
+            "estacion": reading.station,
         }
-        return station, lista_medidas, extra, None
 
 
 class MeteoGaliciaLast10MinDataByStationSensor(BaseStationSensor):  # pylint: disable=missing-docstring
     """Sensor de datos de los ?ltimos 10 minutos por estaci?n."""
 
-    def __init__(self, name, ids, id_measure, coordinator):
-        super().__init__(name, ids, id_measure, coordinator, "Station Last 10 min Data")
+    def __init__(self, name, ids, id_measure, coordinator, slim=False):
+        super().__init__(
+            name, ids, id_measure, coordinator, "Station Last 10 min Data", slim
+        )
 
-    def _extract_source(self, data):
-        item = _get_first_list_item(data, "listUltimos10min")
-        if item is None:
-            return None, None, None, (
-                "No se pueden descargar los datos solicitados de MeteoGalicia: el id de estaci?n %s no existe o hay un posible problema de conexi?n."
-            )
-        lista_medidas = item.get("listaMedidas")
-        extra = {
-            "instanteLecturaUTC": item.get("instanteLecturaUTC"),
-            "idEstacion": item.get("idEstacion"),
-            "estacion": item.get("estacion"),
+    def _extra_attrs(self, reading: StationReading) -> dict:
+        return {
+            "instanteLecturaUTC": reading.reading_time,
+            "idEstacion": reading.station_id,
+            "estacion": reading.station,
         }
-        return item, lista_medidas, extra, None
-
-
-_STATION_SOURCE_CONFIG = {
-    "daily": {
-        "translation_key": "station_measure_daily",
-        "payload_key": "listDatosDiarios",
-    },
-    "last_10_min": {
-        "translation_key": "station_measure_last_10_min",
-        "payload_key": "listUltimos10min",
-    },
-}
 
 
-def _station_source(data: dict, source: str) -> tuple[dict | None, list[dict]]:
-    """Return the station record and measures for one API source."""
-    source_config = _STATION_SOURCE_CONFIG[source]
-    item = _get_first_list_item(data, source_config["payload_key"])
-    if item is None:
-        return None, []
-    station = (
-        _get_first_list_item(item, "listaEstacions")
-        if source == "daily"
-        else item
-    )
-    if not isinstance(station, dict):
-        return None, []
-    measures = station.get("listaMedidas")
-    return station, measures if isinstance(measures, list) else []
+_STATION_SOURCE_TRANSLATION_KEYS = {
+    "daily": "station_measure_daily",
+    "last_10_min": "station_measure_last_10_min",
+}
 
 
 def _normalise_station_unit(unit: str | None) -> str | None:
@@ -930,16 +1209,15 @@ def _station_measure_device_class(code: str) -> SensorDeviceClass | None:
 
 
 def _station_measure_description(
-    measure: dict, source: str
+    measure: StationMeasure, source: str
 ) -> SensorEntityDescription:
     """Build a typed description for a station measure returned by the API."""
-    code = str(measure.get("codigoParametro") or "unknown")
-    name = str(measure.get("nomeParametro") or code)
+    code = measure.code
     return SensorEntityDescription(
         key=f"{source}_{code}",
-        translation_key=_STATION_SOURCE_CONFIG[source]["translation_key"],
-        translation_placeholders={"measure": name},
-        native_unit_of_measurement=_normalise_station_unit(measure.get("unidade")),
+        translation_key=_STATION_SOURCE_TRANSLATION_KEYS[source],
+        translation_placeholders={"measure": measure.name},
+        native_unit_of_measurement=_normalise_station_unit(measure.unit),
         device_class=_station_measure_device_class(code),
         state_class=(
             SensorStateClass.TOTAL
@@ -949,16 +1227,6 @@ def _station_measure_description(
     )
 
 
-def _valid_station_measure_value(measure: dict | None):
-    """Return only original or interpolated station measurements."""
-    if not isinstance(measure, dict):
-        return None
-    value = measure.get("valor")
-    if measure.get("lnCodigoValidacion") not in (1, 5) or value == -9999:
-        return None
-    return value
-
-
 class MeteoGaliciaStationMeasureSensor(
     MeteoGaliciaExtraAttrsMixin, CoordinatorEntity, SensorEntity
 ):
@@ -972,7 +1240,7 @@ class MeteoGaliciaStationMeasureSensor(
         super().__init__(coordinator)
         self._station_id = station_id
         self._source = source
-        self._measure_code = str(measure.get("codigoParametro"))
+        self._measure_code = measure.code
         self._attr_unique_id = (
             f"meteogalicia_station_{station_id}_{source}_{self._measure_code}"
         )
@@ -989,58 +1257,45 @@ class MeteoGaliciaStationMeasureSensor(
     @property
     def native_value(self):
         """Return the current value for this entity's measure code."""
-        _, measures = _station_source(self.coordinator.data, self._source)
-        measure = next(
-            (
-                item
-                for item in measures
-                if item.get("codigoParametro") == self._measure_code
-            ),
-            None,
-        )
-        return _valid_station_measure_value(measure)
+        return self._memoized("native_value", self._current_value)
+
+    @property
+    def measure_code(self) -> str:
+        """Return the MeteoGalicia code of this entity's measure."""
+        return self._measure_code
+
+    def _current_value(self):
+        reading = self.coordinator.model
+        if reading is None:
+            return None
+        return reading.valid_values.get(self._measure_code)
 
 
 def _station_measure_entities(station_id, coordinator, source):
     """Create one entity per distinct measure while preserving legacy sensors."""
-    station, measures = _station_source(coordinator.data, source)
-    if station is None:
+    reading = coordinator.model
+    if reading is None:
         return []
-    station_name = station.get("estacion", station_id)
-    entities = []
-    seen_codes = set()
-    for measure in measures:
-        code = measure.get("codigoParametro")
-        if not code or code in seen_codes:
-            continue
-        seen_codes.add(code)
-        entities.append(
-            MeteoGaliciaStationMeasureSensor(
-                station_id, station_name, source, measure, coordinator
-            )
+    station_name = reading.station or station_id
+    return [
+        MeteoGaliciaStationMeasureSensor(
+            station_id, station_name, source, measure, coordinator
         )
-    return entities
-
-
+        for measure in reading.measures.values()
+    ]
 
 
-def _get_first_list_item(container: dict, list_key: str):
-    """Devuelve el primer elemento de una lista en un dict o None si falta."""
-    if not isinstance(container, dict):
-        return None
-    items = container.get(list_key)
-    if not items:
-        return None
-    return items[0]
-
-
-def _apply_station_measures(entity, lista_medidas: list[dict]):
+def _apply_station_measures(entity, reading: StationReading):
     """Rellena atributos, estado y unidad a partir de las medidas de la estación."""
-    if not lista_medidas:
+    if not reading.measures:
         entity._state = None
         entity.measure_unit = None
         return
-    entity._attr = add_attributes_from_measures(lista_medidas, entity._attr)
+    measures = reading.measures.values()
+    if entity.slim:
+        main = reading.measures.get(entity.id_measure)
+        measures = (main,) if main is not None else ()
+    entity._attr = add_attributes_from_measures(measures, entity._attr)
     entity._state = get_state_station_sensor(entity.id_measure, entity._attr, entity.id)
     entity.measure_unit = get_measure_unit_station_sensor(entity.id_measure, entity._attr, entity.id)
 
@@ -1078,16 +1333,147 @@ def get_measure_unit_station_sensor(id_measure: str | None, attributes: dict, id
     return measure_unit
 
 
-def add_attributes_from_measures(lista_medidas: list[dict], attributes: dict) -> dict:
+def add_attributes_from_measures(
+    medidas: Iterable[StationMeasure], attributes: dict
+) -> dict:
     """Añade atributos desde las medidas recibidas para un sensor de estación."""
     attr = attributes
-    for medida in lista_medidas:
+    for medida in medidas:
         #Chequeo si el dato recogido es válido o no.
         #En la documentación 1 es dato valido original, y 5 dato valido interpolado
         #Si el valor es -9999 es un valor inválido, por lo que no devolvemos el valor del atributo
-        if (medida.get("lnCodigoValidacion") in (1,5) ):
-            attr[medida.get("codigoParametro")+"_value"] = medida.get("valor")
-            attr[medida.get("codigoParametro")+"_unit"] = medida.get("unidade")
-        if (medida.get("valor") == -9999 ):
-            attr[medida.get("codigoParametro")+"_value"] = None
+        if medida.validation in (1, 5):
+            attr[medida.code + "_value"] = medida.value
+            attr[medida.code + "_unit"] = medida.unit
+        if medida.value == -9999:
+            attr[medida.code + "_value"] = None
     return attr
+
+
+_DIAGNOSTIC_SOURCES = {
+    "forecast": "forecast",
+    "observation": "observation",
+    "station_daily": "daily",
+    "station_last10min": "last 10 min",
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeteoGaliciaDiagnosticDescription(SensorEntityDescription):
+    """Describe one diagnostic value of a MeteoGalicia coordinator."""
+
+    value_fn: Callable[[BaseMeteoGaliciaCoordinator], Any]
+    supported_fn: Callable[[BaseMeteoGaliciaCoordinator], bool] = lambda _: True
+
+
+def _api_latency(coordinator) -> float | None:
+    latency = coordinator.last_api_latency_ms
+    return round(float(latency), 1) if latency is not None else None
+
+
+def _last_connection(coordinator) -> datetime | None:
+    connected_at = coordinator.last_api_connected_at
+    return datetime.fromisoformat(connected_at) if connected_at else None
+
+
+def _scan_interval(coordinator) -> float | None:
+    interval = coordinator.scan_interval
+    return interval.total_seconds() if interval is not None else None
+
+
+_DIAGNOSTIC_DESCRIPTIONS = (
+    MeteoGaliciaDiagnosticDescription(
+        key="api_latency",
+        translation_key="api_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_api_latency,
+    ),
+    MeteoGaliciaDiagnosticDescription(
+        key="last_connection",
+        translation_key="last_connection",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_last_connection,
+    ),
+    MeteoGaliciaDiagnosticDescription(
+        key="data_timestamp",
+        translation_key="data_timestamp",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: coordinator.data_timestamp_utc,
+        supported_fn=lambda coordinator: coordinator.tracks_data_timestamp,
+    ),
+    MeteoGaliciaDiagnosticDescription(
+        key="scan_interval",
+        translation_key="scan_interval",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        value_fn=_scan_interval,
+    ),
+)
+
+
+class MeteoGaliciaCoordinatorDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Opt-in diagnostic value shared by every entity of one coordinator."""
+
+    entity_description: MeteoGaliciaDiagnosticDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator,
+        description: MeteoGaliciaDiagnosticDescription,
+        device_key: str,
+        device_name: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = _diagnostic_unique_id(coordinator, description.key)
+        self._attr_translation_placeholders = {
+            "source": _DIAGNOSTIC_SOURCES[coordinator.endpoint]
+        }
+        self._attr_device_info = _build_device_info(device_key, device_name)
+
+    @property
+    def available(self) -> bool:
+        """Diagnostics stay available while the coordinator is failing."""
+        return True
+
+    @property
+    def native_value(self):
+        """Return the current diagnostic value of the coordinator."""
+        return self.entity_description.value_fn(self.coordinator)
+
+
+def _diagnostic_unique_id(coordinator, key: str) -> str:
+    """Return one unique id per shared coordinator and diagnostic value."""
+    return f"meteogalicia_{coordinator.endpoint}_{coordinator.id}_{key}"
+
+
+def _registered_to_other_entry(registry, unique_id, entry_id) -> bool:
+    """Return True if another entry already registered this unique id."""
+    entity_id = registry.async_get_entity_id("sensor", const.DOMAIN, unique_id)
+    if entity_id is None:
+        return False
+    return registry.async_get(entity_id).config_entry_id not in (None, entry_id)
+
+
+def _coordinator_diagnostic_entities(
+    hass, entry_id, coordinator, device_key, device_name
+):
+    """Create the diagnostic entities of a coordinator once, for its owner entry.
+
+    Coordinators are shared by every entry using the same resource; only the
+    entry that owns the shared coordinator's diagnostics creates them.
+    """
+    if not async_owns_coordinator_diagnostics(hass, entry_id, coordinator):
+        return []
+    return [
+        MeteoGaliciaCoordinatorDiagnosticSensor(
+            coordinator, description, device_key, device_name
+        )
+        for description in _DIAGNOSTIC_DESCRIPTIONS
+        if description.supported_fn(coordinator)
+    ]
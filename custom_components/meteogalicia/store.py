@@ -0,0 +1,100 @@
+"""Persisted copy of the last good MeteoGalicia payloads."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import const
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.payloads"
+# Coalesce the writes of every coordinator into one file write.
+SAVE_DELAY = 60
+# Older payloads are not worth showing while the live refresh runs.
+MAX_PAYLOAD_AGE = timedelta(hours=48)
+
+
+def _record_key(endpoint: str, resource_id: str) -> str:
+    return f"{endpoint}_{resource_id}"
+
+
+class MeteoGaliciaPayloadStore:
+    """Last good payload of every coordinator, saved across restarts.
+
+    Coordinators are seeded from this store at startup so their entities get a
+    state immediately, while the first live refresh runs in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._records: dict[str, dict[str, Any]] | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored payloads once, dropping those that are too old."""
+        if self._records is not None:
+            return
+        stored = await self._store.async_load() or {}
+        if self._records is not None:
+            return
+        oldest = datetime.now(timezone.utc) - MAX_PAYLOAD_AGE
+        records = {}
+        for key, record in stored.get("payloads", {}).items():
+            try:
+                saved_at = datetime.fromisoformat(record["saved_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if saved_at >= oldest:
+                records[key] = record
+        self._records = records
+        _LOGGER.debug("Loaded %d stored MeteoGalicia payload(s)", len(records))
+
+    @callback
+    def async_get(self, endpoint: str, resource_id: str) -> dict[str, Any] | None:
+        """Return the stored record for an endpoint and id, if any."""
+        if self._records is None:
+            return None
+        return self._records.get(_record_key(endpoint, resource_id))
+
+    @callback
+    def async_save_payload(
+        self,
+        endpoint: str,
+        resource_id: str,
+        data: Any,
+        data_timestamp: str | None,
+        schedule: dict | None = None,
+    ) -> None:
+        """Remember a good payload and schedule a delayed write.
+
+        ``schedule`` is the state learnt by the coordinator's polling schedule.
+        """
+        if self._records is None:
+            return
+        self._records[_record_key(endpoint, resource_id)] = {
+            "data": data,
+            "data_timestamp": data_timestamp,
+            "schedule": schedule,
+            "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"payloads": self._records or {}}
+
+
+@callback
+def async_get_payload_store(hass: HomeAssistant) -> MeteoGaliciaPayloadStore:
+    """Return the domain payload store, creating it on first use."""
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    store = domain_data.get(const.DATA_PAYLOAD_STORE)
+    if store is None:
+        store = domain_data[const.DATA_PAYLOAD_STORE] = MeteoGaliciaPayloadStore(hass)
+    return store
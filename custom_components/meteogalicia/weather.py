@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.weather import WeatherEntity, WeatherEntityFeature
 from homeassistant.const import CONF_SCAN_INTERVAL, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import const
 from .coordinator import (
     MeteoGaliciaForecastCoordinator,
     MeteoGaliciaObservationCoordinator,
-    async_get_entry_coordinator,
+    async_get_entry_coordinators,
 )
+from .entity import MeteoGaliciaMultiCoordinatorEntity
+from .model import DayPeriods, ForecastDay, Observation
 
 ATTRIBUTION = "Data provided by MeteoGalicia"
 
@@ -48,6 +52,12 @@ _CONDITION_BY_CODE = {
     25: "cloudy",
 }
 
+# Forecast types served from the forecast coordinator's payload.
+_FORECAST_TYPES = ("daily", "twice_daily")
+# MeteoGalicia's morning starts around 07:00 and its night around 21:00.
+_DAYTIME_START_HOUR = 7
+_NIGHT_START_HOUR = 21
+
 
 def _merge_entry_data(entry) -> dict[str, Any]:
     """Merge config entry data and options, allowing options to clear values."""
@@ -76,47 +86,68 @@ def _valid_value(value: Any) -> Any:
     return None if value == -9999 else value
 
 
-def _maximum_probability(item: dict[str, Any]) -> int | None:
-    """Return the maximum valid rain probability for a forecast day."""
-    probabilities = item.get("pchoiva")
-    if not isinstance(probabilities, dict):
-        return None
+def _maximum_of(probabilities: Iterable[Any]) -> int | None:
+    """Return the maximum valid rain probability, ignoring unavailable values."""
     values = [
         value
-        for value in probabilities.values()
+        for value in probabilities
         if isinstance(value, (int, float)) and value >= 0
     ]
     return int(max(values)) if values else None
 
 
-def _forecast_days(data: dict[str, Any] | None) -> list[dict[str, Any]]:
-    """Extract valid daily forecast records."""
-    if not isinstance(data, dict):
-        return []
-    pred_concello = data.get("predConcello")
-    if not isinstance(pred_concello, dict):
-        return []
-    days = pred_concello.get("listaPredDiaConcello")
-    return days if isinstance(days, list) else []
+def _maximum_probability(day: ForecastDay) -> int | None:
+    """Return the maximum valid rain probability for a forecast day."""
+    return _maximum_of(day.rain.values()) if day.rain is not None else None
+
 
+def _first_condition(*codes: Any) -> str | None:
+    """Return the condition of the first sky code that can be translated."""
+    for code in codes:
+        condition = _condition_from_code(code)
+        if condition is not None:
+            return condition
+    return None
 
-def _current_observation(data: dict[str, Any] | None) -> dict[str, Any] | None:
-    """Extract the latest measured municipal observation."""
-    if not isinstance(data, dict):
-        return None
-    observations = data.get("listaObservacionConcellos")
-    if not isinstance(observations, list) or not observations:
+
+def _period_start(date: str | None, hour: int) -> str | None:
+    """Return the start of a forecast period on the day of ``date``."""
+    try:
+        start = datetime.fromisoformat(date)
+    except (TypeError, ValueError):
         return None
-    observation = observations[0]
-    return observation if isinstance(observation, dict) else None
+    return start.replace(hour=hour, minute=0, second=0, microsecond=0).isoformat()
+
+
+def _twice_daily_periods(day: ForecastDay) -> list[dict[str, Any]]:
+    """Return the daytime and night forecasts of a forecast day."""
+    sky = day.sky or DayPeriods(None, None, None)
+    rain = day.rain or DayPeriods(None, None, None)
+    night_condition = _first_condition(sky.night, day.sky_code)
+    periods = [
+        {
+            "datetime": _period_start(day.date, _DAYTIME_START_HOUR),
+            "is_daytime": True,
+            "condition": _first_condition(sky.afternoon, sky.morning, day.sky_code),
+            "native_temperature": _valid_value(day.max_temperature),
+            "precipitation_probability": _maximum_of((rain.morning, rain.afternoon)),
+            "uv_index": _valid_value(day.uv_max),
+        },
+        {
+            "datetime": _period_start(day.date, _NIGHT_START_HOUR),
+            "is_daytime": False,
+            "condition": (
+                "clear-night" if night_condition == "sunny" else night_condition
+            ),
+            "native_temperature": _valid_value(day.min_temperature),
+            "precipitation_probability": _maximum_of((rain.night,)),
+        },
+    ]
+    return [period for period in periods if period["datetime"] is not None]
 
 
-def _observation_float(data: dict[str, Any] | None, key: str) -> float | None:
+def _observation_float(value: Any) -> float | None:
     """Return a numeric measured observation, ignoring unavailable values."""
-    observation = _current_observation(data)
-    if observation is None:
-        return None
-    value = observation.get(key)
     if value in (None, -9999):
         return None
     try:
@@ -134,34 +165,28 @@ async def async_setup_entry(hass, entry, async_add_entities) -> None:
     """Set up a MeteoGalicia weather entity from a config entry."""
     data = _merge_entry_data(entry)
     scan_interval = data.get(CONF_SCAN_INTERVAL)
+    max_stale_age = data.get(const.CONF_MAX_STALE_AGE)
     id_concello = data.get(const.CONF_ID_CONCELLO)
     if not id_concello:
         return
 
-    coordinator = await async_get_entry_coordinator(
+    coordinator, observation_coordinator = await async_get_entry_coordinators(
         hass,
         entry.entry_id,
-        MeteoGaliciaForecastCoordinator,
+        (MeteoGaliciaForecastCoordinator, MeteoGaliciaObservationCoordinator),
         id_concello,
         scan_interval,
+        max_stale_age,
     )
 
-    observation_coordinator = await async_get_entry_coordinator(
-        hass,
-        entry.entry_id,
-        MeteoGaliciaObservationCoordinator,
-        id_concello,
-        scan_interval,
-    )
-
-    pred_concello = (coordinator.data or {}).get("predConcello")
-    if not isinstance(pred_concello, dict) or not pred_concello.get("nome"):
+    forecast = coordinator.model
+    if forecast is None or not forecast.name:
         raise PlatformNotReady
 
     async_add_entities(
         [
             MeteoGaliciaWeather(
-                pred_concello["nome"],
+                forecast.name,
                 id_concello,
                 coordinator,
                 observation_coordinator,
@@ -170,14 +195,20 @@ async def async_setup_entry(hass, entry, async_add_entities) -> None:
     )
 
 
-class MeteoGaliciaWeather(CoordinatorEntity, WeatherEntity):
+class MeteoGaliciaWeather(MeteoGaliciaMultiCoordinatorEntity, WeatherEntity):
     """Municipal MeteoGalicia forecast."""
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
     _attr_name = None
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
+    _attr_supported_features = (
+        WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_TWICE_DAILY
+    )
+    # The age changes on every refresh; keep it out of the recorder.
+    _unrecorded_attributes = frozenset({"observation_age_s"})
+    # Forecasts by type, with the forecast data version they were built for.
+    _forecast_cache: Mapping[str, tuple[int, list[dict[str, Any]] | None]] = {}
 
     def __init__(
         self,
@@ -186,7 +217,7 @@ class MeteoGaliciaWeather(CoordinatorEntity, WeatherEntity):
         coordinator,
         observation_coordinator,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, observation_coordinator)
         self._observation_coordinator = observation_coordinator
         self._municipality_name = name
         self._id_concello = id_concello
@@ -197,31 +228,32 @@ class MeteoGaliciaWeather(CoordinatorEntity, WeatherEntity):
             manufacturer=const.INTEGRATION_NAME,
         )
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to measured-observation updates."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self._observation_coordinator.async_add_listener(self.async_write_ha_state)
-        )
+    @property
+    def _observation(self) -> Observation | None:
+        return self._observation_coordinator.model
 
     @property
     def native_temperature(self) -> float | None:
         """Return the latest temperature actually observed for the municipality."""
-        return _observation_float(self._observation_coordinator.data, "temperatura")
+        observation = self._observation
+        return _observation_float(observation.temperature) if observation else None
 
     @property
     def native_apparent_temperature(self) -> float | None:
         """Return the latest apparent temperature actually observed."""
-        return _observation_float(
-            self._observation_coordinator.data, "sensacionTermica"
+        observation = self._observation
+        return (
+            _observation_float(observation.apparent_temperature)
+            if observation
+            else None
         )
 
     @property
     def condition(self) -> str | None:
         """Return the latest sky condition actually observed."""
-        observation = _current_observation(self._observation_coordinator.data)
+        observation = self._observation
         return (
-            _condition_from_code(observation.get("icoEstadoCeo"))
+            _condition_from_code(observation.sky_code)
             if observation is not None
             else None
         )
@@ -237,18 +269,71 @@ class MeteoGaliciaWeather(CoordinatorEntity, WeatherEntity):
         }
         return {key: value for key, value in attributes.items() if value is not None}
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Push forecasts to their subscribers only when they have changed."""
+        changed = []
+        for forecast_type in _FORECAST_TYPES:
+            cached = self._forecast_cache.get(forecast_type)
+            forecast = self._cached_forecast(forecast_type)
+            if cached is None or forecast is not cached[1]:
+                changed.append(forecast_type)
+        if changed:
+            self.hass.async_create_task(self.async_update_listeners(tuple(changed)))
+        super()._handle_coordinator_update()
+
+    def _cached_forecast(self, forecast_type: str) -> list[dict[str, Any]] | None:
+        """Return a forecast, rebuilt once per forecast data version.
+
+        An identical rebuild keeps the cached list, so its identity only changes
+        when the forecast does.
+        """
+        build = getattr(self, f"_build_{forecast_type}_forecast")
+        version = getattr(self.coordinator, "data_version", None)
+        if version is None:
+            return build()
+        cached = self._forecast_cache.get(forecast_type)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        forecast = build()
+        if cached is not None and forecast == cached[1]:
+            forecast = cached[1]
+        self._forecast_cache = {
+            **self._forecast_cache,
+            forecast_type: (version, forecast),
+        }
+        return forecast
+
     async def async_forecast_daily(self) -> list[dict[str, Any]] | None:
         """Return the daily forecast."""
-        forecast = []
-        for item in _forecast_days(self.coordinator.data):
-            forecast.append(
-                {
-                    "datetime": item.get("dataPredicion"),
-                    "condition": _condition_from_code(item.get("ceoDia")),
-                    "native_temperature": _valid_value(item.get("tMax")),
-                    "native_templow": _valid_value(item.get("tMin")),
-                    "precipitation_probability": _maximum_probability(item),
-                    "uv_index": _valid_value(item.get("uvMax")),
-                }
-            )
+        return self._cached_forecast("daily")
+
+    async def async_forecast_twice_daily(self) -> list[dict[str, Any]] | None:
+        """Return the daytime and night forecast of each day."""
+        return self._cached_forecast("twice_daily")
+
+    def _forecast_days(self) -> tuple[ForecastDay, ...]:
+        model = self.coordinator.model
+        return model.days if model is not None else ()
+
+    def _build_daily_forecast(self) -> list[dict[str, Any]] | None:
+        forecast = [
+            {
+                "datetime": day.date,
+                "condition": _condition_from_code(day.sky_code),
+                "native_temperature": _valid_value(day.max_temperature),
+                "native_templow": _valid_value(day.min_temperature),
+                "precipitation_probability": _maximum_probability(day),
+                "uv_index": _valid_value(day.uv_max),
+            }
+            for day in self._forecast_days()
+        ]
+        return forecast or None
+
+    def _build_twice_daily_forecast(self) -> list[dict[str, Any]] | None:
+        forecast = [
+            period
+            for day in self._forecast_days()
+            for period in _twice_daily_periods(day)
+        ]
         return forecast or None
@@ -0,0 +1,145 @@
+"""Tests for the async MeteoGalicia HTTP transport."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from multidict import CIMultiDict
+
+from custom_components.meteogalicia import api
+from custom_components.meteogalicia.coordinator import _async_api_call_with_latency
+
+URL = "https://example.invalid/15009"
+
+
+class FakeResponse:
+    def __init__(self, body, status=200, headers=None):
+        self.body = body
+        self.status = status
+        # MeteoGalicia labels some JSON documents as text/plain.
+        self.headers = CIMultiDict({"Content-Type": "text/plain", **(headers or {})})
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        return False
+
+    def raise_for_status(self):
+        return None
+
+    async def read(self):
+        return self.body
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers, timeout):
+        self.calls.append((url, headers, timeout.total))
+        return self.responses.pop(0)
+
+
+def _body(payload):
+    return json.dumps(payload).encode()
+
+
+@pytest.mark.asyncio
+async def test_async_get_json_accepts_mislabelled_json():
+    session = FakeSession(FakeResponse(_body({"predConcello": {"nome": "Betanzos"}})))
+
+    data = await api.async_get_json(session, URL, 12)
+
+    assert data == {"predConcello": {"nome": "Betanzos"}}
+    assert session.calls == [(URL, None, 12)]
+
+
+@pytest.mark.asyncio
+async def test_async_get_json_returns_none_for_an_empty_body():
+    assert await api.async_get_json(FakeSession(FakeResponse(b" ")), URL, 12) is None
+
+
+@pytest.mark.asyncio
+async def test_not_modified_response_reuses_the_decoded_payload():
+    body = _body({"predConcello": {"nome": "Betanzos"}})
+    cache = api.ConditionalRequestCache()
+    session = FakeSession(
+        FakeResponse(
+            body,
+            headers={"ETag": '"v1"', "Last-Modified": "Sat, 08 Aug 2026 16:00:00 GMT"},
+        ),
+        FakeResponse(b"", status=304),
+    )
+
+    first = await api.async_get_json(session, URL, 12, cache)
+    second = await api.async_get_json(session, URL, 12, cache)
+
+    assert second is first
+    assert session.calls[1][1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 08 Aug 2026 16:00:00 GMT",
+    }
+    assert cache.as_dict() == {
+        "urls": 1,
+        "requests": 2,
+        "not_modified": 1,
+        "unchanged_bodies": 0,
+        "bytes_avoided": len(body),
+        "parses_avoided": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_identical_body_without_validators_is_not_decoded_again():
+    cache = api.ConditionalRequestCache()
+    session = FakeSession(
+        FakeResponse(_body({"listUltimos10min": [{"valor": 1}]})),
+        FakeResponse(_body({"listUltimos10min": [{"valor": 1}]})),
+        FakeResponse(_body({"listUltimos10min": [{"valor": 2}]})),
+    )
+
+    first = await api.async_get_json(session, URL, 12, cache)
+    second = await api.async_get_json(session, URL, 12, cache)
+    third = await api.async_get_json(session, URL, 12, cache)
+
+    assert second is first
+    assert third == {"listUltimos10min": [{"valor": 2}]}
+    assert session.calls[1][1] == {}
+    assert cache.unchanged_bodies == 1
+    assert cache.parses_avoided == 1
+    assert cache.bytes_avoided == 0
+
+
+def test_payload_validators_match_the_threaded_client():
+    assert api.forecast_payload({"predConcello": None}) is None
+    assert api.forecast_payload({"predConcello": {}}) == {"predConcello": {}}
+    assert api.observation_payload({"listaObservacionConcellos": []}) is None
+    assert api.station_daily_payload({}) is None
+    assert api.station_last10_payload({"listUltimos10min": [{}]}) == {
+        "listUltimos10min": [{}]
+    }
+    assert api.station_last10_payload(None) is None
+
+
+@pytest.mark.asyncio
+async def test_async_api_functions_do_not_use_the_executor():
+    async def executor_job(*_args):
+        pytest.fail("Async transport must not use an executor thread")
+
+    coordinator = SimpleNamespace(
+        hass=SimpleNamespace(async_add_executor_job=executor_job),
+        last_api_latency_ms=None,
+        last_api_connected_at=None,
+    )
+
+    async def fetch(resource_id, session):
+        return {"id": resource_id, "session": session}
+
+    data = await _async_api_call_with_latency(coordinator, fetch, "15009", "session")
+
+    assert data == {"id": "15009", "session": "session"}
+    assert coordinator.last_api_latency_ms is not None
+    assert coordinator.last_api_connected_at is not None
+
@@ -0,0 +1,89 @@
+"""Tests for memoizing entity attributes and values per coordinator data version."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from custom_components.meteogalicia import sensor
+from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaStationLast10MinCoordinator,
+)
+from custom_components.meteogalicia.model import parse_station_last10
+
+
+def _payload(value):
+    return {
+        "listUltimos10min": [
+            {
+                "estacion": "Santiago-EOAS",
+                "listaMedidas": [
+                    {
+                        "codigoParametro": "TA_AVG_1.5m",
+                        "nomeParametro": "Temperatura",
+                        "unidade": "ºC",
+                        "valor": value,
+                        "lnCodigoValidacion": 1,
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _coordinator(value=20.5):
+    return SimpleNamespace(
+        model=parse_station_last10(_payload(value)),
+        last_update_success=True,
+        last_api_connected_at=None,
+        last_api_latency_ms=100,
+        scan_interval=timedelta(minutes=10),
+        data_version=1,
+    )
+
+
+async def test_notifying_entities_advances_the_data_version(hass):
+    coordinator = MeteoGaliciaStationLast10MinCoordinator(hass, "10124", 600)
+    assert coordinator.data_version == 0
+
+    coordinator.async_set_updated_data(_payload(20.5))
+    coordinator.async_update_listeners()
+
+    assert coordinator.data_version == 2
+    await coordinator.async_close()
+
+
+def test_attributes_and_value_are_reused_until_the_version_changes(monkeypatch):
+    coordinator = _coordinator()
+    (entity,) = sensor._station_measure_entities("10124", coordinator, "last_10_min")
+    calls = []
+    helper = sensor._get_coordinator_api_latency_ms
+    monkeypatch.setattr(
+        sensor,
+        "_get_coordinator_api_latency_ms",
+        lambda item: calls.append(True) or helper(item),
+    )
+
+    attributes = entity.extra_state_attributes
+    assert entity.extra_state_attributes is attributes
+    assert entity.native_value == 20.5
+    assert calls == [True]
+
+    coordinator.model = parse_station_last10(_payload(21.0))
+    coordinator.last_api_latency_ms = 200
+    assert entity.native_value == 20.5
+
+    coordinator.data_version += 1
+    assert entity.native_value == 21.0
+    assert entity.extra_state_attributes is not attributes
+    assert entity.extra_state_attributes["api_latency_ms"] == 200.0
+    assert len(calls) == 2
+
+
+def test_coordinators_without_a_version_are_read_every_time():
+    coordinator = _coordinator()
+    del coordinator.data_version
+    (entity,) = sensor._station_measure_entities("10124", coordinator, "last_10_min")
+
+    assert entity.native_value == 20.5
+    coordinator.model = parse_station_last10(_payload(21.0))
+    assert entity.native_value == 21.0
+    assert entity.extra_state_attributes is not entity.extra_state_attributes
@@ -0,0 +1,156 @@
+"""Tests for the per-endpoint MeteoGalicia circuit breaker."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.meteogalicia.api import (
+    CircuitBreaker,
+    CircuitOpenError,
+    MeteoGaliciaHttpPool,
+)
+from custom_components.meteogalicia.coordinator import _async_api_call_with_latency
+
+
+def _open_breaker(reset_timeout=60):
+    breaker = CircuitBreaker(
+        "observation", failure_threshold=3, reset_timeout=reset_timeout
+    )
+    for _ in range(3):
+        assert breaker.allow_request() is True
+        breaker.record_failure(TimeoutError("API timeout"))
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("observation", failure_threshold=3, reset_timeout=60)
+    breaker.record_failure(TimeoutError())
+    breaker.record_failure(TimeoutError())
+    breaker.record_success()
+    breaker.record_failure(TimeoutError())
+    breaker.record_failure(TimeoutError())
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure(TimeoutError("API timeout"))
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.as_dict()["rejected"] == 1
+    assert breaker.as_dict()["history"][-1]["reason"] == "TimeoutError: API timeout"
+
+
+def test_half_open_breaker_lets_a_single_probe_through():
+    breaker = _open_breaker(reset_timeout=0)
+
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is False
+
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() is True
+    assert [item["to"] for item in breaker.as_dict()["history"]] == [
+        "open",
+        "half_open",
+        "closed",
+    ]
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = _open_breaker(reset_timeout=0)
+
+    assert breaker.allow_request() is True
+    breaker.record_failure(ConnectionError("refused"))
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.consecutive_failures == 4
+
+
+def test_pool_shares_one_breaker_per_endpoint():
+    pool = MeteoGaliciaHttpPool(None, None)
+
+    assert pool.breaker("forecast") is pool.breaker("forecast")
+    assert pool.breaker("forecast") is not pool.breaker("observation")
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_without_calling_meteogalicia():
+    calls = 0
+
+    async def fetch(_resource_id, _session):
+        nonlocal calls
+        calls += 1
+        return {}
+
+    coordinator = SimpleNamespace(
+        last_api_latency_ms=None,
+        last_api_connected_at=None,
+    )
+
+    with pytest.raises(CircuitOpenError):
+        await _async_api_call_with_latency(
+            coordinator, fetch, "15009", "session", breaker=_open_breaker()
+        )
+
+    assert calls == 0
+    assert coordinator.last_api_latency_ms is None
+
+
+@pytest.mark.asyncio
+async def test_successful_call_closes_a_probing_breaker():
+    breaker = _open_breaker(reset_timeout=0)
+
+    async def fetch(resource_id, _session):
+        return {"id": resource_id}
+
+    coordinator = SimpleNamespace(
+        last_api_latency_ms=None,
+        last_api_connected_at=None,
+    )
+
+    data = await _async_api_call_with_latency(
+        coordinator, fetch, "15009", "session", breaker=breaker
+    )
+
+    assert data == {"id": "15009"}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("probing", [False, True])
+async def test_cancelled_fetch_is_not_counted_as_a_failure(probing):
+    breaker = (
+        _open_breaker(reset_timeout=0)
+        if probing
+        else CircuitBreaker("observation", failure_threshold=3, reset_timeout=60)
+    )
+    failures = breaker.consecutive_failures
+    started = asyncio.Event()
+
+    async def fetch(_resource_id, _session):
+        started.set()
+        await asyncio.sleep(3600)
+
+    coordinator = SimpleNamespace(
+        last_api_latency_ms=None,
+        last_api_connected_at=None,
+    )
+    task = asyncio.create_task(
+        _async_api_call_with_latency(
+            coordinator, fetch, "15009", "session", breaker=breaker
+        )
+    )
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.consecutive_failures == failures
+    assert breaker.state == (
+        CircuitBreaker.HALF_OPEN if probing else CircuitBreaker.CLOSED
+    )
+    # The probe slot is free again for the next poll.
+    assert breaker.allow_request() is True
@@ -1,10 +1,15 @@
-"""Tests for shared config-entry coordinators."""
+"""Tests for coordinators shared by config entries."""
 import asyncio
+from datetime import timedelta
 
 import pytest
 
 from custom_components.meteogalicia import const
-from custom_components.meteogalicia.coordinator import async_get_entry_coordinator
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.coordinator import (
+    async_get_entry_coordinator,
+    async_release_entry_coordinators,
+)
 
 
 class DummyHass:
@@ -18,14 +23,61 @@ class DummyHass:
         return asyncio.create_task(coro)
 
 
+class DummyPayloadStore:
+    """Payload store double holding records for a single endpoint."""
+
+    def __init__(self, records=None):
+        self.records = records or {}
+
+    async def async_load(self):
+        return None
+
+    def async_get(self, _endpoint, resource_id):
+        return self.records.get(resource_id)
+
+
+@pytest.fixture(autouse=True)
+def payload_store(monkeypatch):
+    store = DummyPayloadStore()
+    monkeypatch.setattr(
+        coordinator_module, "async_get_payload_store", lambda _hass: store
+    )
+    return store
+
+
 def counting_coordinator(stats):
     """Create an isolated coordinator double backed by per-test counters."""
 
     class CountingCoordinator:
+        endpoint = "forecast"
+
         def __init__(self, hass, id_value, scan_interval):
             stats["created"] += 1
             self.id = id_value
             self.scan_interval = scan_interval
+            self.update_interval = None
+            self.closed = False
+            self.data = None
+
+        def async_seed_from_store(self, payload_store):
+            record = payload_store.async_get(self.endpoint, self.id)
+            if record is None:
+                return False
+            self.data = record["data"]
+            return True
+
+        def set_scan_interval(self, scan_interval):
+            self.update_interval = scan_interval
+
+        def set_max_stale_age(self, max_stale_age):
+            self.max_stale_age = max_stale_age
+
+        def async_start_background_refresh(self):
+            stats["background"] += 1
+
+        async def async_close(self):
+            stats["closed"] += 1
+            self.closed = True
 
         async def async_refresh(self):
             stats["refreshed"] += 1
@@ -39,7 +91,7 @@ def counting_coordinator(stats):
 
 @pytest.mark.asyncio
 async def test_entry_platforms_share_one_coordinator_and_refresh():
-    stats = {"created": 0, "refreshed": 0, "failures": 0}
+    stats = {"created": 0, "refreshed": 0, "failures": 0, "closed": 0, "background": 0}
     coordinator_class = counting_coordinator(stats)
     hass = DummyHass()
 
@@ -60,8 +112,8 @@ async def test_entry_platforms_share_one_coordinator_and_refresh():
 
 
 @pytest.mark.asyncio
-async def test_different_entries_do_not_share_coordinators():
-    stats = {"created": 0, "refreshed": 0, "failures": 0}
+async def test_entries_for_the_same_resource_share_one_coordinator():
+    stats = {"created": 0, "refreshed": 0, "failures": 0, "closed": 0, "background": 0}
     coordinator_class = counting_coordinator(stats)
     hass = DummyHass()
 
@@ -69,17 +121,56 @@ async def test_different_entries_do_not_share_coordinators():
         hass, "entry-1", coordinator_class, "15030", 1200
     )
     second = await async_get_entry_coordinator(
-        hass, "entry-2", coordinator_class, "15030", 1200
+        hass, "entry-2", coordinator_class, "15030", 600
+    )
+    other = await async_get_entry_coordinator(
+        hass, "entry-2", coordinator_class, "15031", 600
     )
 
-    assert first is not second
+    assert first is second
+    assert other is not first
     assert stats["created"] == 2
     assert stats["refreshed"] == 2
+    assert first.update_interval == timedelta(seconds=600)
+    assert hass.data[const.DOMAIN]["entry-1"]["coordinators"] == [first]
+    assert hass.data[const.DOMAIN]["entry-2"]["coordinators"] == [first, other]
+
+
+@pytest.mark.asyncio
+async def test_shared_coordinator_closes_when_its_last_entry_releases_it():
+    stats = {"created": 0, "refreshed": 0, "failures": 0, "closed": 0, "background": 0}
+    coordinator_class = counting_coordinator(stats)
+    hass = DummyHass()
+    coordinator = await async_get_entry_coordinator(
+        hass, "entry-1", coordinator_class, "15030", 1200
+    )
+    await async_get_entry_coordinator(
+        hass, "entry-2", coordinator_class, "15030", 600
+    )
+
+    entry_2 = hass.data[const.DOMAIN]["entry-2"]["coordinators"]
+    await async_release_entry_coordinators(hass, "entry-2", entry_2)
+
+    assert entry_2 == []
+    assert coordinator.closed is False
+    assert coordinator.update_interval == timedelta(seconds=1200)
+
+    entry_1 = hass.data[const.DOMAIN]["entry-1"]["coordinators"]
+    await async_release_entry_coordinators(hass, "entry-1", entry_1)
+
+    assert coordinator.closed is True
+    assert hass.data[const.DOMAIN][const.DATA_COORDINATORS] == {}
+    assert (
+        await async_get_entry_coordinator(
+            hass, "entry-1", coordinator_class, "15030", 1200
+        )
+        is not coordinator
+    )
 
 
 @pytest.mark.asyncio
 async def test_failed_initialization_can_be_retried():
-    stats = {"created": 0, "refreshed": 0, "failures": 1}
+    stats = {"created": 0, "refreshed": 0, "failures": 1, "closed": 0}
     coordinator_class = counting_coordinator(stats)
     hass = DummyHass()
 
@@ -95,3 +186,20 @@ async def test_failed_initialization_can_be_retried():
     assert coordinator.id == "15030"
     assert stats["created"] == 2
     assert hass.data[const.DOMAIN]["entry"]["coordinators"] == [coordinator]
+
+
+@pytest.mark.asyncio
+async def test_stored_payload_seeds_coordinator_without_awaiting_refresh(
+    payload_store,
+):
+    stats = {"created": 0, "refreshed": 0, "failures": 0, "closed": 0, "background": 0}
+    coordinator_class = counting_coordinator(stats)
+    payload_store.records["15030"] = {"data": {"predConcello": {"nome": "Ferrol"}}}
+
+    coordinator = await async_get_entry_coordinator(
+        DummyHass(), "entry", coordinator_class, "15030", 1200
+    )
+
+    assert coordinator.data == {"predConcello": {"nome": "Ferrol"}}
+    assert stats["refreshed"] == 0
+    assert stats["background"] == 1
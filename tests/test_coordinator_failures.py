@@ -13,21 +13,34 @@ from custom_components.meteogalicia.coordinator import BaseMeteoGaliciaCoordinat
 
 def _coordinator_double():
     return SimpleNamespace(
-        _session=object(),
         _api_fn=object(),
+        _http_pool=object(),
+        _circuit_breaker=lambda: None,
+        _attempt_timeout=lambda: None,
+        _request_limiter=lambda: None,
         _error_context="datos de prueba",
         _warn_msg="No hay datos para %s",
         _restore_msg="Datos recuperados para %s",
         _had_data_error=False,
+        _last_good_at=None,
+        _last_stale_state=None,
+        _serve_stale=lambda _err: False,
+        serving_stale=False,
+        _payload_store=None,
+        _unchanged=lambda _data: False,
+        changed_updates=0,
         id="15009",
         _update_data_timestamp=lambda _data: None,
+        _schedule_next_poll=lambda _data: None,
+        scan_interval=None,
+        update_interval=None,
         _check_staleness_transition=lambda: None,
     )
 
 
 @pytest.mark.asyncio
 async def test_empty_response_is_a_failed_update(monkeypatch):
-    async def return_empty(*_args):
+    async def return_empty(*_args, **_kwargs):
         return None
 
     monkeypatch.setattr(
@@ -45,7 +58,7 @@ async def test_empty_response_is_a_failed_update(monkeypatch):
 async def test_success_after_empty_response_clears_error(monkeypatch):
     payload = {"predConcello": {"nome": "Betanzos"}}
 
-    async def return_payload(*_args):
+    async def return_payload(*_args, **_kwargs):
         return payload
 
     monkeypatch.setattr(
@@ -63,7 +76,7 @@ async def test_independent_coordinators_are_not_globally_serialized(monkeypatch)
     running = 0
     maximum_running = 0
 
-    async def concurrent_call(*_args):
+    async def concurrent_call(*_args, **_kwargs):
         nonlocal running, maximum_running
         running += 1
         maximum_running = max(maximum_running, running)
@@ -84,18 +97,19 @@ async def test_independent_coordinators_are_not_globally_serialized(monkeypatch)
 
 
 @pytest.mark.asyncio
-async def test_coordinator_closes_its_own_session_in_executor():
-    closed = []
-    session = SimpleNamespace(close=lambda: closed.append(True))
+async def test_coordinator_close_returns_its_http_pool_lease(monkeypatch):
+    released = []
 
-    async def executor_job(callback):
-        callback()
+    async def release(hass, pool):
+        released.append((hass, pool))
 
-    coordinator = SimpleNamespace(
-        hass=SimpleNamespace(async_add_executor_job=executor_job),
-        _session=session,
-    )
+    monkeypatch.setattr(coordinator_module, "async_release_http_pool", release)
+    hass = object()
+    pool = object()
+    coordinator = SimpleNamespace(hass=hass, _http_pool=pool, _background_refresh=None)
 
+    await BaseMeteoGaliciaCoordinator.async_close(coordinator)
     await BaseMeteoGaliciaCoordinator.async_close(coordinator)
 
-    assert closed == [True]
+    assert released == [(hass, pool)]
+    assert coordinator._http_pool is None
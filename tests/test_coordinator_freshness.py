@@ -1,11 +1,12 @@
 """Tests for actual observation timestamps and stale-data detection."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from custom_components.meteogalicia import coordinator as coordinator_module
 from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaForecastCoordinator,
     MeteoGaliciaObservationCoordinator,
     MeteoGaliciaStationDailyCoordinator,
     MeteoGaliciaStationLast10MinCoordinator,
@@ -95,3 +96,91 @@ async def test_daily_observation_uses_a_48_hour_threshold(hass, monkeypatch):
 
     assert coordinator.data_is_stale is True
     await coordinator.async_close()
+
+
+async def test_observation_poll_is_aligned_with_the_next_publication(
+    hass, monkeypatch
+):
+    payload = {"listUltimos10min": [{"instanteLecturaUTC": "2026-08-08T16:10:00"}]}
+
+    async def fetch(*_args, **_kwargs):
+        return payload
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", fetch)
+    monkeypatch.setattr(
+        coordinator_module,
+        "_utcnow",
+        lambda: datetime(2026, 8, 8, 16, 14, tzinfo=timezone.utc),
+    )
+    coordinator = MeteoGaliciaStationLast10MinCoordinator(hass, "10124", 15)
+
+    await coordinator.async_refresh()
+
+    # The 16:20 record is expected 16:20:30 at the earliest, not in 15 s, and
+    # each coordinator adds its own phase of up to 30 s on top.
+    assert 390 <= coordinator.update_interval.total_seconds() < 420
+    assert coordinator.scan_interval.total_seconds() == 15
+    assert coordinator.poll_schedule.as_dict()["new_records"] == 1
+
+    async def fail(*_args, **_kwargs):
+        raise TimeoutError
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", fail)
+    await coordinator.async_refresh()
+
+    assert coordinator.update_interval.total_seconds() == 15
+    await coordinator.async_close()
+
+
+async def test_scan_interval_change_keeps_the_publication_schedule(
+    hass, monkeypatch
+):
+    payload = {"listaObservacionConcellos": [{"dataUTC": "2026-08-08T16:10:00"}]}
+    now = [datetime(2026, 8, 8, 16, 14, tzinfo=timezone.utc)]
+
+    async def fetch(*_args, **_kwargs):
+        return payload
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", fetch)
+    monkeypatch.setattr(coordinator_module, "_utcnow", lambda: now[0])
+    coordinator = MeteoGaliciaObservationCoordinator(hass, "15009", 15)
+
+    await coordinator.async_refresh()
+    # The 16:20 record is expected at 16:20:30; the rest is this coordinator's phase.
+    phase = coordinator.update_interval.total_seconds() - 390
+
+    now[0] = datetime(2026, 8, 8, 16, 15, tzinfo=timezone.utc)
+    coordinator.async_retune_scan_interval(timedelta(seconds=60))
+
+    assert coordinator.update_interval.total_seconds() == 330 + phase
+    assert coordinator.poll_schedule.as_dict()["polls"] == 1
+
+    # A longer base skips publications instead of replacing the schedule.
+    coordinator.async_retune_scan_interval(timedelta(seconds=1800))
+
+    assert coordinator.update_interval.total_seconds() == 1530 + phase
+    assert coordinator.poll_schedule.as_dict()["polls"] == 1
+    await coordinator.async_close()
+
+
+async def test_forecast_keeps_its_own_interval_and_detects_new_issues(
+    hass, monkeypatch
+):
+    payloads = [
+        {"predConcello": {"nome": "Betanzos", "listaPredDiaConcello": [1]}},
+        {"predConcello": {"nome": "Betanzos", "listaPredDiaConcello": [1]}},
+        {"predConcello": {"nome": "Betanzos", "listaPredDiaConcello": [2]}},
+    ]
+
+    async def fetch(*_args, **_kwargs):
+        return payloads.pop(0)
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", fetch)
+    coordinator = MeteoGaliciaForecastCoordinator(hass, "15009", 15)
+
+    for _ in range(3):
+        await coordinator.async_refresh()
+
+    assert 600 <= coordinator.update_interval.total_seconds() < 630
+    assert coordinator.poll_schedule.as_dict()["changes"] == 1
+    await coordinator.async_close()
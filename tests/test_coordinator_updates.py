@@ -0,0 +1,40 @@
+"""Tests for suppressing coordinator updates that carry no new data."""
+
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaStationLast10MinCoordinator,
+)
+
+
+async def test_listeners_are_only_notified_when_the_payload_changes(
+    hass, monkeypatch
+):
+    first = {
+        "listUltimos10min": [{"instanteLecturaUTC": "2026-08-08T16:10:00"}],
+        "generatedAt": "16:14:01",
+    }
+    # Same observations in a new envelope, then a new observation.
+    payloads = [
+        first,
+        {**first, "generatedAt": "16:14:31"},
+        {"listUltimos10min": [{"instanteLecturaUTC": "2026-08-08T16:20:00"}]},
+    ]
+
+    async def fetch(*_args, **_kwargs):
+        return payloads.pop(0)
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", fetch)
+    coordinator = MeteoGaliciaStationLast10MinCoordinator(hass, "10124", 600)
+    notifications = []
+    remove = coordinator.async_add_listener(lambda: notifications.append(1))
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert coordinator.data is first
+    await coordinator.async_refresh()
+
+    assert len(notifications) == 2
+    assert coordinator.changed_updates == 2
+    assert coordinator.suppressed_updates == 1
+    remove()
+    await coordinator.async_close()
@@ -0,0 +1,348 @@
+"""Tests for unrecorded volatile attributes and per-coordinator diagnostics."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EntityCategory
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.sensor import (
+    _DIAGNOSTIC_DESCRIPTIONS,
+    MeteoGaliciaCoordinatorDiagnosticSensor,
+    _coordinator_diagnostic_entities,
+)
+
+MEASURE = {
+    "codigoParametro": "TA_AVG_1.5m",
+    "nomeParametro": "Temperatura",
+    "unidade": "ºC",
+    "valor": 20.5,
+    "lnCodigoValidacion": 1,
+}
+
+
+def _patch_station_api(monkeypatch):
+    async def get_daily(_resource_id, _session):
+        return {
+            "listDatosDiarios": [
+                {
+                    "data": "2026-08-08T00:00:00",
+                    "listaEstacions": [
+                        {"estacion": "Santiago-EOAS", "listaMedidas": [MEASURE]}
+                    ],
+                }
+            ]
+        }
+
+    async def get_last10(_resource_id, _session):
+        return {
+            "listUltimos10min": [
+                {
+                    "estacion": "Santiago-EOAS",
+                    "instanteLecturaUTC": "2026-08-08T16:10:00",
+                    "listaMedidas": [MEASURE],
+                }
+            ]
+        }
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_dailydata_by_station_from_api",
+        get_daily,
+    )
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_last10mindata_by_station_from_api",
+        get_last10,
+    )
+
+
+async def _setup_entry(hass, unique_id, data):
+    entry = MockConfigEntry(domain=const.DOMAIN, unique_id=unique_id, data=data)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def _diagnostic_entries(hass, entry):
+    registry = er.async_get(hass)
+    return [
+        item
+        for item in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if item.entity_category == EntityCategory.DIAGNOSTIC
+    ]
+
+
+@pytest.mark.asyncio
+async def test_each_shared_coordinator_gets_one_disabled_set_of_diagnostics(
+    hass, enable_custom_integrations, monkeypatch
+):
+    _patch_station_api(monkeypatch)
+    daily_entry = await _setup_entry(
+        hass,
+        "estacion_10124_TA_AVG_1.5m_",
+        {
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_DAILY: "TA_AVG_1.5m",
+        },
+    )
+    station_entry = await _setup_entry(
+        hass, "estacion_10124", {const.CONF_ID_ESTACION: "10124"}
+    )
+
+    daily = _diagnostic_entries(hass, daily_entry)
+    station = _diagnostic_entries(hass, station_entry)
+
+    # The daily coordinator's diagnostics belong to the first entry using it.
+    assert sorted(item.unique_id for item in daily) == [
+        "meteogalicia_station_daily_10124_api_latency",
+        "meteogalicia_station_daily_10124_data_timestamp",
+        "meteogalicia_station_daily_10124_last_connection",
+        "meteogalicia_station_daily_10124_scan_interval",
+    ]
+    assert all(
+        item.unique_id.startswith("meteogalicia_station_last10min_10124_")
+        for item in station
+    )
+    assert len(station) == 4
+    assert all(
+        item.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+        for item in daily + station
+    )
+
+    for entry in (daily_entry, station_entry):
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_entries_set_up_together_create_each_diagnostic_once(
+    hass, enable_custom_integrations, monkeypatch, caplog
+):
+    _patch_station_api(monkeypatch)
+    get_daily = coordinator_module._async_get_observation_dailydata_by_station_from_api
+
+    async def slow_daily(resource_id, session):
+        # Both entries wait on the same first refresh and resume together.
+        await asyncio.sleep(0.05)
+        return await get_daily(resource_id, session)
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_dailydata_by_station_from_api",
+        slow_daily,
+    )
+    entries = [
+        MockConfigEntry(
+            domain=const.DOMAIN,
+            unique_id="estacion_10124_TA_AVG_1.5m_",
+            data={
+                const.CONF_ID_ESTACION: "10124",
+                const.CONF_ID_ESTACION_MEDIDA_DAILY: "TA_AVG_1.5m",
+            },
+        ),
+        MockConfigEntry(
+            domain=const.DOMAIN,
+            unique_id="estacion_10124",
+            data={const.CONF_ID_ESTACION: "10124"},
+        ),
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+
+    # A fresh install: neither entry finds the other's entities registered yet.
+    assert all(
+        await asyncio.gather(
+            *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+        )
+    )
+    await hass.async_block_till_done()
+
+    def daily_diagnostics(entry):
+        return [
+            item.unique_id
+            for item in _diagnostic_entries(hass, entry)
+            if item.unique_id.startswith("meteogalicia_station_daily_")
+        ]
+
+    owned = [daily_diagnostics(entry) for entry in entries]
+    assert sorted(len(unique_ids) for unique_ids in owned) == [0, 4]
+    assert "does not generate unique IDs" not in caplog.text
+
+    # The owner's reload hands the diagnostics back to it, not to the other entry.
+    owner = entries[0] if owned[0] else entries[1]
+    assert await hass.config_entries.async_reload(owner.entry_id)
+    await hass.async_block_till_done()
+
+    assert len(daily_diagnostics(owner)) == 4
+    assert "does not generate unique IDs" not in caplog.text
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_belong_to_one_entry_before_any_is_registered(
+    hass, monkeypatch
+):
+    _patch_station_api(monkeypatch)
+    coordinators = await asyncio.gather(
+        *(
+            coordinator_module.async_get_entry_coordinator(
+                hass,
+                entry_id,
+                coordinator_module.MeteoGaliciaStationLast10MinCoordinator,
+                "10124",
+                600,
+            )
+            for entry_id in ("entry-a", "entry-b")
+        )
+    )
+    coordinator = coordinators[0]
+
+    created = {
+        entry_id: _coordinator_diagnostic_entities(
+            hass, entry_id, coordinator, "station_10124", "Santiago-EOAS"
+        )
+        for entry_id in ("entry-a", "entry-b")
+    }
+
+    assert len(created["entry-a"]) == 4
+    assert created["entry-b"] == []
+
+    # Once the owner lets the coordinator go, the next entry to acquire it owns them.
+    await coordinator_module.async_release_entry_coordinators(
+        hass, "entry-a", [coordinator]
+    )
+    await coordinator_module.async_get_entry_coordinator(
+        hass,
+        "entry-b",
+        coordinator_module.MeteoGaliciaStationLast10MinCoordinator,
+        "10124",
+        600,
+    )
+
+    assert _coordinator_diagnostic_entities(
+        hass, "entry-b", coordinator, "station_10124", "Santiago-EOAS"
+    )
+    await coordinator_module.async_release_entry_coordinators(
+        hass, "entry-b", [coordinator]
+    )
+
+
+def test_diagnostic_values_follow_the_coordinator():
+    coordinator = SimpleNamespace(
+        endpoint="observation",
+        id="15009",
+        last_update_success=False,
+        last_api_latency_ms=123.456,
+        last_api_connected_at="2026-08-08T16:20:00+00:00",
+        data_timestamp_utc=datetime(2026, 8, 8, 16, 17, tzinfo=timezone.utc),
+        scan_interval=timedelta(minutes=10),
+    )
+    values = {}
+    for description in _DIAGNOSTIC_DESCRIPTIONS:
+        entity = MeteoGaliciaCoordinatorDiagnosticSensor(
+            coordinator, description, "concello_15009", "Betanzos"
+        )
+        values[description.key] = entity.native_value
+        assert entity.available is True
+        assert entity.translation_placeholders == {"source": "observation"}
+
+    assert values == {
+        "api_latency": 123.5,
+        "last_connection": datetime(2026, 8, 8, 16, 20, tzinfo=timezone.utc),
+        "data_timestamp": coordinator.data_timestamp_utc,
+        "scan_interval": 600.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_enabled_last_connection_sensor_reports_a_timestamp(
+    hass, enable_custom_integrations, monkeypatch
+):
+    _patch_station_api(monkeypatch)
+    # The reload starts from the stored payload; refresh it live at once.
+    monkeypatch.setattr(coordinator_module, "_STARTUP_REFRESH_SPREAD", timedelta(0))
+    entry = await _setup_entry(
+        hass,
+        "estacion_10124_TA_AVG_1.5m",
+        {
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_LAST10MIN: "TA_AVG_1.5m",
+        },
+    )
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id(
+        "sensor", const.DOMAIN, "meteogalicia_station_last10min_10124_last_connection"
+    )
+    registry.async_update_entity(entity_id, disabled_by=None)
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    connected_at = datetime.fromisoformat(state.state)
+    assert connected_at.tzinfo is not None
+    assert abs(datetime.now(timezone.utc) - connected_at) < timedelta(minutes=1)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_volatile_attributes_are_not_recorded(
+    recorder_mock, hass, enable_custom_integrations, monkeypatch
+):
+    _patch_station_api(monkeypatch)
+    entry = await _setup_entry(
+        hass,
+        "estacion_10124_TA_AVG_1.5m",
+        {
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_LAST10MIN: "TA_AVG_1.5m",
+        },
+    )
+    await async_wait_recording_done(hass)
+
+    def recorded_attributes():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                json.loads(row.shared_attrs)
+                for row in session.query(StateAttributes).all()
+            ]
+
+    recorded = await get_instance(hass).async_add_executor_job(recorded_attributes)
+    station = [
+        attrs
+        for attrs in recorded
+        if attrs.get(const.ATTR_INTEGRATION) == const.DOMAIN
+    ]
+
+    assert station
+    for attrs in station:
+        assert const.ATTR_API_LATENCY_MS not in attrs
+        assert const.ATTR_CONNECTED_AT not in attrs
+        assert const.ATTR_SCAN_INTERVAL_S not in attrs
+        assert const.ATTR_DATA_AGE_S not in attrs
+        assert const.ATTR_DATA_TIMESTAMP in attrs
+
+    # They are still part of the live state.
+    state = next(
+        state
+        for state in hass.states.async_all("sensor")
+        if state.attributes.get(const.ATTR_INTEGRATION) == const.DOMAIN
+    )
+    assert const.ATTR_API_LATENCY_MS in state.attributes
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
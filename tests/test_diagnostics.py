@@ -5,7 +5,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from custom_components.meteogalicia import diagnostics
+from custom_components.meteogalicia import api, diagnostics
 
 
 @pytest.mark.asyncio
@@ -44,6 +44,15 @@ async def test_diagnostics_include_health_interval_errors_and_entities(monkeypat
         "async_entries_for_config_entry",
         lambda _registry, _entry_id: [entity],
     )
+    platform = SimpleNamespace(
+        config_entry=entry,
+        entities={"weather.betanzos": SimpleNamespace(coalesced_writes=3)},
+    )
+    monkeypatch.setattr(
+        diagnostics.entity_platform,
+        "async_get_platforms",
+        lambda _hass, _domain: [platform],
+    )
 
     result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
 
@@ -53,4 +62,48 @@ async def test_diagnostics_include_health_interval_errors_and_entities(monkeypat
     assert result["coordinators"][0]["data_timestamp"] == ("2026-08-08T16:17:00+00:00")
     assert result["coordinators"][0]["data_stale"] is False
     assert result["entities"][0]["entity_id"] == "weather.betanzos"
+    assert result["entities"][0]["coalesced_writes"] == 3
     assert "private_payload" not in str(result)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_include_shared_http_pool_instrumentation(monkeypatch):
+    breaker = api.CircuitBreaker("observation", failure_threshold=1, reset_timeout=60)
+    breaker.record_failure(TimeoutError("API timeout"))
+    attempt_timeout = api.AdaptiveTimeout(minimum=5, maximum=30, factor=3)
+    cache = api.ConditionalRequestCache()
+    cache.requests = 8
+    cache.not_modified = 5
+    cache.bytes_avoided = 40960
+    cache.parses_avoided = 6
+    entry = SimpleNamespace(entry_id="entry-1", title="Betanzos", data={}, options={})
+    hass = SimpleNamespace(
+        data={
+            "meteogalicia": {
+                "entry-1": {"coordinators": []},
+                "http_pool": SimpleNamespace(
+                    conditional_cache=cache,
+                    limiter=api.RequestLimiter(8, 5.0, 10),
+                    breakers={"observation": breaker},
+                    attempt_timeouts={"observation": attempt_timeout},
+                    executor=api.BoundedExecutor(2),
+                ),
+            }
+        }
+    )
+    monkeypatch.setattr(diagnostics.er, "async_get", lambda _hass: object())
+    monkeypatch.setattr(
+        diagnostics.er, "async_entries_for_config_entry", lambda *_args: []
+    )
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["http_cache"]["not_modified"] == 5
+    assert result["http_cache"]["bytes_avoided"] == 40960
+    assert result["http_cache"]["parses_avoided"] == 6
+    assert result["request_limiter"]["queue_depth"] == 0
+    observation = result["circuit_breakers"]["observation"]
+    assert observation["state"] == "open"
+    assert observation["history"][0]["reason"] == "TimeoutError: API timeout"
+    assert result["attempt_timeouts"]["observation"]["timeout_seconds"] == 30
+    assert result["executor"]["max_workers"] == 2
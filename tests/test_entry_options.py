@@ -0,0 +1,296 @@
+"""Tests for applying option changes to a running entry."""
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+
+MEASURES = [
+    {
+        "codigoParametro": "TA_AVG_1.5m",
+        "nomeParametro": "Temperatura",
+        "unidade": "ºC",
+        "valor": 20.5,
+        "lnCodigoValidacion": 1,
+    },
+    {
+        "codigoParametro": "HR_AVG_1.5m",
+        "nomeParametro": "Humidade",
+        "unidade": "%",
+        "valor": 80,
+        "lnCodigoValidacion": 1,
+    },
+]
+
+
+def _forecast(name):
+    return {
+        "predConcello": {
+            "nome": name,
+            "listaPredDiaConcello": [
+                {
+                    "dataPredicion": "2026-08-08T00:00:00",
+                    "ceoDia": 101,
+                    "tMax": 28,
+                    "tMin": 17,
+                    "pchoiva": {"manha": 5, "tarde": 10, "noite": 20},
+                    "uvMax": 6,
+                }
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def measures():
+    """Measures the station serves; tests may drop or restore some."""
+    return list(MEASURES)
+
+
+@pytest.fixture
+def calls(monkeypatch, measures):
+    """Serve every endpoint locally and record each fetch."""
+    calls = []
+
+    async def get_forecast(resource_id, _session):
+        calls.append(("forecast", resource_id))
+        return _forecast("Betanzos" if resource_id == "15009" else "Abegondo")
+
+    async def get_observation(resource_id, _session):
+        calls.append(("observation", resource_id))
+        return {
+            "listaObservacionConcellos": [
+                {"nomeConcello": "Betanzos", "temperatura": 28.0, "icoEstadoCeo": 101}
+            ]
+        }
+
+    async def get_daily(resource_id, _session):
+        calls.append(("station_daily", resource_id))
+        return {
+            "listDatosDiarios": [
+                {
+                    "data": "2026-08-08T00:00:00",
+                    "listaEstacions": [
+                        {"estacion": "Santiago-EOAS", "listaMedidas": list(measures)}
+                    ],
+                }
+            ]
+        }
+
+    async def get_last10(resource_id, _session):
+        calls.append(("station_last10min", resource_id))
+        return {
+            "listUltimos10min": [
+                {
+                    "estacion": "Santiago-EOAS",
+                    "instanteLecturaUTC": "2026-08-08T16:10:00",
+                    "listaMedidas": list(measures),
+                }
+            ]
+        }
+
+    for name, fetch in (
+        ("_async_get_forecast_data_from_api", get_forecast),
+        ("_async_get_observation_data_from_api", get_observation),
+        ("_async_get_observation_dailydata_by_station_from_api", get_daily),
+        ("_async_get_observation_last10mindata_by_station_from_api", get_last10),
+    ):
+        monkeypatch.setattr(coordinator_module, name, fetch)
+    return calls
+
+
+async def _setup(hass, data):
+    entry = MockConfigEntry(domain=const.DOMAIN, unique_id="test", data=data)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _set_options(hass, entry, options):
+    hass.config_entries.async_update_entry(entry, options=options)
+    await hass.async_block_till_done()
+
+
+def _unique_ids(hass, entry):
+    registry = er.async_get(hass)
+    return {
+        item.unique_id
+        for item in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if item.entity_category is None
+    }
+
+
+def _state(hass, domain, unique_id):
+    entity_id = er.async_get(hass).async_get_entity_id(domain, const.DOMAIN, unique_id)
+    return hass.states.get(entity_id)
+
+
+def _coordinator(hass, endpoint, id_value):
+    shared = hass.data[const.DOMAIN][const.DATA_COORDINATORS].get((endpoint, id_value))
+    return shared.coordinator if shared is not None else None
+
+
+@pytest.mark.asyncio
+async def test_scan_interval_change_retunes_running_coordinators(
+    hass, enable_custom_integrations, calls
+):
+    entry = await _setup(hass, {const.CONF_ID_CONCELLO: "15009"})
+    forecast = _coordinator(hass, "forecast", "15009")
+    fetched = len(calls)
+
+    await _set_options(
+        hass, entry, {CONF_SCAN_INTERVAL: 600, const.CONF_MAX_STALE_AGE: 3600}
+    )
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert len(calls) == fetched
+    assert _coordinator(hass, "forecast", "15009") is forecast
+    assert forecast.scan_interval == timedelta(seconds=600)
+    # The forecast schedule and the coordinator's phase stay in effect.
+    assert forecast.update_interval == (
+        timedelta(seconds=600)
+        + coordinator_module._ALIGNED_POLL_SPREAD * forecast._phase
+    )
+    assert forecast.max_stale_age == timedelta(seconds=3600)
+    assert _state(hass, "weather", "meteogalicia_weather_15009").state == "sunny"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_measure_change_only_adds_and_removes_affected_entities(
+    hass, enable_custom_integrations, calls
+):
+    entry = await _setup(hass, {const.CONF_ID_ESTACION: "10124"})
+    daily = _coordinator(hass, "station_daily", "10124")
+    station_entities = hass.data[const.DOMAIN][entry.entry_id]["station_entities"]
+    removed = station_entities["meteogalicia_station_10124_daily_TA_AVG_1.5m"]
+    removed_entity_id = removed.entity_id
+    fetched = len(calls)
+
+    await _set_options(
+        hass, entry, {const.CONF_ID_ESTACION_MEDIDA_DAILY: "TA_AVG_1.5m"}
+    )
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert len(calls) == fetched
+    assert _unique_ids(hass, entry) == {
+        "meteogalicia_10124_station_daily_data__ta_avg_1.5m_10124"
+    }
+    assert "meteogalicia_station_10124_daily_TA_AVG_1.5m" not in station_entities
+    assert hass.states.get(removed_entity_id) is None
+    assert er.async_get(hass).async_get(removed_entity_id) is None
+    # The last-10-minutes coordinator is no longer used and has been released.
+    assert _coordinator(hass, "station_last10min", "10124") is None
+    assert hass.data[const.DOMAIN][entry.entry_id]["coordinators"] == [daily]
+    state = _state(
+        hass, "sensor", "meteogalicia_10124_station_daily_data__ta_avg_1.5m_10124"
+    )
+    assert state.state == "20.5"
+
+    await _set_options(hass, entry, {})
+
+    assert ("station_last10min", "10124") in calls
+    assert "meteogalicia_station_10124_last_10_min_HR_AVG_1.5m" in _unique_ids(
+        hass, entry
+    )
+    assert _coordinator(hass, "station_daily", "10124") is daily
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_option_change_keeps_entities_of_measures_missing_for_now(
+    hass, enable_custom_integrations, calls, measures
+):
+    entry = await _setup(hass, {const.CONF_ID_ESTACION: "10124"})
+    registry = er.async_get(hass)
+    unique_id = "meteogalicia_station_10124_last_10_min_HR_AVG_1.5m"
+    entity_id = registry.async_get_entity_id("sensor", const.DOMAIN, unique_id)
+    registry.async_update_entity(entity_id, name="Humidade do xardín")
+    last10 = _coordinator(hass, "station_last10min", "10124")
+
+    # Around midnight the station briefly stops publishing the humidity.
+    measures.remove(MEASURES[1])
+    await last10.async_refresh()
+    await _set_options(hass, entry, {const.CONF_SLIM_STATION_ATTRIBUTES: True})
+
+    assert unique_id in hass.data[const.DOMAIN][entry.entry_id]["station_entities"]
+    assert registry.async_get(entity_id).name == "Humidade do xardín"
+    assert hass.states.get(entity_id).state == "unavailable"
+
+    measures.append(MEASURES[1])
+    await last10.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == "80"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_slim_change_rerenders_the_station_sensors_in_place(
+    hass, enable_custom_integrations, calls
+):
+    entry = await _setup(
+        hass,
+        {
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_DAILY: "TA_AVG_1.5m",
+        },
+    )
+    station_entities = hass.data[const.DOMAIN][entry.entry_id]["station_entities"]
+    (sensor,) = [
+        entity
+        for entity in station_entities.values()
+        if entity.entity_category is None
+    ]
+    assert "HR_AVG_1.5m_value" in hass.states.get(sensor.entity_id).attributes
+
+    await _set_options(hass, entry, {const.CONF_SLIM_STATION_ATTRIBUTES: True})
+
+    assert station_entities[sensor.unique_id] is sensor
+    assert sensor.slim is True
+    attributes = hass.states.get(sensor.entity_id).attributes
+    assert "HR_AVG_1.5m_value" not in attributes
+    assert attributes["TA_AVG_1.5m_value"] == 20.5
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_id_change_reloads_the_entry(hass, enable_custom_integrations, calls):
+    entry = await _setup(hass, {const.CONF_ID_CONCELLO: "15009"})
+
+    await _set_options(hass, entry, {const.CONF_ID_CONCELLO: "15001"})
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert ("forecast", "15001") in calls
+    assert _coordinator(hass, "forecast", "15009") is None
+    assert _coordinator(hass, "forecast", "15001") is not None
+    assert hass.data[const.DOMAIN][entry.entry_id]["config"][
+        const.CONF_ID_CONCELLO
+    ] == "15001"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_reload_keeps_the_data_of_coordinators_still_needed(
+    hass, enable_custom_integrations, calls
+):
+    entry = await _setup(hass, {const.CONF_ID_CONCELLO: "15009"})
+    forecast = _coordinator(hass, "forecast", "15009")
+    fetched = len(calls)
+
+    # An option without a live path falls back to a reload of the entry.
+    await _set_options(hass, entry, {"future_option": True})
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert _coordinator(hass, "forecast", "15009") is forecast
+    assert len(calls) == fetched
+    assert _state(hass, "weather", "meteogalicia_weather_15009").state == "sunny"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert hass.data[const.DOMAIN][const.DATA_COORDINATORS] == {}
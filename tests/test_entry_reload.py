@@ -16,6 +16,10 @@ async def test_options_update_reloads_entry():
     class Hass:
         config_entries = ConfigEntries()
 
+        def __init__(self):
+            # The entry is not loaded, so there is no running state to update.
+            self.data = {}
+
     class Entry:
         entry_id = "entry-id"
 
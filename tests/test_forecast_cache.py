@@ -0,0 +1,108 @@
+"""Tests for the memoized daily forecast and its push to subscribers."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from custom_components.meteogalicia.model import parse_forecast
+from custom_components.meteogalicia.weather import MeteoGaliciaWeather
+
+
+def _payload(max_temperature=24, night_rain=20):
+    return {
+        "predConcello": {
+            "listaPredDiaConcello": [
+                {
+                    "dataPredicion": "2026-08-08",
+                    "ceoDia": 103,
+                    "tMax": max_temperature,
+                    "tMin": 15,
+                    "pchoiva": {"manha": 10, "tarde": 30, "noite": night_rain},
+                    "uvMax": 7,
+                }
+            ]
+        }
+    }
+
+
+def _weather(payload, data_version=0):
+    entity = object.__new__(MeteoGaliciaWeather)
+    entity.coordinator = SimpleNamespace(
+        model=parse_forecast(payload), data_version=data_version
+    )
+    return entity
+
+
+def _refresh(entity, payload):
+    entity.coordinator.model = parse_forecast(payload)
+    entity.coordinator.data_version += 1
+
+
+async def test_forecast_is_built_once_per_data_version():
+    entity = _weather(_payload())
+
+    first = await entity.async_forecast_daily()
+
+    assert await entity.async_forecast_daily() is first
+    _refresh(entity, _payload())
+    assert await entity.async_forecast_daily() is first
+    _refresh(entity, _payload(max_temperature=26))
+    changed = await entity.async_forecast_daily()
+    assert changed is not first
+    assert changed[0]["native_temperature"] == 26
+
+
+async def test_forecast_types_are_cached_separately():
+    entity = _weather(_payload())
+
+    daily = await entity.async_forecast_daily()
+    twice_daily = await entity.async_forecast_twice_daily()
+
+    assert await entity.async_forecast_daily() is daily
+    assert await entity.async_forecast_twice_daily() is twice_daily
+    _refresh(entity, _payload(night_rain=5))
+    assert await entity.async_forecast_daily() is daily
+    assert await entity.async_forecast_twice_daily() is not twice_daily
+
+
+async def test_forecast_without_data_version_is_rebuilt():
+    entity = object.__new__(MeteoGaliciaWeather)
+    entity.coordinator = SimpleNamespace(model=parse_forecast(_payload()))
+
+    first = await entity.async_forecast_daily()
+
+    assert await entity.async_forecast_daily() == first
+    assert await entity.async_forecast_daily() is not first
+
+
+async def test_subscribers_are_updated_only_when_the_forecast_changes(hass):
+    entity = _weather(_payload())
+    entity.hass = hass
+    entity.async_update_listeners = AsyncMock()
+    # A write is already scheduled, so the update only merges into it.
+    entity._pending_write = object()
+    entity.coalesced_writes = 0
+
+    entity._handle_coordinator_update()
+    await hass.async_block_till_done()
+    assert entity.async_update_listeners.await_count == 1
+    entity.async_update_listeners.assert_awaited_with(("daily", "twice_daily"))
+
+    _refresh(entity, _payload())
+    entity._handle_coordinator_update()
+    entity._handle_coordinator_update()
+    await hass.async_block_till_done()
+    assert entity.async_update_listeners.await_count == 1
+
+    _refresh(entity, _payload(max_temperature=26))
+    entity._handle_coordinator_update()
+    await hass.async_block_till_done()
+    assert entity.async_update_listeners.await_count == 2
+    entity.async_update_listeners.assert_awaited_with(("daily", "twice_daily"))
+
+    # The daily maximum is unchanged, only the night period differs.
+    _refresh(entity, _payload(max_temperature=26, night_rain=5))
+    entity._handle_coordinator_update()
+    await hass.async_block_till_done()
+    assert entity.async_update_listeners.await_count == 3
+    entity.async_update_listeners.assert_awaited_with(("twice_daily",))
+    assert entity.coalesced_writes == 5
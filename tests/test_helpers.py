@@ -1,6 +1,11 @@
 from datetime import datetime, timezone
 
 from custom_components.meteogalicia import sensor
+from custom_components.meteogalicia.model import parse_forecast
+
+
+def _forecast_day(item):
+    return parse_forecast({"predConcello": {"listaPredDiaConcello": [item]}}).days[0]
 from pytest import approx
 
 
@@ -40,18 +45,23 @@ def test_get_coordinator_api_latency_ms_unknown():
 
 
 def test_get_state_forecast_rain_by_day_sensor_max():
-    item = {"pchoiva": {"manha": 10, "tarde": 20, "noite": 5}}
-    assert sensor.get_state_forecast_rain_by_day_sensor(True, item) == 20
+    day = _forecast_day({"pchoiva": {"manha": 10, "tarde": 20, "noite": 5}})
+    assert sensor.get_state_forecast_rain_by_day_sensor(True, day) == 20
 
 
 def test_get_state_forecast_rain_by_day_sensor_slot(monkeypatch):
-    item = {"pchoiva": {"manha": 10, "tarde": 20, "noite": 5}}
+    day = _forecast_day({"pchoiva": {"manha": 10, "tarde": 20, "noite": 5}})
     # For a fixed hour, simulate night slot
     monkeypatch.setattr(sensor.dt, "now", lambda: datetime(2024, 1, 1, 23, 0))
 
-    assert sensor.get_state_forecast_rain_by_day_sensor(False, item) == 5
+    assert sensor.get_state_forecast_rain_by_day_sensor(False, day) == 5
 
 
 def test_get_state_forecast_rain_by_day_sensor_invalid():
-    item = {"pchoiva": {"manha": -9999}}
-    assert sensor.get_state_forecast_rain_by_day_sensor(True, item) is None
+    day = _forecast_day({"pchoiva": {"manha": -9999}})
+    assert sensor.get_state_forecast_rain_by_day_sensor(True, day) is None
+
+
+def test_get_state_forecast_rain_by_day_sensor_without_probabilities():
+    day = _forecast_day({})
+    assert sensor.get_state_forecast_rain_by_day_sensor(True, day) is None
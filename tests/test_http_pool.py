@@ -0,0 +1,140 @@
+"""Tests for the shared MeteoGalicia HTTP pool."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components import meteogalicia
+from custom_components.meteogalicia import api, config_flow, const
+
+
+class DummyHass:
+    """Minimal Home Assistant stand-in for pool leases."""
+
+    def __init__(self):
+        self.data = {}
+        self.executor_jobs = []
+
+    async def async_add_executor_job(self, target, *args):
+        self.executor_jobs.append(target)
+        return target(*args)
+
+
+@pytest.mark.asyncio
+async def test_pool_is_shared_and_closed_by_its_last_user(monkeypatch):
+    hass = DummyHass()
+    first = api.async_acquire_http_pool(hass)
+    second = api.async_acquire_http_pool(hass)
+    closed = []
+    monkeypatch.setattr(first.requests_session, "close", lambda: closed.append(True))
+
+    assert first is second
+    assert first.references == 2
+    adapter = first.requests_session.get_adapter("https://servizos.meteogalicia.gal")
+    assert adapter._pool_maxsize == const.HTTP_POOL_SIZE
+
+    await api.async_release_http_pool(hass, first)
+    assert closed == []
+    assert hass.data[const.DOMAIN][const.DATA_HTTP_POOL] is first
+
+    await api.async_release_http_pool(hass, second)
+    assert closed == [True]
+    assert hass.executor_jobs == []
+    assert const.DATA_HTTP_POOL not in hass.data[const.DOMAIN]
+    assert api.async_acquire_http_pool(hass) is not first
+
+
+@pytest.mark.asyncio
+async def test_failed_platform_setup_returns_the_entry_lease():
+    hass = DummyHass()
+
+    async def forward_entry_setups(_entry, _platforms):
+        raise RuntimeError("platform setup failed")
+
+    hass.config_entries = SimpleNamespace(
+        async_forward_entry_setups=forward_entry_setups
+    )
+    entry = SimpleNamespace(
+        entry_id="entry-1",
+        title="Betanzos",
+        data={const.CONF_ID_CONCELLO: "15009"},
+        options={},
+        add_update_listener=lambda _listener: None,
+        async_on_unload=lambda _callback: None,
+    )
+
+    with pytest.raises(RuntimeError):
+        await meteogalicia.async_setup_entry(hass, entry)
+
+    assert const.DATA_HTTP_POOL not in hass.data[const.DOMAIN]
+    assert entry.entry_id not in hass.data[const.DOMAIN]
+
+
+@pytest.mark.asyncio
+async def test_config_flow_validation_leases_the_pool(monkeypatch):
+    hass = DummyHass()
+    entry_lease = api.async_acquire_http_pool(hass)
+    sessions = []
+
+    def validate(user_input, session):
+        sessions.append(session)
+        assert entry_lease.references == 2
+        return "MeteoGalicia Betanzos"
+
+    monkeypatch.setattr(config_flow, "_validate_api_input", validate)
+
+    title = await config_flow._async_validate_api_input(
+        hass, {const.CONF_ID_CONCELLO: "15009"}
+    )
+
+    assert title == "MeteoGalicia Betanzos"
+    assert sessions == [entry_lease.requests_session]
+    assert entry_lease.references == 1
+    assert hass.executor_jobs == []
+    assert entry_lease.executor.as_dict()["jobs"] == 1
+    await api.async_release_http_pool(hass, entry_lease)
+
+
+def test_pool_exposes_home_assistant_aiohttp_session(monkeypatch):
+    shared = SimpleNamespace()
+    monkeypatch.setattr(api, "async_get_clientsession", lambda _hass: shared)
+
+    assert api.async_acquire_http_pool(DummyHass()).session is shared
+
+
+@pytest.mark.asyncio
+async def test_executor_reports_queue_wait_and_run_time():
+    executor = api.BoundedExecutor(1)
+
+    await asyncio.gather(*(executor.async_submit(time.sleep, 0.02) for _ in range(3)))
+    stats = executor.as_dict()
+    await executor.async_shutdown()
+
+    assert stats["jobs"] == 3
+    assert stats["max_queue_depth"] >= 2
+    assert stats["queue_depth"] == 0
+    assert stats["running"] == 0
+    assert stats["max_wait_ms"] >= 20
+    assert stats["mean_run_ms"] >= 20
+
+
+@pytest.mark.asyncio
+async def test_executor_job_cancelled_in_the_queue_leaves_it():
+    executor = api.BoundedExecutor(1)
+    release = threading.Event()
+    blocking = executor.async_submit(release.wait, 5)
+    queued = executor.async_submit(time.sleep, 0)
+
+    queued.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await blocking
+    stats = executor.as_dict()
+    await executor.async_shutdown()
+
+    assert stats["queue_depth"] == 0
+    assert stats["jobs"] == 1
+
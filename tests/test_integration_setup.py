@@ -42,15 +42,18 @@ async def test_municipality_entry_creates_weather_with_observed_freshness(
             }
         ]
     }
+
+    async def get_forecast(_resource_id, _session):
+        return forecast
+
+    async def get_observation(_resource_id, _session):
+        return observation
+
     monkeypatch.setattr(
-        coordinator_module,
-        "_get_forecast_data_from_api",
-        lambda _resource_id, _session: forecast,
+        coordinator_module, "_async_get_forecast_data_from_api", get_forecast
     )
     monkeypatch.setattr(
-        coordinator_module,
-        "_get_observation_data_from_api",
-        lambda _resource_id, _session: observation,
+        coordinator_module, "_async_get_observation_data_from_api", get_observation
     )
     monkeypatch.setattr(
         coordinator_module,
@@ -94,3 +97,87 @@ async def test_municipality_entry_creates_weather_with_observed_freshness(
     assert sensor_state.attributes["data_stale"] is False
 
     assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+
+@pytest.mark.asyncio
+async def test_entries_for_the_same_station_fetch_each_endpoint_once(
+    hass, enable_custom_integrations, monkeypatch
+):
+    calls = []
+    measure = {
+        "codigoParametro": "TA_AVG_1.5m",
+        "nomeParametro": "Temperatura",
+        "unidade": "ºC",
+        "valor": 20.5,
+        "lnCodigoValidacion": 1,
+    }
+
+    async def get_daily(resource_id, _session):
+        calls.append(("station_daily", resource_id))
+        return {
+            "listDatosDiarios": [
+                {
+                    "data": "2026-08-08T00:00:00",
+                    "listaEstacions": [
+                        {"estacion": "Santiago-EOAS", "listaMedidas": [measure]}
+                    ],
+                }
+            ]
+        }
+
+    async def get_last10(resource_id, _session):
+        calls.append(("station_last10min", resource_id))
+        return {
+            "listUltimos10min": [
+                {
+                    "estacion": "Santiago-EOAS",
+                    "instanteLecturaUTC": "2026-08-08T16:10:00",
+                    "listaMedidas": [measure],
+                }
+            ]
+        }
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_dailydata_by_station_from_api",
+        get_daily,
+    )
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_last10mindata_by_station_from_api",
+        get_last10,
+    )
+    daily_entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="MeteoGalicia Santiago daily",
+        unique_id="estacion_10124_TA_AVG_1.5m_",
+        data={
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_DAILY: "TA_AVG_1.5m",
+        },
+    )
+    station_entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="MeteoGalicia Santiago",
+        unique_id="estacion_10124",
+        data={const.CONF_ID_ESTACION: "10124"},
+    )
+    for entry in (daily_entry, station_entry):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert sorted(calls) == [
+        ("station_daily", "10124"),
+        ("station_last10min", "10124"),
+    ]
+    domain_data = hass.data[const.DOMAIN]
+    (daily_coordinator,) = domain_data[daily_entry.entry_id]["coordinators"]
+    assert daily_coordinator in domain_data[station_entry.entry_id]["coordinators"]
+
+    assert await hass.config_entries.async_unload(daily_entry.entry_id)
+    assert daily_coordinator._http_pool is not None
+    assert await hass.config_entries.async_unload(station_entry.entry_id)
+    assert daily_coordinator._http_pool is None
+    assert domain_data[const.DATA_COORDINATORS] == {}
@@ -0,0 +1,172 @@
+"""Tests for the typed models parsed from MeteoGalicia payloads."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaStationLast10MinCoordinator,
+)
+from custom_components.meteogalicia.model import (
+    parse_forecast,
+    parse_observation,
+    parse_station_daily,
+    parse_station_last10,
+)
+
+
+def _measure(code, value, validation=1):
+    return {
+        "codigoParametro": code,
+        "nomeParametro": "Temperatura",
+        "unidade": "ºC",
+        "valor": value,
+        "lnCodigoValidacion": validation,
+    }
+
+
+def test_forecast_keeps_the_fields_used_by_entities():
+    forecast = parse_forecast(
+        {
+            "predConcello": {
+                "nome": "Betanzos",
+                "listaPredDiaConcello": [
+                    {
+                        "dataPredicion": "2026-08-08",
+                        "ceoDia": 103,
+                        "tMax": 24,
+                        "tMin": -9999,
+                        "uvMax": 7,
+                        "pchoiva": {"manha": 10, "tarde": 30, "noite": 20},
+                        "ceo": {"manha": 101, "tarde": 103, "noite": 201},
+                    },
+                    "invalid",
+                ],
+            }
+        }
+    )
+
+    assert forecast.name == "Betanzos"
+    assert len(forecast.days) == 1
+    day = forecast.days[0]
+    assert (day.date, day.sky_code, day.max_temperature, day.min_temperature) == (
+        "2026-08-08",
+        103,
+        24,
+        -9999,
+    )
+    assert day.rain.values() == (10, 30, 20)
+    assert day.sky.values() == (101, 103, 201)
+    with pytest.raises(FrozenInstanceError):
+        day.max_temperature = 25
+
+
+@pytest.mark.parametrize("payload", [None, {}, {"predConcello": None}])
+def test_forecast_is_none_without_a_forecast(payload):
+    assert parse_forecast(payload) is None
+
+
+def test_observation_uses_the_first_record():
+    observation = parse_observation(
+        {
+            "listaObservacionConcellos": [
+                {
+                    "temperatura": 18.4,
+                    "sensacionTermica": 17.8,
+                    "icoEstadoCeo": 111,
+                    "nomeConcello": "Betanzos",
+                }
+            ]
+        }
+    )
+
+    assert observation.temperature == 18.4
+    assert observation.apparent_temperature == 17.8
+    assert observation.sky_code == 111
+    assert observation.reference == "Betanzos"
+    assert parse_observation({"listaObservacionConcellos": []}) is None
+
+
+def test_station_measures_are_indexed_by_code_keeping_the_first():
+    reading = parse_station_last10(
+        {
+            "listUltimos10min": [
+                {
+                    "estacion": "Santiago-EOAS",
+                    "idEstacion": 10124,
+                    "instanteLecturaUTC": "2026-08-08T16:10:00",
+                    "listaMedidas": [
+                        _measure("TA_AVG_1.5m", 20.5),
+                        _measure("HR_AVG_1.5m", -9999, 9),
+                        _measure("TA_AVG_1.5m", 99),
+                        {"valor": 1},
+                    ],
+                }
+            ]
+        }
+    )
+
+    assert reading.station == "Santiago-EOAS"
+    assert reading.station_id == 10124
+    assert list(reading.measures) == ["TA_AVG_1.5m", "HR_AVG_1.5m"]
+    assert reading.measures["TA_AVG_1.5m"].value == 20.5
+    assert reading.measures["HR_AVG_1.5m"].validation == 9
+    assert dict(reading.valid_values) == {"TA_AVG_1.5m": 20.5, "HR_AVG_1.5m": None}
+    with pytest.raises(TypeError):
+        reading.measures["new"] = None
+
+
+@pytest.mark.parametrize(
+    ("value", "validation", "expected"),
+    [(20.5, 1, 20.5), (20.5, 5, 20.5), (20.5, 3, None), (-9999, 1, None)],
+)
+def test_valid_values_keep_only_original_or_interpolated_data(
+    value, validation, expected
+):
+    reading = parse_station_last10(
+        {"listUltimos10min": [{"listaMedidas": [_measure("TA", value, validation)]}]}
+    )
+
+    assert reading.valid_values["TA"] == expected
+
+
+def test_daily_station_reading_and_shared_strings():
+    payload = {
+        "listDatosDiarios": [
+            {
+                "data": "2026-08-08",
+                "listaEstacions": [
+                    {
+                        "estacion": "Santiago-EOAS",
+                        "concello": "Santiago",
+                        "listaMedidas": [_measure("TA_AVG_1.5m", 20.5)],
+                    }
+                ],
+            }
+        ]
+    }
+
+    first = parse_station_daily(payload)
+    second = parse_station_daily(payload)
+
+    assert first.date == "2026-08-08"
+    assert first.concello == "Santiago"
+    assert first.measures["TA_AVG_1.5m"].unit is second.measures["TA_AVG_1.5m"].unit
+    assert parse_station_daily({"listDatosDiarios": [{}]}) is None
+
+
+async def test_coordinator_parses_each_payload_once(hass):
+    coordinator = MeteoGaliciaStationLast10MinCoordinator(hass, "10124", 600)
+    assert coordinator.model is None
+
+    payload = {"listUltimos10min": [{"listaMedidas": [_measure("TA_AVG_1.5m", 1)]}]}
+    coordinator.async_set_updated_data(payload)
+    model = coordinator.model
+
+    assert model is coordinator.model
+    coordinator.async_set_updated_data(
+        {"listUltimos10min": [{"listaMedidas": [_measure("TA_AVG_1.5m", 2)]}]}
+    )
+    assert coordinator.model is not model
+    assert coordinator.model.measures["TA_AVG_1.5m"].value == 2
+    await coordinator.async_close()
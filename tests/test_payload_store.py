@@ -0,0 +1,127 @@
+"""Tests for the persisted MeteoGalicia payloads used at startup."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.store import (
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    async_get_payload_store,
+)
+
+STORED_LAST10 = {
+    "listUltimos10min": [
+        {
+            "estacion": "Santiago-EOAS",
+            "instanteLecturaUTC": "2026-08-08T10:00:00",
+            "listaMedidas": [],
+        }
+    ]
+}
+LIVE_LAST10 = {
+    "listUltimos10min": [
+        {
+            "estacion": "Santiago-EOAS",
+            "instanteLecturaUTC": "2026-08-08T16:10:00",
+            "listaMedidas": [],
+        }
+    ]
+}
+
+
+def _stored(payloads, saved_at):
+    return {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "payloads": {
+                key: {
+                    "data": data,
+                    "data_timestamp": None,
+                    "saved_at": saved_at.isoformat(),
+                }
+                for key, data in payloads.items()
+            }
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_store_drops_payloads_older_than_the_maximum_age(hass, hass_storage):
+    now = datetime.now(timezone.utc)
+    hass_storage[STORAGE_KEY] = _stored(
+        {"station_last10min_10124": STORED_LAST10}, now - timedelta(days=3)
+    )
+    hass_storage[STORAGE_KEY]["data"]["payloads"]["forecast_15009"] = {
+        "data": {"predConcello": {"nome": "Betanzos"}},
+        "data_timestamp": None,
+        "saved_at": now.isoformat(),
+    }
+    store = async_get_payload_store(hass)
+
+    await store.async_load()
+
+    assert store.async_get("station_last10min", "10124") is None
+    assert store.async_get("forecast", "15009")["data"] == {
+        "predConcello": {"nome": "Betanzos"}
+    }
+
+
+@pytest.mark.asyncio
+async def test_stored_payload_gives_entities_a_state_before_the_live_fetch(
+    hass, hass_storage, enable_custom_integrations, monkeypatch
+):
+    hass_storage[STORAGE_KEY] = _stored(
+        {"station_last10min_10124": STORED_LAST10}, datetime.now(timezone.utc)
+    )
+    release_fetch = asyncio.Event()
+
+    async def get_last10(_resource_id, _http_pool):
+        await release_fetch.wait()
+        return LIVE_LAST10
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_last10mindata_by_station_from_api",
+        get_last10,
+    )
+    monkeypatch.setattr(
+        coordinator_module,
+        "_utcnow",
+        lambda: datetime(2026, 8, 8, 16, 20, tzinfo=timezone.utc),
+    )
+    monkeypatch.setattr(coordinator_module, "_STARTUP_REFRESH_SPREAD", timedelta(0))
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="MeteoGalicia Santiago",
+        unique_id="estacion_10124_TA_AVG_1.5m",
+        data={
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_LAST10MIN: "TA_AVG_1.5m",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    (coordinator,) = hass.data[const.DOMAIN][entry.entry_id]["coordinators"]
+
+    assert coordinator.data is not None
+    assert coordinator.data_timestamp == "2026-08-08T10:00:00+00:00"
+    assert coordinator.data_is_stale is True
+    assert hass.states.async_all("sensor")
+
+    release_fetch.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data == LIVE_LAST10
+    assert coordinator.data_is_stale is False
+    record = async_get_payload_store(hass).async_get("station_last10min", "10124")
+    assert record["data"] == LIVE_LAST10
+    assert record["data_timestamp"] == "2026-08-08T16:10:00+00:00"
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,167 @@
+"""Tests for the domain-wide MeteoGalicia request limiter."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.api import (
+    CircuitBreaker,
+    MeteoGaliciaHttpPool,
+    RequestLimiter,
+)
+from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaObservationCoordinator,
+    _async_api_call_with_latency,
+    _phase_fraction,
+    async_get_entry_coordinator,
+    async_release_entry_coordinators,
+)
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_requests_in_flight_and_reports_the_queue():
+    limiter = RequestLimiter(max_in_flight=2, rate=1000, burst=1000)
+    peak = 0
+    depths = []
+
+    async def request():
+        nonlocal peak
+        async with limiter.async_slot():
+            peak = max(peak, limiter.in_flight)
+            depths.append(limiter.queue_depth)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    stats = limiter.as_dict()
+    assert peak == 2
+    # The first two requests pass straight through; the other four queue.
+    assert stats["max_queue_depth"] == 4
+    assert depths[-1] == 0
+    assert stats["requests"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["max_wait_ms"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_limiter_spaces_requests_beyond_the_burst():
+    limiter = RequestLimiter(max_in_flight=10, rate=20, burst=2)
+
+    async def request():
+        async with limiter.async_slot():
+            pass
+
+    started = time.monotonic()
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    # Two requests use the burst; the other four wait 1/20 s for each token.
+    assert time.monotonic() - started >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_slot():
+    limiter = RequestLimiter(max_in_flight=1, rate=0.5, burst=1)
+    async with limiter.async_slot():
+        pass
+
+    waiter = asyncio.create_task(limiter.async_slot().__aenter__())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.queue_depth == 0
+    assert limiter._semaphore.locked() is False
+
+
+async def test_waiting_in_the_limiter_does_not_trip_the_breaker(monkeypatch):
+    # Scaled down so the queue outlasts the attempt timeout in a fraction of a
+    # second: 100 requests per second and a 50 ms attempt timeout.
+    monkeypatch.setattr(const, "REQUESTS_PER_SECOND", 100.0)
+    monkeypatch.setattr(const, "REQUEST_BURST", 1)
+    monkeypatch.setattr(const, "ATTEMPT_TIMEOUT_MIN", 0.05)
+    monkeypatch.setattr(const, "ATTEMPT_TIMEOUT_MAX", 0.05)
+    pool = MeteoGaliciaHttpPool(None, None)
+    breaker = pool.breaker("observation")
+    requests = 4 * int(const.REQUESTS_PER_SECOND * const.ATTEMPT_TIMEOUT_MIN)
+
+    async def healthy_fetch(resource_id, _session):
+        await asyncio.sleep(0.01)
+        return {"id": resource_id}
+
+    results = await asyncio.gather(
+        *(
+            _async_api_call_with_latency(
+                SimpleNamespace(last_api_latency_ms=None, last_api_connected_at=None),
+                healthy_fetch,
+                f"{index:05d}",
+                "session",
+                breaker=breaker,
+                attempt_timeout=pool.attempt_timeout("observation"),
+                limiter=pool.limiter,
+            )
+            for index in range(requests)
+        ),
+        return_exceptions=True,
+    )
+
+    assert [result for result in results if isinstance(result, BaseException)] == []
+    assert pool.limiter.max_wait_ms > const.ATTEMPT_TIMEOUT_MIN * 1000
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.as_dict()["history"] == []
+
+
+async def test_limiter_absorbs_a_cold_start_of_200_entries(hass, monkeypatch):
+    # Same scaling as above: the whole burst queues for ten attempt timeouts.
+    monkeypatch.setattr(const, "REQUESTS_PER_SECOND", 400.0)
+    monkeypatch.setattr(const, "ATTEMPT_TIMEOUT_MIN", 0.05)
+    monkeypatch.setattr(const, "ATTEMPT_TIMEOUT_MAX", 0.05)
+    fetched = []
+
+    async def healthy_get_json(_session, url, _timeout, _cache):
+        # Only the HTTP exchange is faked; the real fetch path queues first.
+        await asyncio.sleep(0.01)
+        fetched.append(url)
+        return {"listaObservacionConcellos": [{"nomeConcello": url[-5:]}]}
+
+    monkeypatch.setattr(coordinator_module, "async_get_json", healthy_get_json)
+    entries = [f"entry_{index:03d}" for index in range(200)]
+    # No stored payloads: every entry awaits its first live refresh.
+    coordinators = await asyncio.gather(
+        *(
+            async_get_entry_coordinator(
+                hass,
+                entry_id,
+                MeteoGaliciaObservationCoordinator,
+                f"{15000 + index:05d}",
+                600,
+            )
+            for index, entry_id in enumerate(entries)
+        )
+    )
+    pool = coordinators[0]._http_pool
+
+    assert len(fetched) == 200
+    assert all(coordinator.last_update_success for coordinator in coordinators)
+    assert pool.limiter.max_wait_ms > const.ATTEMPT_TIMEOUT_MAX * 1000 * 5
+    assert pool.breaker("observation").state == CircuitBreaker.CLOSED
+    assert pool.attempt_timeout("observation").timeouts == 0
+    for entry_id in entries:
+        await async_release_entry_coordinators(
+            hass, entry_id, hass.data[const.DOMAIN][entry_id]["coordinators"]
+        )
+
+
+def test_coordinator_phases_are_stable_and_spread_across_the_interval():
+    phases = [
+        _phase_fraction(f"meteogalicia_observation_{index:05d}") for index in range(200)
+    ]
+
+    assert phases[0] == _phase_fraction("meteogalicia_observation_00000")
+    assert all(0 <= phase < 1 for phase in phases)
+    assert max(phases) - min(phases) > 0.9
+    assert len({round(phase, 2) for phase in phases}) > 80
@@ -0,0 +1,158 @@
+"""Tests for the deadline-aware retry policy and adaptive attempt timeouts."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.api import (
+    AdaptiveTimeout,
+    CircuitBreaker,
+    MeteoGaliciaHttpPool,
+    RequestLimiter,
+)
+from custom_components.meteogalicia.coordinator import _async_api_call_with_latency
+
+
+def _coordinator_double():
+    return SimpleNamespace(last_api_latency_ms=None, last_api_connected_at=None)
+
+
+def test_attempt_timeout_uses_the_ceiling_until_latencies_are_known():
+    attempt_timeout = AdaptiveTimeout(minimum=5, maximum=30, factor=3)
+
+    for _ in range(4):
+        attempt_timeout.record(0.2)
+
+    assert attempt_timeout.p99 is None
+    assert attempt_timeout.timeout() == 30
+
+
+def test_attempt_timeout_follows_the_p99_within_its_bounds():
+    attempt_timeout = AdaptiveTimeout(minimum=5, maximum=30, factor=3)
+
+    for _ in range(49):
+        attempt_timeout.record(0.2)
+    assert attempt_timeout.timeout() == 5
+
+    attempt_timeout.record(4.0)
+    assert attempt_timeout.p99 == 4.0
+    assert attempt_timeout.timeout() == 12.0
+
+    for _ in range(5):
+        attempt_timeout.record(12.0, timed_out=True)
+    assert attempt_timeout.timeout() == 30
+    assert attempt_timeout.as_dict()["timeouts"] == 5
+
+
+def test_pool_shares_one_attempt_timeout_per_endpoint():
+    pool = MeteoGaliciaHttpPool(None, None)
+
+    assert pool.attempt_timeout("forecast") is pool.attempt_timeout("forecast")
+    assert pool.attempt_timeout("forecast") is not pool.attempt_timeout("station")
+
+
+@pytest.mark.asyncio
+async def test_hung_attempt_is_abandoned_and_retried_in_the_same_refresh(
+    monkeypatch,
+):
+    monkeypatch.setattr(coordinator_module, "_RETRY_BASE_DELAY", 0.01)
+    attempt_timeout = AdaptiveTimeout(minimum=0.05, maximum=0.05, factor=3)
+    calls = 0
+
+    async def fetch(resource_id, _session):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+        return {"id": resource_id}
+
+    coordinator = _coordinator_double()
+    data = await _async_api_call_with_latency(
+        coordinator, fetch, "15009", "session", attempt_timeout=attempt_timeout
+    )
+
+    assert data == {"id": "15009"}
+    assert calls == 2
+    assert attempt_timeout.timeouts == 1
+    assert coordinator.last_api_latency_ms < 50
+
+
+@pytest.mark.asyncio
+async def test_no_retry_starts_once_the_refresh_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(coordinator_module, "_RETRY_BASE_DELAY", 0.01)
+    calls = 0
+
+    async def fetch(_resource_id, _session):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10)
+
+    with pytest.raises(TimeoutError, match="sin respuesta de MeteoGalicia"):
+        await _async_api_call_with_latency(
+            _coordinator_double(), fetch, "15009", "session", budget=0.05
+        )
+
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_not_part_of_the_attempt_or_its_latency_sample():
+    limiter = RequestLimiter(max_in_flight=1, rate=1000, burst=1000)
+    attempt_timeout = AdaptiveTimeout(minimum=0.1, maximum=0.1, factor=3)
+
+    async def fetch(resource_id, _session):
+        await asyncio.sleep(0.01)
+        return {"id": resource_id}
+
+    async with limiter.async_slot():
+        # Queued behind a request holding the only slot for longer than the
+        # attempt timeout and the whole refresh budget.
+        waiter = asyncio.create_task(
+            _async_api_call_with_latency(
+                _coordinator_double(),
+                fetch,
+                "15009",
+                "session",
+                attempt_timeout=attempt_timeout,
+                limiter=limiter,
+                budget=0.1,
+            )
+        )
+        await asyncio.sleep(0.2)
+
+    assert await waiter == {"id": "15009"}
+    assert attempt_timeout.timeouts == 0
+    assert max(attempt_timeout._samples) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_attempt_cancelled_while_queued_records_nothing():
+    limiter = RequestLimiter(max_in_flight=1, rate=1000, burst=1000)
+    attempt_timeout = AdaptiveTimeout(minimum=0.1, maximum=0.1, factor=3)
+    breaker = CircuitBreaker("observation", failure_threshold=1, reset_timeout=60)
+
+    async def fetch(_resource_id, _session):
+        pytest.fail("A cancelled queued attempt must not reach MeteoGalicia")
+
+    async with limiter.async_slot():
+        waiter = asyncio.create_task(
+            _async_api_call_with_latency(
+                _coordinator_double(),
+                fetch,
+                "15009",
+                "session",
+                breaker=breaker,
+                attempt_timeout=attempt_timeout,
+                limiter=limiter,
+            )
+        )
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    assert attempt_timeout.as_dict()["samples"] == 0
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
@@ -0,0 +1,181 @@
+"""Tests for the publication-aligned polling schedule."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.meteogalicia.schedule import (
+    IssuanceSchedule,
+    PublicationSchedule,
+)
+
+PERIOD = timedelta(minutes=10)
+T0 = datetime(2026, 8, 8, tzinfo=timezone.utc)
+
+
+def _simulate(scan_seconds, adaptive, hours=24):
+    """Poll a 10-minute grid published 180-260 s late; return polls and mean age."""
+    rng = random.Random(1)
+    lags = [timedelta(seconds=rng.uniform(180, 260)) for _ in range(hours * 6 + 1)]
+    schedule = PublicationSchedule(PERIOD)
+    scan_interval = timedelta(seconds=scan_seconds)
+    now = T0 + timedelta(seconds=37)
+    polls = 0
+    last_seen = None
+    pickup_delays = []
+    while now < T0 + timedelta(hours=hours):
+        index = int((now - T0) / PERIOD)
+        while index >= 0 and T0 + index * PERIOD + lags[index] > now:
+            index -= 1
+        timestamp = T0 + index * PERIOD if index >= 0 else None
+        polls += 1
+        if timestamp is not None and (last_seen is None or timestamp > last_seen):
+            pickup_delays.append((now - timestamp).total_seconds())
+            last_seen = timestamp
+        if adaptive:
+            now += schedule.next_interval(now, timestamp, scan_interval)
+        else:
+            now += scan_interval
+    return polls, sum(pickup_delays) / len(pickup_delays)
+
+
+def test_new_record_schedules_the_poll_after_the_next_publication():
+    schedule = PublicationSchedule(PERIOD)
+    first = T0 + timedelta(minutes=10)
+    schedule.next_interval(first + timedelta(seconds=100), first, PERIOD)
+    now = first + timedelta(minutes=10, seconds=30)
+
+    # Found on the first attempt: the lag is bounded by the pickup delay.
+    delay = schedule.next_interval(now, first + PERIOD, PERIOD)
+
+    assert schedule.publication_lag == timedelta(seconds=30)
+    assert delay == timedelta(minutes=10, seconds=30)
+
+
+def test_repeated_record_triggers_short_follow_ups():
+    schedule = PublicationSchedule(PERIOD, max_follow_ups=2)
+    schedule.next_interval(T0 + timedelta(seconds=200), T0, PERIOD)
+    now = T0 + timedelta(minutes=10, seconds=30)
+
+    assert schedule.next_interval(now, T0, PERIOD) == timedelta(seconds=60)
+    assert schedule.next_interval(now, T0, PERIOD) == timedelta(seconds=60)
+    # Publication much later than usual: wait for the next grid slot instead.
+    assert schedule.next_interval(now, T0, PERIOD) == timedelta(minutes=10)
+    assert schedule.as_dict()["repeated_records"] == 3
+
+
+def test_record_without_timestamp_uses_the_configured_interval():
+    schedule = PublicationSchedule(PERIOD)
+
+    assert schedule.next_interval(T0, None, timedelta(seconds=900)) == timedelta(
+        seconds=900
+    )
+
+
+def test_longer_scan_interval_skips_publications():
+    schedule = PublicationSchedule(PERIOD)
+    now = T0 + timedelta(seconds=200)
+
+    delay = schedule.next_interval(now, T0, timedelta(minutes=30))
+
+    assert delay >= timedelta(minutes=20)
+
+
+@pytest.mark.parametrize("scan_seconds", [15, 300])
+def test_aligned_polling_needs_fewer_requests_than_short_intervals(scan_seconds):
+    fixed_polls, fixed_age = _simulate(scan_seconds, adaptive=False)
+    aligned_polls, aligned_age = _simulate(scan_seconds, adaptive=True)
+
+    assert aligned_polls < fixed_polls * 0.6
+    assert aligned_age < fixed_age + 60
+
+
+def test_aligned_polling_lowers_data_age_at_the_publication_period():
+    fixed_polls, fixed_age = _simulate(600, adaptive=False)
+    aligned_polls, aligned_age = _simulate(600, adaptive=True)
+
+    assert aligned_age < fixed_age * 0.6
+    assert aligned_polls < fixed_polls * 1.2
+
+
+def _simulate_forecast(scan_seconds, adaptive, days=8):
+    """Poll a forecast issued around 07:00 and 19:00 UTC (+-15 min) for a week.
+
+    Returns the polls per day and the mean delay until a new issue is seen,
+    both measured after the first day.
+    """
+    rng = random.Random(2)
+    issues = sorted(
+        T0 + timedelta(days=day, hours=hour, minutes=rng.uniform(-15, 15))
+        for day in range(-1, days + 1)
+        for hour in (7, 19)
+    )
+    schedule = IssuanceSchedule()
+    scan_interval = timedelta(seconds=scan_seconds)
+    measured_from = T0 + timedelta(days=1)
+    now = T0 + timedelta(minutes=3)
+    seen = None
+    polls = 0
+    delays = []
+    while now < T0 + timedelta(days=days):
+        current = max(issue for issue in issues if issue <= now)
+        changed = seen is not None and current != seen
+        seen = current
+        if now >= measured_from:
+            polls += 1
+            if changed:
+                delays.append((now - current).total_seconds())
+        if adaptive:
+            now += schedule.next_interval(now, changed, scan_interval)
+        else:
+            now += scan_interval
+    return polls / (days - 1), sum(delays) / len(delays)
+
+
+def test_forecast_polls_an_order_of_magnitude_less_without_getting_staler():
+    fixed_polls, fixed_delay = _simulate_forecast(600, adaptive=False)
+    learnt_polls, learnt_delay = _simulate_forecast(600, adaptive=True)
+
+    assert learnt_polls * 10 <= fixed_polls
+    assert learnt_delay <= fixed_delay + 1
+
+
+def test_forecast_sleeps_until_the_next_issue_window():
+    schedule = IssuanceSchedule()
+    schedule.next_interval(T0 + timedelta(hours=6, minutes=50), False, PERIOD)
+    schedule.next_interval(T0 + timedelta(hours=7), True, PERIOD)
+    day_later = T0 + timedelta(days=1, hours=7, minutes=5)
+
+    # A new issue inside the learnt window ends dense polling until 18:40 or so.
+    assert schedule.next_interval(day_later, True, PERIOD) == timedelta(hours=8)
+    # Inside the window the forecast keeps polling at its own dense interval.
+    assert schedule.next_interval(
+        T0 + timedelta(days=2, hours=6, minutes=45), False, timedelta(seconds=15)
+    ) == timedelta(minutes=10)
+
+
+def test_forecast_retune_keeps_skipping_a_window_whose_issue_was_seen():
+    schedule = IssuanceSchedule()
+    schedule.next_interval(T0 + timedelta(hours=6, minutes=50), False, PERIOD)
+    schedule.next_interval(T0 + timedelta(hours=7), True, PERIOD)
+    schedule.next_interval(T0 + timedelta(days=1, hours=7, minutes=5), True, PERIOD)
+
+    delay = schedule.interval(
+        T0 + timedelta(days=1, hours=7, minutes=10), timedelta(minutes=30)
+    )
+
+    assert delay == timedelta(hours=8)
+    assert schedule.polls == 3
+
+
+def test_forecast_schedule_state_survives_a_restart():
+    schedule = IssuanceSchedule()
+    schedule.next_interval(T0 + timedelta(hours=6, minutes=50), False, PERIOD)
+    schedule.next_interval(T0 + timedelta(hours=7), True, PERIOD)
+    restored = IssuanceSchedule()
+
+    restored.restore(schedule.as_state())
+    delay = restored.next_interval(T0 + timedelta(days=2, hours=1), False, PERIOD)
+
+    assert delay == timedelta(hours=5, minutes=30)
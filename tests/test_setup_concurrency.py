@@ -0,0 +1,134 @@
+"""Tests that an entry's first refreshes run concurrently during setup."""
+
+import asyncio
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+
+# Each endpoint answers after its own delay; sequential refreshes would add up.
+SLOW = 0.6
+FAST = 0.3
+
+FORECAST = {
+    "predConcello": {
+        "nome": "Betanzos",
+        "listaPredDiaConcello": [
+            {
+                "dataPredicion": "2026-08-08T00:00:00",
+                "ceoDia": 101,
+                "tMax": 28,
+                "tMin": 17,
+                "pchoiva": {"manha": 5, "tarde": 10, "noite": 20},
+                "uvMax": 6,
+            }
+        ],
+    }
+}
+OBSERVATION = {
+    "listaObservacionConcellos": [
+        {
+            "nomeConcello": "Betanzos",
+            "dataLocal": "2026-08-08T18:17:00",
+            "dataUTC": "2026-08-08T16:17:00",
+            "temperatura": 28.0,
+            "icoEstadoCeo": 101,
+        }
+    ]
+}
+MEASURES = [
+    {
+        "codigoParametro": "TA_AVG_1.5m",
+        "nomeParametro": "Temperatura",
+        "unidade": "ºC",
+        "valor": 20.5,
+        "lnCodigoValidacion": 1,
+    }
+]
+DAILY = {
+    "listDatosDiarios": [
+        {
+            "data": "2026-08-08T00:00:00",
+            "listaEstacions": [{"estacion": "Santiago-EOAS", "listaMedidas": MEASURES}],
+        }
+    ]
+}
+LAST10 = {
+    "listUltimos10min": [
+        {
+            "estacion": "Santiago-EOAS",
+            "instanteLecturaUTC": "2026-08-08T16:10:00",
+            "listaMedidas": MEASURES,
+        }
+    ]
+}
+
+
+def _delayed(monkeypatch, name, payload, delay, calls):
+    async def fetch(_resource_id, _session):
+        calls.append(name)
+        await asyncio.sleep(delay)
+        return payload
+
+    monkeypatch.setattr(coordinator_module, name, fetch)
+
+
+async def _setup(hass, data):
+    entry = MockConfigEntry(domain=const.DOMAIN, unique_id="test", data=data)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_municipality_setup_waits_for_the_slowest_endpoint(
+    hass, enable_custom_integrations, monkeypatch
+):
+    calls = []
+    _delayed(monkeypatch, "_async_get_forecast_data_from_api", FORECAST, FAST, calls)
+    _delayed(
+        monkeypatch, "_async_get_observation_data_from_api", OBSERVATION, SLOW, calls
+    )
+
+    entry = await _setup(hass, {const.CONF_ID_CONCELLO: "15009"})
+
+    setup_seconds = hass.data[const.DOMAIN][entry.entry_id]["setup_seconds"]
+    assert SLOW <= setup_seconds < SLOW + FAST
+    # The sensor and weather platforms share each endpoint's first refresh.
+    assert sorted(calls) == [
+        "_async_get_forecast_data_from_api",
+        "_async_get_observation_data_from_api",
+    ]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_station_setup_waits_for_the_slowest_endpoint(
+    hass, enable_custom_integrations, monkeypatch
+):
+    calls = []
+    _delayed(
+        monkeypatch,
+        "_async_get_observation_dailydata_by_station_from_api",
+        DAILY,
+        SLOW,
+        calls,
+    )
+    _delayed(
+        monkeypatch,
+        "_async_get_observation_last10mindata_by_station_from_api",
+        LAST10,
+        FAST,
+        calls,
+    )
+
+    entry = await _setup(hass, {const.CONF_ID_ESTACION: "10124"})
+
+    setup_seconds = hass.data[const.DOMAIN][entry.entry_id]["setup_seconds"]
+    assert SLOW <= setup_seconds < SLOW + FAST
+    assert len(calls) == 2
+    assert len(hass.data[const.DOMAIN][entry.entry_id]["coordinators"]) == 2
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,100 @@
+"""Tests for serving the last good payload while MeteoGalicia fails."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.coordinator import (
+    MeteoGaliciaStationLast10MinCoordinator,
+    _SharedCoordinator,
+)
+
+PAYLOAD = {"listUltimos10min": [{"instanteLecturaUTC": "2026-08-08T16:10:00"}]}
+
+
+def _clock(monkeypatch, start):
+    now = {"value": start}
+    monkeypatch.setattr(coordinator_module, "_utcnow", lambda: now["value"])
+    return now
+
+
+async def _fail(*_args, **_kwargs):
+    raise TimeoutError("API timeout")
+
+
+async def _fetch(*_args, **_kwargs):
+    return PAYLOAD
+
+
+async def test_failures_keep_the_last_payload_until_the_bound(hass, monkeypatch):
+    now = _clock(monkeypatch, datetime(2026, 8, 8, 16, 11, tzinfo=timezone.utc))
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", _fetch)
+    coordinator = MeteoGaliciaStationLast10MinCoordinator(hass, "10124", 600)
+    coordinator.set_max_stale_age(timedelta(hours=1))
+    await coordinator.async_refresh()
+    notified = []
+    unsubscribe = coordinator.async_add_listener(lambda: notified.append(True))
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", _fail)
+    now["value"] += timedelta(minutes=10)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data is not None
+    assert coordinator.serving_stale is True
+    assert coordinator.last_revalidation_error == "API timeout"
+    assert notified == []
+
+    # Crossing the data_stale threshold notifies once so the markers update.
+    now["value"] += timedelta(minutes=25)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data_is_stale is True
+    assert notified == [True]
+
+    now["value"] += timedelta(minutes=30)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is False
+    assert coordinator.serving_stale is False
+    assert coordinator.stale_updates == 2
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", _fetch)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    unsubscribe()
+    await coordinator.async_close()
+
+
+async def test_failures_are_reported_without_a_bound(hass, monkeypatch):
+    _clock(monkeypatch, datetime(2026, 8, 8, 16, 11, tzinfo=timezone.utc))
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", _fetch)
+    coordinator = MeteoGaliciaStationLast10MinCoordinator(hass, "10124", 600)
+    await coordinator.async_refresh()
+
+    monkeypatch.setattr(coordinator_module, "_async_api_call_with_latency", _fail)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is False
+    assert coordinator.serving_stale is False
+    await coordinator.async_close()
+
+
+def test_shared_coordinator_serves_stale_data_only_if_every_entry_opts_in():
+    class Coordinator:
+        max_stale_age = "unset"
+
+        def set_max_stale_age(self, max_stale_age):
+            self.max_stale_age = max_stale_age
+
+    shared = _SharedCoordinator()
+    shared.coordinator = Coordinator()
+    shared.max_stale_ages = {"entry-1": timedelta(hours=2), "entry-2": None}
+
+    shared.apply_max_stale_age()
+    assert shared.coordinator.max_stale_age is None
+
+    shared.max_stale_ages["entry-2"] = timedelta(hours=1)
+    shared.apply_max_stale_age()
+    assert shared.coordinator.max_stale_age == timedelta(hours=1)
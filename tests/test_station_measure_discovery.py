@@ -0,0 +1,236 @@
+"""Tests for discovering station measures after setup."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.meteogalicia import const
+from custom_components.meteogalicia import coordinator as coordinator_module
+from custom_components.meteogalicia.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.meteogalicia.measures import StationMeasureTracker
+from custom_components.meteogalicia.model import parse_station_last10
+
+NOW = datetime(2026, 8, 8, 16, 20, tzinfo=timezone.utc)
+
+
+def _measure(code, value=20.5):
+    return {
+        "codigoParametro": code,
+        "nomeParametro": code,
+        "unidade": "ºC",
+        "valor": value,
+        "lnCodigoValidacion": 1,
+    }
+
+
+def _last10(*codes):
+    return {
+        "listUltimos10min": [
+            {
+                "estacion": "Santiago-EOAS",
+                "instanteLecturaUTC": "2026-08-08T16:10:00",
+                "listaMedidas": [_measure(code) for code in codes],
+            }
+        ]
+    }
+
+
+def test_tracker_reports_only_new_codes():
+    tracker = StationMeasureTracker(timedelta(hours=1))
+    notified = []
+    tracker.add_listener(notified.append)
+
+    first = parse_station_last10(_last10("TA", "HR"))
+    assert [measure.code for measure in tracker.observe(first, NOW)] == ["HR", "TA"]
+    assert tracker.observe(first, NOW) == []
+    assert tracker.observe(parse_station_last10(_last10("TA", "HR")), NOW) == []
+    new = tracker.observe(parse_station_last10(_last10("TA", "HR", "VV")), NOW)
+
+    assert [measure.code for measure in new] == ["VV"]
+    assert [[measure.code for measure in measures] for measures in notified] == [
+        ["HR", "TA"],
+        ["VV"],
+    ]
+    assert tracker.known_codes == {"TA", "HR", "VV"}
+
+
+def test_tracker_marks_codes_absent_for_long():
+    tracker = StationMeasureTracker(timedelta(hours=1))
+    remove_listener = tracker.add_listener(lambda measures: None)
+    remove_listener()
+    tracker.observe(parse_station_last10(_last10("TA", "HR")), NOW)
+
+    tracker.observe(parse_station_last10(_last10("TA")), NOW)
+    tracker.observe(
+        parse_station_last10(_last10("TA")), NOW + timedelta(minutes=30)
+    )
+    assert tracker.absent_since(NOW + timedelta(minutes=30)) == {}
+    assert tracker.absent_since(NOW + timedelta(hours=1)) == {"HR": NOW}
+
+    # A code that comes back is no longer absent and is offered again.
+    returned = tracker.observe(parse_station_last10(_last10("TA", "HR")), NOW)
+    assert [measure.code for measure in returned] == ["HR"]
+    assert tracker.absent_since(NOW + timedelta(days=1)) == {}
+    assert tracker.observe(parse_station_last10(_last10("HR", "TA")), NOW) == []
+
+
+@pytest.fixture
+def payload(monkeypatch):
+    """Serve a station whose last-10-minutes measures can change."""
+    payload = {"last10": _last10("TA_AVG_1.5m")}
+
+    async def get_daily(_resource_id, _session):
+        return {
+            "listDatosDiarios": [
+                {
+                    "data": "2026-08-08T00:00:00",
+                    "listaEstacions": [
+                        {
+                            "estacion": "Santiago-EOAS",
+                            "listaMedidas": [_measure("TA_AVG_1.5m")],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    async def get_last10(_resource_id, _session):
+        return payload["last10"]
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_dailydata_by_station_from_api",
+        get_daily,
+    )
+    monkeypatch.setattr(
+        coordinator_module,
+        "_async_get_observation_last10mindata_by_station_from_api",
+        get_last10,
+    )
+    monkeypatch.setattr(coordinator_module, "_utcnow", lambda: NOW)
+    return payload
+
+
+async def _setup(hass, data):
+    entry = MockConfigEntry(domain=const.DOMAIN, unique_id="test", data=data)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def _last10_coordinator(hass):
+    registry = hass.data[const.DOMAIN][const.DATA_COORDINATORS]
+    return registry[("station_last10min", "10124")].coordinator
+
+
+@pytest.mark.asyncio
+async def test_new_measure_codes_add_entities_without_reload(
+    hass, enable_custom_integrations, payload
+):
+    entry = await _setup(hass, {const.CONF_ID_ESTACION: "10124"})
+    registry = er.async_get(hass)
+    unique_id = "meteogalicia_station_10124_last_10_min_HR_AVG_1.5m"
+    assert registry.async_get_entity_id("sensor", const.DOMAIN, unique_id) is None
+
+    payload["last10"] = _last10("TA_AVG_1.5m", "HR_AVG_1.5m")
+    await _last10_coordinator(hass).async_refresh()
+    await hass.async_block_till_done()
+
+    entity_id = registry.async_get_entity_id("sensor", const.DOMAIN, unique_id)
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "20.5"
+    station_entities = hass.data[const.DOMAIN][entry.entry_id]["station_entities"]
+    assert unique_id in station_entities
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_measure_removed_while_missing_returns_with_its_code(
+    hass, enable_custom_integrations, payload
+):
+    payload["last10"] = _last10("TA_AVG_1.5m", "HR_AVG_1.5m")
+    entry = await _setup(hass, {const.CONF_ID_ESTACION: "10124"})
+    registry = er.async_get(hass)
+    unique_id = "meteogalicia_station_10124_last_10_min_HR_AVG_1.5m"
+    station_entities = hass.data[const.DOMAIN][entry.entry_id]["station_entities"]
+    assert unique_id in station_entities
+
+    payload["last10"] = _last10("TA_AVG_1.5m")
+    await _last10_coordinator(hass).async_refresh()
+    # A main measure drops the measure entities; going back to every measure
+    # only recreates those in the current payload.
+    for options in (
+        {const.CONF_ID_ESTACION_MEDIDA_LAST10MIN: "TA_AVG_1.5m"},
+        {},
+    ):
+        hass.config_entries.async_update_entry(entry, options=options)
+        await hass.async_block_till_done()
+    assert unique_id not in station_entities
+
+    payload["last10"] = _last10("TA_AVG_1.5m", "HR_AVG_1.5m")
+    await _last10_coordinator(hass).async_refresh()
+    await hass.async_block_till_done()
+
+    assert unique_id in station_entities
+    entity_id = registry.async_get_entity_id("sensor", const.DOMAIN, unique_id)
+    assert hass.states.get(entity_id).state == "20.5"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_entry_with_a_main_measure_does_not_add_measure_entities(
+    hass, enable_custom_integrations, payload
+):
+    entry = await _setup(
+        hass,
+        {
+            const.CONF_ID_ESTACION: "10124",
+            const.CONF_ID_ESTACION_MEDIDA_LAST10MIN: "TA_AVG_1.5m",
+        },
+    )
+    before = set(hass.data[const.DOMAIN][entry.entry_id]["station_entities"])
+
+    payload["last10"] = _last10("TA_AVG_1.5m", "HR_AVG_1.5m")
+    await _last10_coordinator(hass).async_refresh()
+    await hass.async_block_till_done()
+
+    assert set(hass.data[const.DOMAIN][entry.entry_id]["station_entities"]) == before
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_codes_missing_for_long_are_marked_absent(
+    hass, enable_custom_integrations, payload, monkeypatch
+):
+    payload["last10"] = _last10("TA_AVG_1.5m", "HR_AVG_1.5m")
+    entry = await _setup(hass, {const.CONF_ID_ESTACION: "10124"})
+    coordinator = _last10_coordinator(hass)
+
+    payload["last10"] = _last10("TA_AVG_1.5m")
+    await coordinator.async_refresh()
+    assert coordinator.absent_measure_codes == {}
+    monkeypatch.setattr(
+        coordinator_module,
+        "_utcnow",
+        lambda: NOW + timedelta(seconds=const.STATION_MEASURE_ABSENT_AFTER),
+    )
+
+    assert coordinator.absent_measure_codes == {
+        "HR_AVG_1.5m": "2026-08-08T16:20:00+00:00"
+    }
+    result = await async_get_config_entry_diagnostics(hass, entry)
+    (last10,) = [
+        item
+        for item in result["coordinators"]
+        if item["class"] == "MeteoGaliciaStationLast10MinCoordinator"
+    ]
+    assert last10["measure_codes"] == ["HR_AVG_1.5m", "TA_AVG_1.5m"]
+    assert last10["absent_measure_codes"] == {
+        "HR_AVG_1.5m": "2026-08-08T16:20:00+00:00"
+    }
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -13,6 +13,10 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 
+from custom_components.meteogalicia.model import (
+    parse_station_daily,
+    parse_station_last10,
+)
 from custom_components.meteogalicia.sensor import (
     _station_measure_description,
     _station_measure_entities,
@@ -20,7 +24,7 @@ from custom_components.meteogalicia.sensor import (
 )
 
 
-def _measure(code, name, unit, value=1, validation=1):
+def _raw_measure(code, name, unit, value=1, validation=1):
     return {
         "codigoParametro": code,
         "nomeParametro": name,
@@ -30,6 +34,11 @@ def _measure(code, name, unit, value=1, validation=1):
     }
 
 
+def _measure(*args, **kwargs):
+    payload = {"listUltimos10min": [{"listaMedidas": [_raw_measure(*args, **kwargs)]}]}
+    return next(iter(parse_station_last10(payload).measures.values()))
+
+
 def test_measure_descriptions_map_native_home_assistant_metadata():
     cases = [
         ("TA_AVG_1.5m", "ºC", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
@@ -80,13 +89,15 @@ def test_station_measure_entities_are_stable_and_follow_updates():
             {
                 "estacion": "Santiago-EOAS",
                 "listaMedidas": [
-                    _measure("TA_AVG_1.5m", "Temperatura", "ºC", 20.5),
-                    _measure("HR_AVG_1.5m", "Humidade", "%", -9999, 9),
+                    _raw_measure("TA_AVG_1.5m", "Temperatura", "ºC", 20.5),
+                    _raw_measure("HR_AVG_1.5m", "Humidade", "%", -9999, 9),
                 ],
             }
         ]
     }
-    coordinator = SimpleNamespace(data=payload, last_update_success=True)
+    coordinator = SimpleNamespace(
+        model=parse_station_last10(payload), last_update_success=True
+    )
 
     entities = _station_measure_entities("10124", coordinator, "last_10_min")
 
@@ -100,25 +111,26 @@ def test_station_measure_entities_are_stable_and_follow_updates():
     assert entities[1].available is False
 
     payload["listUltimos10min"][0]["listaMedidas"][0]["valor"] = 21.0
+    coordinator.model = parse_station_last10(payload)
     assert entities[0].native_value == 21.0
 
 
 def test_duplicate_measure_codes_create_only_one_entity():
-    duplicate = _measure("TA_AVG_1.5m", "Temperatura", "ºC")
+    duplicate = _raw_measure("TA_AVG_1.5m", "Temperatura", "ºC")
+    payload = {
+        "listDatosDiarios": [
+            {
+                "listaEstacions": [
+                    {
+                        "estacion": "Santiago-EOAS",
+                        "listaMedidas": [duplicate, duplicate],
+                    }
+                ]
+            }
+        ]
+    }
     coordinator = SimpleNamespace(
-        data={
-            "listDatosDiarios": [
-                {
-                    "listaEstacions": [
-                        {
-                            "estacion": "Santiago-EOAS",
-                            "listaMedidas": [duplicate, duplicate],
-                        }
-                    ]
-                }
-            ]
-        },
-        last_update_success=True,
+        model=parse_station_daily(payload), last_update_success=True
     )
 
     assert len(_station_measure_entities("10124", coordinator, "daily")) == 1
@@ -135,7 +147,7 @@ async def test_station_setup_keeps_legacy_summaries_and_adds_measure_entities(
                     {
                         "estacion": "Santiago-EOAS",
                         "listaMedidas": [
-                            _measure("TA_AVG_1.5m", "Temperatura", "ºC", 20.5)
+                            _raw_measure("TA_AVG_1.5m", "Temperatura", "ºC", 20.5)
                         ],
                     }
                 ]
@@ -146,13 +158,14 @@ async def test_station_setup_keeps_legacy_summaries_and_adds_measure_entities(
         "listUltimos10min": [
             {
                 "estacion": "Santiago-EOAS",
-                "listaMedidas": [_measure("HR_AVG_1.5m", "Humidade", "%", 70)],
+                "listaMedidas": [_raw_measure("HR_AVG_1.5m", "Humidade", "%", 70)],
             }
         ]
     }
 
     class FakeCoordinator:
         payload = None
+        parser = None
 
         def __init__(self, _hass, _station_id, _scan_interval):
             self.data = self.payload
@@ -164,14 +177,20 @@ async def test_station_setup_keeps_legacy_summaries_and_adds_measure_entities(
         async def async_refresh(self):
             return None
 
+        @property
+        def model(self):
+            return self.parser(self.data)
+
         def async_set_updated_data(self, data):
             self.data = data
 
     class DailyCoordinator(FakeCoordinator):
         payload = daily_payload
+        parser = staticmethod(parse_station_daily)
 
     class Last10Coordinator(FakeCoordinator):
         payload = last_10_payload
+        parser = staticmethod(parse_station_last10)
 
     from custom_components.meteogalicia import sensor
 
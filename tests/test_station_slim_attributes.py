@@ -0,0 +1,85 @@
+"""Tests for the slim attribute mode of the legacy station sensors."""
+
+from types import SimpleNamespace
+
+from custom_components.meteogalicia.model import parse_station_last10
+from custom_components.meteogalicia.sensor import (
+    MeteoGaliciaLast10MinDataByStationSensor,
+)
+
+
+def _reading(*codes):
+    return parse_station_last10(
+        {
+            "listUltimos10min": [
+                {
+                    "estacion": "Santiago-EOAS",
+                    "idEstacion": 10124,
+                    "instanteLecturaUTC": "2026-08-08T16:10:00",
+                    "listaMedidas": [
+                        {
+                            "codigoParametro": code,
+                            "nomeParametro": code,
+                            "unidade": "ºC",
+                            "valor": 20.5,
+                            "lnCodigoValidacion": 1,
+                        }
+                        for code in codes
+                    ],
+                }
+            ]
+        }
+    )
+
+
+def _sensor(id_measure, slim):
+    coordinator = SimpleNamespace(last_update_success=True)
+    return MeteoGaliciaLast10MinDataByStationSensor(
+        "10124", "10124", id_measure, coordinator, slim
+    )
+
+
+def _measure_attributes(sensor):
+    return sorted(key for key in sensor._attr if key.endswith(("_value", "_unit")))
+
+
+def test_full_mode_copies_every_measure():
+    sensor = _sensor("TA_AVG_1.5m", slim=False)
+
+    sensor._update_from_model(_reading("TA_AVG_1.5m", "HR_AVG_1.5m"))
+
+    assert _measure_attributes(sensor) == [
+        "HR_AVG_1.5m_unit",
+        "HR_AVG_1.5m_value",
+        "TA_AVG_1.5m_unit",
+        "TA_AVG_1.5m_value",
+    ]
+
+
+def test_slim_mode_keeps_only_the_main_measure():
+    sensor = _sensor("TA_AVG_1.5m", slim=True)
+
+    sensor._update_from_model(_reading("TA_AVG_1.5m", "HR_AVG_1.5m", "PP_SUM_1.5m"))
+
+    assert sensor.native_value == 20.5
+    assert sensor.native_unit_of_measurement == "ºC"
+    assert _measure_attributes(sensor) == ["TA_AVG_1.5m_unit", "TA_AVG_1.5m_value"]
+    assert sensor._attr["estacion"] == "Santiago-EOAS"
+
+
+def test_slim_summary_sensor_has_no_measure_attributes():
+    sensor = _sensor(None, slim=True)
+
+    sensor._update_from_model(_reading("TA_AVG_1.5m", "HR_AVG_1.5m"))
+
+    assert sensor.native_value == "Available"
+    assert _measure_attributes(sensor) == []
+
+
+def test_attributes_are_rebuilt_on_each_update():
+    sensor = _sensor(None, slim=False)
+    sensor._update_from_model(_reading("TA_AVG_1.5m", "HR_AVG_1.5m"))
+
+    sensor._update_from_model(_reading("TA_AVG_1.5m"))
+
+    assert _measure_attributes(sensor) == ["TA_AVG_1.5m_unit", "TA_AVG_1.5m_value"]
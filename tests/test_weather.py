@@ -4,10 +4,10 @@ from types import SimpleNamespace
 
 import pytest
 
+from custom_components.meteogalicia.model import parse_forecast, parse_observation
 from custom_components.meteogalicia.weather import (
     MeteoGaliciaWeather,
     _condition_from_code,
-    _forecast_days,
     _maximum_probability,
     _valid_value,
     _weather_unique_id,
@@ -23,23 +23,25 @@ def test_condition_codes_are_mapped_and_unavailable_is_ignored():
 
 
 def test_forecast_helpers_handle_valid_and_missing_data():
-    day = {
-        "pchoiva": {"manha": 10, "tarde": 60, "noite": -9999},
-    }
-    payload = {"predConcello": {"listaPredDiaConcello": [day]}}
-
-    assert _forecast_days(payload) == [day]
-    assert _forecast_days({}) == []
-    assert _maximum_probability(day) == 60
-    assert _maximum_probability({"pchoiva": {"manha": -9999}}) is None
+    def day(item):
+        payload = {"predConcello": {"listaPredDiaConcello": [item]}}
+        return parse_forecast(payload).days[0]
+
+    assert _maximum_probability(
+        day({"pchoiva": {"manha": 10, "tarde": 60, "noite": -9999}})
+    ) == 60
+    assert _maximum_probability(day({"pchoiva": {"manha": -9999}})) is None
+    assert _maximum_probability(day({})) is None
     assert _valid_value(-9999) is None
     assert _valid_value(18) == 18
 
 
 def _weather_without_init(observation_data=None, forecast_data=None):
     entity = object.__new__(MeteoGaliciaWeather)
-    entity._observation_coordinator = SimpleNamespace(data=observation_data)
-    entity.coordinator = SimpleNamespace(data=forecast_data)
+    entity._observation_coordinator = SimpleNamespace(
+        model=parse_observation(observation_data)
+    )
+    entity.coordinator = SimpleNamespace(model=parse_forecast(forecast_data))
     return entity
 
 
@@ -72,7 +74,7 @@ def test_apparent_temperature_and_condition_use_observed_values():
 def test_weather_exposes_real_observation_freshness():
     entity = _weather_without_init()
     entity._observation_coordinator = SimpleNamespace(
-        data=None,
+        model=None,
         data_timestamp="2026-08-08T16:17:00+00:00",
         data_age_seconds=180.0,
         data_is_stale=False,
@@ -150,6 +152,74 @@ async def test_daily_forecast_handles_empty_response():
     assert await _weather_without_init(forecast_data={}).async_forecast_daily() is None
 
 
+@pytest.mark.asyncio
+async def test_twice_daily_forecast_uses_the_periods_of_each_day():
+    entity = _weather_without_init(
+        forecast_data={
+            "predConcello": {
+                "listaPredDiaConcello": [
+                    {
+                        "dataPredicion": "2026-08-08T00:00:00",
+                        "ceoDia": 103,
+                        "ceo": {"manha": 101, "tarde": 111, "noite": 201},
+                        "tMax": 24,
+                        "tMin": 15,
+                        "pchoiva": {"manha": 10, "tarde": 30, "noite": 60},
+                        "uvMax": 7,
+                    }
+                ]
+            }
+        }
+    )
+
+    assert await entity.async_forecast_twice_daily() == [
+        {
+            "datetime": "2026-08-08T07:00:00",
+            "is_daytime": True,
+            "condition": "rainy",
+            "native_temperature": 24,
+            "precipitation_probability": 30,
+            "uv_index": 7,
+        },
+        {
+            "datetime": "2026-08-08T21:00:00",
+            "is_daytime": False,
+            "condition": "clear-night",
+            "native_temperature": 15,
+            "precipitation_probability": 60,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_twice_daily_forecast_falls_back_to_the_day_sky():
+    entity = _weather_without_init(
+        forecast_data={
+            "predConcello": {
+                "listaPredDiaConcello": [
+                    {
+                        "dataPredicion": "2026-08-08T00:00:00",
+                        "ceoDia": 104,
+                        "ceo": {"manha": -9999, "tarde": -9999, "noite": -9999},
+                        "tMax": 24,
+                        "tMin": -9999,
+                    },
+                    {"dataPredicion": "invalid", "ceoDia": 101},
+                ]
+            }
+        }
+    )
+
+    daytime, night = await entity.async_forecast_twice_daily()
+
+    assert daytime["condition"] == night["condition"] == "cloudy"
+    assert daytime["precipitation_probability"] is None
+    assert night["native_temperature"] is None
+    assert await _weather_without_init(
+        forecast_data={}
+    ).async_forecast_twice_daily() is None
+
+
 def test_weather_unique_id_is_new_and_stable():
     assert _weather_unique_id("15009") == "meteogalicia_weather_15009"
     assert _weather_unique_id("15009") != "meteogalicia_betanzos_temperature_15009"
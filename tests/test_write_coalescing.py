@@ -0,0 +1,74 @@
+"""Tests for merging several coordinator notifications into one state write."""
+
+import logging
+from datetime import timedelta
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.meteogalicia.entity import MeteoGaliciaMultiCoordinatorEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Entity(MeteoGaliciaMultiCoordinatorEntity):
+    def __init__(self, *coordinators):
+        super().__init__(*coordinators)
+        self.writes = 0
+
+    def async_write_ha_state(self):
+        self.writes += 1
+
+
+def _coordinator(hass, name):
+    return DataUpdateCoordinator(hass, _LOGGER, config_entry=None, name=name)
+
+
+async def _added(hass, entity):
+    entity.hass = hass
+    entity.entity_id = "weather.test"
+    await entity.async_added_to_hass()
+    return entity
+
+
+def _advance(hass, seconds):
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+
+
+async def test_notifications_within_the_window_write_once(hass):
+    forecast = _coordinator(hass, "forecast")
+    observation = _coordinator(hass, "observation")
+    entity = await _added(hass, _Entity(forecast, observation))
+
+    forecast.async_set_updated_data({"forecast": 1})
+    observation.async_set_updated_data({"observation": 1})
+    assert entity.writes == 0
+
+    _advance(hass, entity.coalesce_window + 0.1)
+    await hass.async_block_till_done()
+
+    assert entity.writes == 1
+    assert entity.coalesced_writes == 1
+
+    observation.async_set_updated_data({"observation": 2})
+    _advance(hass, 2 * entity.coalesce_window + 0.2)
+    await hass.async_block_till_done()
+
+    assert entity.writes == 2
+    assert entity.coalesced_writes == 1
+    entity._call_on_remove_callbacks()
+
+
+async def test_removal_cancels_the_pending_write(hass):
+    forecast = _coordinator(hass, "forecast")
+    observation = _coordinator(hass, "observation")
+    entity = await _added(hass, _Entity(forecast, observation))
+
+    observation.async_set_updated_data({"observation": 1})
+    entity._call_on_remove_callbacks()
+    _advance(hass, entity.coalesce_window + 0.1)
+    await hass.async_block_till_done()
+
+    assert entity.writes == 0
+    assert not observation._listeners